@@ -0,0 +1,118 @@
+import json
+from fastapi import APIRouter, Depends, Request, Query
+from starlette.concurrency import run_in_threadpool
+
+from app.core.models import SUPPORTED_LANGUAGES, JobSubmitRequest, JobResponse, JobResultsResponse
+from app.config import get_settings
+from app.services.job_manager import JobManager, get_job_manager
+from app.api.routes.translation import _iter_lines
+from app.core.exceptions import TranslationServiceException, ValidationException, create_http_exception
+
+router = APIRouter(prefix="/api/v1", tags=["Jobs"])
+settings = get_settings()
+
+async def _upload_texts(http_request: Request, text_field: str):
+    """Yield texts from a JSONL body of strings or objects holding ``text_field``"""
+    line_number = 0
+    async for line in _iter_lines(http_request.stream(), settings.STREAM_MAX_LINE_BYTES):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            text = item if isinstance(item, str) else item[text_field]
+        except Exception:
+            raise ValidationException(f"Line {line_number} is not a JSON string or an object with '{text_field}'",
+                                      "INVALID_ITEM")
+        if not isinstance(text, str) or not text.strip():
+            raise ValidationException(f"Line {line_number} has no text", "INVALID_ITEM")
+        if len(text) > 1000:
+            raise ValidationException(f"Line {line_number} exceeds maximum length of 1000 characters", "INVALID_ITEM")
+        yield text.strip()
+
+def _not_found(job_id: str):
+    return create_http_exception(404, f"Job not found: {job_id}", "JOB_NOT_FOUND")
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(
+    request: JobSubmitRequest,
+    job_manager: JobManager = Depends(get_job_manager)
+):
+    """
+    Queue a list of texts for background translation
+
+    Returns immediately with the job id; poll `GET /jobs/{job_id}` for
+    progress and fetch translations from `GET /jobs/{job_id}/results`.
+    """
+    try:
+        return await job_manager.submit(request.texts, request.target_language)
+    except ValidationException as e:
+        raise create_http_exception(400, e.message, e.error_code)
+    except TranslationServiceException as e:
+        raise create_http_exception(500, e.message, e.error_code)
+
+@router.post("/jobs/upload", response_model=JobResponse, status_code=202)
+async def upload_job(
+    http_request: Request,
+    target_language: str = Query(..., description="Target language ISO code"),
+    text_field: str = Query(default="text", description="Field holding the text in object lines"),
+    job_manager: JobManager = Depends(get_job_manager)
+):
+    """
+    Queue a JSONL file for background translation
+
+    The request body is read as a stream, one item per line: either a JSON
+    string or an object with the text under `text_field`. Items are stored
+    as they arrive, so uploads of any size use constant memory.
+    """
+    target_language = target_language.lower()
+    if target_language not in SUPPORTED_LANGUAGES:
+        raise create_http_exception(400, f"Unsupported language code: {target_language}", "VALIDATION_ERROR")
+
+    try:
+        return await job_manager.submit_stream(_upload_texts(http_request, text_field), target_language)
+    except ValidationException as e:
+        raise create_http_exception(400, e.message, e.error_code)
+    except TranslationServiceException as e:
+        raise create_http_exception(500, e.message, e.error_code)
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, job_manager: JobManager = Depends(get_job_manager)):
+    """Get a job's status and progress"""
+    job = await run_in_threadpool(job_manager.get_job, job_id)
+    if job is None:
+        raise _not_found(job_id)
+    return job
+
+@router.get("/jobs/{job_id}/results", response_model=JobResultsResponse)
+async def get_job_results(
+    job_id: str,
+    after: int = Query(default=-1, ge=-1, description="Return items after this position"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Number of items to return"),
+    job_manager: JobManager = Depends(get_job_manager)
+):
+    """
+    Page through a job's items in submission order
+
+    Items still waiting to be translated have status `pending`. Pass the
+    returned `next_after` as `after` to fetch the next page.
+    """
+    job = await run_in_threadpool(job_manager.get_job, job_id)
+    if job is None:
+        raise _not_found(job_id)
+
+    results = await run_in_threadpool(job_manager.get_results, job_id, after, limit)
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "results": results,
+        "next_after": results[-1]["position"] if len(results) == limit else None
+    }
+
+@router.delete("/jobs/{job_id}", response_model=JobResponse)
+async def cancel_job(job_id: str, job_manager: JobManager = Depends(get_job_manager)):
+    """Cancel a pending or running job; items already translated are kept"""
+    job = await run_in_threadpool(job_manager.cancel, job_id)
+    if job is None:
+        raise _not_found(job_id)
+    return job
@@ -1,57 +1,84 @@
+import asyncio
+import csv
+import io
+import json
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
 from datetime import datetime
 
 from app.core.models import (
     TranslationRequest, 
     BulkTranslationRequest,
+    DocumentTranslationRequest,
     TranslationResponse,
     BulkTranslationResponse,
+    DocumentTranslationResponse,
     ErrorResponse
 )
-from app.database import get_db, TranslationLog
-from app.services.translation_service import TranslationService
+from app.config import get_settings
+from app.database import get_db, SessionLocal, TranslationLog
+from app.services.translation_service import TranslationService, get_translation_service
 from app.services.logging_service import LoggingService
+from app.services.log_writer import LogWriter, get_log_writer
+from app.services.retention import archive_tables_for_range
 from app.utils.helpers import get_client_ip, get_user_agent
-from app.core.exceptions import TranslationServiceException, create_http_exception
+from app.utils.serialization import FastJSONResponse, dumps, project
+from app.services.timing import mark, span
+from app.core.exceptions import TranslationServiceException, ValidationException, create_http_exception
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/api/v1", tags=["Translation"])
+settings = get_settings()
+
+EXPORT_COLUMNS = [
+    "id", "translation_id", "original_text", "translated_text", "source_language",
+    "target_language", "created_at", "user_agent", "ip_address"
+]
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+EXPORT_CHUNK_ROWS = 500
 
 @router.post("/translate", response_model=TranslationResponse)
 async def translate_text(
     request: TranslationRequest,
     http_request: Request,
-    db: Session = Depends(get_db)
+    translation_service: TranslationService = Depends(get_translation_service),
+    log_writer: LogWriter = Depends(get_log_writer)
 ):
     """
     Translate a single text
     
     - **text**: Text to translate (max 1000 characters)
     - **target_language**: Target language code (e.g., 'hi', 'ta', 'kn')
+    - **bypass_cache**: Skip the translation result cache (default: false)
     """
+    mark("parse")
     try:
-        # Initialize services
-        translation_service = TranslationService()
-        logging_service = LoggingService(db)
-        
         # Perform translation
         result = await translation_service.translate_text(
             text=request.text,
-            target_language=request.target_language
+            target_language=request.target_language,
+            use_cache=not request.bypass_cache
         )
         
-        # Log the translation
+        # Queue the translation log; it is written in the background
         user_agent = get_user_agent(http_request)
         ip_address = get_client_ip(http_request)
         
-        logging_service.log_translation(
-            translation_data=result,
-            user_agent=user_agent,
-            ip_address=ip_address
-        )
+        with span("log"):
+            await log_writer.submit(
+                LoggingService.build_log_record(result, user_agent, ip_address)
+            )
         
-        return TranslationResponse(**result)
+        return FastJSONResponse(project(TranslationResponse, result))
         
     except TranslationServiceException as e:
         raise create_http_exception(500, e.message, e.error_code)
@@ -62,59 +89,336 @@ async def translate_text(
 async def translate_bulk_text(
     request: BulkTranslationRequest,
     http_request: Request,
-    db: Session = Depends(get_db)
+    translation_service: TranslationService = Depends(get_translation_service),
+    log_writer: LogWriter = Depends(get_log_writer)
 ):
     """
     Translate multiple texts in bulk
     
     - **texts**: Array of texts to translate (max 10 items, each max 1000 characters)
     - **target_language**: Target language code (e.g., 'hi', 'ta', 'kn')
+    - **bypass_cache**: Skip the translation result cache (default: false)
     """
+    mark("parse")
     try:
-        # Initialize services
-        translation_service = TranslationService()
-        logging_service = LoggingService(db)
-        
         # Perform bulk translation
         result = await translation_service.translate_bulk(
             texts=request.texts,
-            target_language=request.target_language
+            target_language=request.target_language,
+            use_cache=not request.bypass_cache
         )
         
-        # Log the translations
+        # Queue the translation logs; only successful translations are logged
         user_agent = get_user_agent(http_request)
         ip_address = get_client_ip(http_request)
         
-        logging_service.log_bulk_translations(
-            translations=result['translations'],
-            user_agent=user_agent,
-            ip_address=ip_address
+        with span("log"):
+            await log_writer.submit_many([
+                LoggingService.build_log_record(translation, user_agent, ip_address)
+                for translation in result['translations']
+                if translation.get('success', True)
+            ])
+        
+        return FastJSONResponse({
+            **project(BulkTranslationResponse, result),
+            'translations': [project(TranslationResponse, translation) for translation in result['translations']]
+        })
+        
+    except TranslationServiceException as e:
+        raise create_http_exception(500, e.message, e.error_code)
+    except Exception as e:
+        raise create_http_exception(500, f"Internal server error: {str(e)}", "INTERNAL_ERROR")
+
+@router.post("/translate/document", response_model=DocumentTranslationResponse)
+async def translate_document(
+    request: DocumentTranslationRequest,
+    http_request: Request,
+    translation_service: TranslationService = Depends(get_translation_service),
+    log_writer: LogWriter = Depends(get_log_writer)
+):
+    """
+    Translate a long document
+    
+    The document is split into sentences that are translated concurrently;
+    whitespace, line breaks and markup tags are kept as they are.
+    
+    - **text**: Document to translate (max 100000 characters)
+    - **target_language**: Target language code (e.g., 'hi', 'ta', 'kn')
+    - **bypass_cache**: Skip the translation result cache (default: false)
+    """
+    mark("parse")
+    try:
+        result = await translation_service.translate_document(
+            text=request.text,
+            target_language=request.target_language,
+            use_cache=not request.bypass_cache
         )
         
-        return BulkTranslationResponse(**result)
+        # The document is logged as one translation
+        user_agent = get_user_agent(http_request)
+        ip_address = get_client_ip(http_request)
+        
+        with span("log"):
+            await log_writer.submit(
+                LoggingService.build_log_record(result, user_agent, ip_address)
+            )
+        
+        return FastJSONResponse(project(DocumentTranslationResponse, result))
         
     except TranslationServiceException as e:
         raise create_http_exception(500, e.message, e.error_code)
     except Exception as e:
         raise create_http_exception(500, f"Internal server error: {str(e)}", "INTERNAL_ERROR")
 
+async def _iter_lines(stream, max_line_bytes: int):
+    """Split a byte stream into lines without buffering more than one line"""
+    buffer = b""
+    async for chunk in stream:
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            yield line
+        if len(buffer) > max_line_bytes:
+            raise ValidationException(f"NDJSON line exceeds {max_line_bytes} bytes", "LINE_TOO_LONG")
+    if buffer:
+        yield buffer
+
+async def _wait_for_disconnect(http_request: Request):
+    while (await http_request.receive())["type"] != "http.disconnect":
+        pass
+
+class BodyStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse for handlers that keep reading the request body while
+    responding.
+    
+    The stock response listens for disconnects with a competing ``receive()``
+    on older ASGI servers, which would swallow body chunks; here the handler
+    watches for the disconnect itself.
+    """
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+
+async def _stream_translations(http_request: Request, translation_service: TranslationService,
+                               log_writer: LogWriter, target_language: Optional[str], use_cache: bool):
+    """
+    Translate NDJSON items from the request body and yield NDJSON results as
+    they complete
+    
+    At most ``STREAM_TRANSLATION_CONCURRENCY`` items are in flight (including
+    finished ones waiting to be sent), so the body is only read as fast as
+    results are consumed. Closing the generator cancels outstanding work.
+    """
+    concurrency = settings.STREAM_TRANSLATION_CONCURRENCY
+    slots = asyncio.Semaphore(concurrency)
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    pending = set()
+    done = object()
+    user_agent = get_user_agent(http_request)
+    ip_address = get_client_ip(http_request)
+    
+    async def translate_item(index: int, line: bytes):
+        try:
+            try:
+                item = json.loads(line)
+                if target_language and isinstance(item, dict):
+                    item.setdefault("target_language", target_language)
+                request = TranslationRequest(**item)
+            except Exception as e:
+                output = {"index": index, "success": False, "error": f"Invalid item: {str(e)}",
+                          "error_code": "INVALID_ITEM"}
+            else:
+                try:
+                    result = await translation_service.translate_text(
+                        text=request.text,
+                        target_language=request.target_language,
+                        use_cache=use_cache and not request.bypass_cache
+                    )
+                    await log_writer.submit(LoggingService.build_log_record(result, user_agent, ip_address))
+                    output = {"index": index, **result}
+                except TranslationServiceException as e:
+                    output = {"index": index, "success": False, "error": e.message, "error_code": e.error_code}
+                except Exception as e:
+                    # One failed item must not end the stream for the rest
+                    output = {"index": index, "success": False, "error": f"Internal server error: {str(e)}",
+                              "error_code": "INTERNAL_ERROR"}
+            await results.put(output)
+        finally:
+            slots.release()
+    
+    async def produce():
+        index = 0
+        try:
+            async for line in _iter_lines(http_request.stream(), settings.STREAM_MAX_LINE_BYTES):
+                if not line.strip():
+                    continue
+                await slots.acquire()
+                task = asyncio.create_task(translate_item(index, line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                index += 1
+            
+            # The body is consumed; from here the only message left is a disconnect
+            if pending:
+                disconnect = asyncio.create_task(_wait_for_disconnect(http_request))
+                finished = asyncio.ensure_future(asyncio.gather(*pending))
+                await asyncio.wait([finished, disconnect], return_when=asyncio.FIRST_COMPLETED)
+                if disconnect.done():
+                    finished.cancel()
+                else:
+                    disconnect.cancel()
+        except ClientDisconnect:
+            pass
+        except TranslationServiceException as e:
+            await results.put({"success": False, "error": e.message, "error_code": e.error_code})
+        finally:
+            await results.put(done)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            output = await results.get()
+            if output is done:
+                break
+            yield dumps(output) + b"\n"
+    finally:
+        producer.cancel()
+        for task in list(pending):
+            task.cancel()
+
+@router.post("/translate/stream")
+async def translate_stream(
+    http_request: Request,
+    target_language: Optional[str] = Query(default=None, description="Default target language for items without one"),
+    bypass_cache: bool = Query(default=False, description="Skip the translation result cache"),
+    translation_service: TranslationService = Depends(get_translation_service),
+    log_writer: LogWriter = Depends(get_log_writer)
+):
+    """
+    Translate an NDJSON stream of any length
+    
+    Each request line is a JSON object shaped like a single translate request,
+    e.g. `{"text": "hello", "target_language": "hi"}`. Each response line is
+    a translation result with the `index` of its request line, sent as soon as
+    it is ready, so results may arrive out of order.
+    
+    - **target_language**: Used for lines that do not set one
+    - **bypass_cache**: Skip the translation result cache (default: false)
+    """
+    return BodyStreamingResponse(
+        _stream_translations(http_request, translation_service, log_writer, target_language, not bypass_cache),
+        media_type="application/x-ndjson"
+    )
+
+@router.get("/translate/cache")
+async def get_cache_stats(
+    translation_service: TranslationService = Depends(get_translation_service)
+):
+    """
+    Translation result cache statistics
+    
+    Returns size, hit/miss/eviction counters and hit rate, plus how many
+    requests were coalesced onto an identical in-flight provider call.
+    """
+    return {
+        "success": True,
+        "cache": translation_service.cache_stats(),
+        "coalescing": translation_service.coalescing_stats(),
+        "timestamp": datetime.utcnow()
+    }
+
+@router.get("/translate/memory")
+async def get_memory_stats(
+    translation_service: TranslationService = Depends(get_translation_service)
+):
+    """
+    Translation memory statistics
+    
+    Returns the number of stored texts, exact and fuzzy match counts, match
+    rate and lookup latency.
+    """
+    return {
+        "success": True,
+        "memory": translation_service.memory_stats(),
+        "timestamp": datetime.utcnow()
+    }
+
+@router.get("/translate/provider")
+async def get_provider_stats(
+    translation_service: TranslationService = Depends(get_translation_service)
+):
+    """
+    Translation provider statistics
+    
+    With micro-batching enabled, returns batch sizes, queueing delay added
+    by the batch window and upstream call latency.
+    """
+    return {
+        "success": True,
+        "provider": translation_service.provider.stats(),
+        "timestamp": datetime.utcnow()
+    }
+
+@router.get("/translate/logs/writer")
+async def get_log_writer_stats(log_writer: LogWriter = Depends(get_log_writer)):
+    """
+    Background log writer statistics
+    
+    Returns queue depth, written/dropped counters and flush latency.
+    """
+    return {
+        "success": True,
+        "writer": log_writer.stats(),
+        "timestamp": datetime.utcnow()
+    }
+
 @router.get("/translate/logs")
 async def get_translation_logs(
     limit: int = Query(default=50, ge=1, le=100, description="Number of logs to retrieve (1-100)"),
-    offset: int = Query(default=0, ge=0, description="Number of logs to skip"),
-    db: Session = Depends(get_db)
+    offset: int = Query(default=0, ge=0, description="Number of logs to skip (ignored with cursor)"),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous next_cursor"),
+    target_language: Optional[str] = Query(default=None, description="Filter by target language code"),
+    source_language: Optional[str] = Query(default=None, description="Filter by source language code"),
+    start_time: Optional[datetime] = Query(default=None, description="Only logs created at or after this time"),
+    end_time: Optional[datetime] = Query(default=None, description="Only logs created before this time"),
+    include_archived: bool = Query(default=False, description="Also search archived logs"),
+    db: Union[Session, "AsyncSession"] = Depends(get_db)
 ):
     """
     Retrieve translation logs with pagination
     
+    Logs are written in the background, so the newest entries may appear
+    after a short delay.
+    
     - **limit**: Number of logs to retrieve (default: 50, max: 100)
     - **offset**: Number of logs to skip (default: 0)
+    - **cursor**: Continue after a previous page; pass its `next_cursor`
+    - **target_language** / **source_language**: Language filters
+    - **start_time** / **end_time**: Creation time range
+    - **include_archived**: Also search archive tables overlapping the time range
     """
+    mark("parse")
     try:
+        archive_tables = None
+        if include_archived:
+            archive_tables = await run_in_threadpool(archive_tables_for_range, start_time, end_time)
+        
         logging_service = LoggingService(db)
-        logs = logging_service.get_translation_logs(limit=limit, offset=offset)
+        logs = await logging_service.fetch_translation_logs(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            target_language=target_language.lower() if target_language else None,
+            source_language=source_language.lower() if source_language else None,
+            start_time=start_time,
+            end_time=end_time,
+            archive_tables=archive_tables
+        )
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "logs": [
                 {
@@ -133,8 +437,71 @@ async def get_translation_logs(
             "total_returned": len(logs),
             "limit": limit,
             "offset": offset,
+            "next_cursor": LoggingService.encode_cursor(logs[-1]) if len(logs) == limit else None,
             "timestamp": datetime.utcnow()
-        }
+        })
         
+    except ValidationException as e:
+        raise create_http_exception(400, e.message, e.error_code)
     except Exception as e:
-        raise create_http_exception(500, f"Failed to retrieve logs: {str(e)}", "LOG_RETRIEVAL_ERROR")
\ No newline at end of file
+        raise create_http_exception(500, f"Failed to retrieve logs: {str(e)}", "LOG_RETRIEVAL_ERROR")
+
+
+def _export_chunks(export_format: str, filters: dict):
+    """Yield encoded export chunks of ``EXPORT_CHUNK_ROWS`` rows"""
+    db = SessionLocal()
+    try:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if export_format == "csv" else None
+        if writer:
+            writer.writerow(EXPORT_COLUMNS)
+        
+        rows = 0
+        for log in LoggingService(db).iter_translation_logs(**filters):
+            log["created_at"] = log["created_at"].isoformat() if log["created_at"] else None
+            if writer:
+                writer.writerow([log[column] for column in EXPORT_COLUMNS])
+            else:
+                buffer.write(json.dumps(log, ensure_ascii=False))
+                buffer.write("\n")
+            
+            rows += 1
+            if rows % EXPORT_CHUNK_ROWS == 0:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+    finally:
+        db.close()
+
+@router.get("/translate/logs/export")
+async def export_translation_logs(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$", description="Export format: ndjson or csv"),
+    target_language: Optional[str] = Query(default=None, description="Filter by target language code"),
+    source_language: Optional[str] = Query(default=None, description="Filter by source language code"),
+    start_time: Optional[datetime] = Query(default=None, description="Only logs created at or after this time"),
+    end_time: Optional[datetime] = Query(default=None, description="Only logs created before this time")
+):
+    """
+    Stream every matching translation log, oldest first
+    
+    Rows are read through a server-side cursor and written out as they are
+    read, so exports of any size use constant memory.
+    
+    - **format**: `ndjson` (default) or `csv`
+    - **target_language** / **source_language**: Language filters
+    - **start_time** / **end_time**: Creation time range
+    """
+    filters = {
+        "target_language": target_language.lower() if target_language else None,
+        "source_language": source_language.lower() if source_language else None,
+        "start_time": start_time,
+        "end_time": end_time
+    }
+    return StreamingResponse(
+        _export_chunks(format, filters),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=translation_logs.{format}"}
+    )
@@ -12,8 +12,52 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     
+    # Prometheus metrics at /metrics
+    METRICS_ENABLED: bool = True
+    
+    # Per-request stage timings in a Server-Timing header on /api/v1 routes
+    SERVER_TIMING_ENABLED: bool = True
+    
+    # Request profiling (off unless a sample rate or slow threshold is set)
+    PROFILE_SAMPLE_RATE: int = 0  # profile 1 in N requests
+    PROFILE_SLOW_REQUEST_MS: float = 0.0  # also keep profiles of requests slower than this
+    PROFILE_DIR: str = "./profiles"
+    
+    # Admission control on the translate, bulk, document and stream routes (0 disables a limit)
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_CONCURRENCY: int = 128
+    ADMISSION_QUEUE_SIZE: int = 256
+    ADMISSION_QUEUE_TIMEOUT_MS: float = 1000.0
+    ADMISSION_PER_CLIENT_LIMIT: int = 64
+    ADMISSION_RETRY_AFTER_SECONDS: float = 1.0
+    ADMISSION_TRUSTED_PROXIES: str = ""  # comma-separated proxy IPs/CIDRs whose X-Forwarded-For is honoured
+    
     # Database settings
     DATABASE_URL: str = "sqlite:///./translation_logs.db"
+    DATABASE_ASYNC: bool = False  # aiosqlite / asyncpg for request-path queries
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 30.0
+    
+    # SQLite tuning
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    
+    # Write-behind translation logging
+    LOG_QUEUE_MAX_SIZE: int = 10000
+    LOG_BATCH_SIZE: int = 500
+    LOG_FLUSH_INTERVAL_SECONDS: float = 0.5
+    LOG_QUEUE_FULL_POLICY: str = "block"  # "block", "drop_new" or "drop_oldest"
+    LOG_FLUSH_MAX_RETRIES: int = 3
+    LOG_FLUSH_RETRY_DELAY_SECONDS: float = 0.5  # doubled after each failed attempt
+    
+    # Translation log retention and archival
+    LOG_RETENTION_ENABLED: bool = False
+    LOG_RETENTION_DAYS: int = 30
+    LOG_ARCHIVE_GRANULARITY: str = "month"  # "day" or "month"
+    LOG_ARCHIVE_BATCH_SIZE: int = 10000
+    LOG_RETENTION_INTERVAL_SECONDS: float = 3600
     
     # Google Translate settings
     GOOGLE_TRANSLATE_API_KEY: Optional[str] = None
@@ -21,6 +65,86 @@ class Settings(BaseSettings):
     # Mock mode (when no API key is available)
     USE_MOCK_TRANSLATION: bool = True
     
+    # Translation provider: "mock", "googletrans" or "http"
+    # (defaults to mock/googletrans according to USE_MOCK_TRANSLATION)
+    TRANSLATION_PROVIDER: Optional[str] = None
+    PROVIDER_THREAD_POOL_SIZE: int = 8
+    
+    # Generic HTTP provider settings
+    TRANSLATION_HTTP_URL: Optional[str] = None
+    TRANSLATION_HTTP_API_KEY: Optional[str] = None
+    TRANSLATION_HTTP_TIMEOUT_SECONDS: float = 10.0
+    TRANSLATION_HTTP_MAX_CONNECTIONS: int = 100
+    TRANSLATION_HTTP_MAX_KEEPALIVE: int = 20
+    
+    # Fake provider for load and resilience testing (TRANSLATION_PROVIDER="fake")
+    FAKE_PROVIDER_LATENCY_MS: float = 50.0
+    FAKE_PROVIDER_JITTER_MS: float = 0.0
+    FAKE_PROVIDER_SLOW_RATE: float = 0.0
+    FAKE_PROVIDER_SLOW_LATENCY_MS: float = 1000.0
+    FAKE_PROVIDER_FAILURE_RATE: float = 0.0
+    
+    # Provider resilience: circuit breaker, hedging and budgeted retries (not applied to mock)
+    PROVIDER_RESILIENCE_ENABLED: bool = True
+    PROVIDER_ATTEMPT_TIMEOUT_SECONDS: float = 5.0
+    PROVIDER_MAX_RETRIES: int = 2
+    PROVIDER_RETRY_BASE_DELAY_MS: float = 50.0
+    PROVIDER_RETRY_MAX_DELAY_MS: float = 1000.0
+    PROVIDER_RETRY_BUDGET_RATIO: float = 0.1  # retries and hedges per request, on top of the reserve
+    PROVIDER_RETRY_BUDGET_RESERVE: int = 10
+    PROVIDER_HEDGING_ENABLED: bool = True
+    PROVIDER_HEDGE_PERCENTILE: float = 95.0  # hedge once a call is slower than this latency percentile
+    PROVIDER_HEDGE_MIN_DELAY_MS: float = 20.0
+    PROVIDER_CIRCUIT_FAILURE_RATIO: float = 0.5
+    PROVIDER_CIRCUIT_WINDOW: int = 50  # recent calls considered
+    PROVIDER_CIRCUIT_MIN_CALLS: int = 20
+    PROVIDER_CIRCUIT_SLOW_CALL_MS: float = 3000.0  # slower successful calls count as failures
+    PROVIDER_CIRCUIT_OPEN_SECONDS: float = 10.0
+    PROVIDER_CIRCUIT_HALF_OPEN_CALLS: int = 3
+    PROVIDER_FALLBACK_TO_MOCK: bool = True  # serve dictionary translations while the circuit is open
+    
+    # Micro-batching of single translate calls into batched upstream calls
+    PROVIDER_BATCHING_ENABLED: bool = False
+    PROVIDER_BATCH_WINDOW_MS: float = 5.0
+    PROVIDER_BATCH_MAX_SIZE: int = 50
+    
+    # Translation result cache
+    TRANSLATION_CACHE_ENABLED: bool = True
+    TRANSLATION_CACHE_MAX_SIZE: int = 10000
+    TRANSLATION_CACHE_TTL_SECONDS: int = 3600
+    
+    # Fuzzy translation memory over translation_logs
+    TRANSLATION_MEMORY_ENABLED: bool = False
+    TRANSLATION_MEMORY_THRESHOLD: float = 0.85  # trigram Jaccard similarity
+    TRANSLATION_MEMORY_MAX_ENTRIES: int = 200000
+    TRANSLATION_MEMORY_REFRESH_SECONDS: float = 5.0
+    TRANSLATION_MEMORY_LOAD_BATCH_SIZE: int = 5000
+    
+    # Local source language detection (reported as the source, and sent upstream instead of "auto")
+    LANGUAGE_DETECTION_ENABLED: bool = True
+    LANGUAGE_DETECTION_MIN_CONFIDENCE: float = 0.8  # below this the provider's answer is used
+    
+    # Share one provider call between concurrent identical requests
+    TRANSLATION_COALESCING_ENABLED: bool = True
+    
+    # Bulk translation
+    BULK_TRANSLATION_CONCURRENCY: int = 5
+    BULK_TRANSLATION_ITEM_TIMEOUT_SECONDS: float = 10.0
+    
+    # Long-document translation
+    DOCUMENT_SEGMENT_MAX_LENGTH: int = 1000
+    DOCUMENT_TRANSLATION_CONCURRENCY: int = 16
+    
+    # Streaming NDJSON translation
+    STREAM_TRANSLATION_CONCURRENCY: int = 16
+    STREAM_MAX_LINE_BYTES: int = 65536
+    
+    # Offline batch translation jobs
+    JOB_WORKERS: int = 2
+    JOB_CHUNK_SIZE: int = 100
+    JOB_PROCESS_WORKERS: int = 2  # mock provider only; 0 translates on the event loop
+    JOB_MAX_ITEMS: int = 1000000
+    
     class Config:
         env_file = ".env"
 
@@ -8,9 +8,13 @@ SUPPORTED_LANGUAGES = {
     'fr', 'es', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh', 'ar', 'th', 'vi'
 }
 
+# Maximum length of a document for /translate/document
+MAX_DOCUMENT_LENGTH = 100000
+
 class TranslationRequest(BaseModel):
     text: str = Field(..., max_length=1000, description="Text to translate (max 1000 characters)")
     target_language: str = Field(..., description="Target language ISO code (e.g., 'hi', 'ta', 'kn')")
+    bypass_cache: bool = Field(default=False, description="Skip the translation result cache")
     
     @validator('text')
     def validate_text(cls, v):
@@ -29,6 +33,7 @@ class TranslationRequest(BaseModel):
 class BulkTranslationRequest(BaseModel):
     texts: List[str] = Field(..., max_items=10, description="List of texts to translate (max 10 items)")
     target_language: str = Field(..., description="Target language ISO code")
+    bypass_cache: bool = Field(default=False, description="Skip the translation result cache")
     
     @validator('texts')
     def validate_texts(cls, v):
@@ -51,6 +56,47 @@ class BulkTranslationRequest(BaseModel):
             raise ValueError(f'Unsupported language code: {v}')
         return v.lower()
 
+class DocumentTranslationRequest(BaseModel):
+    text: str = Field(..., max_length=MAX_DOCUMENT_LENGTH, description="Document to translate (max 100000 characters)")
+    target_language: str = Field(..., description="Target language ISO code")
+    bypass_cache: bool = Field(default=False, description="Skip the translation result cache")
+    
+    @validator('text')
+    def validate_text(cls, v):
+        # Whitespace is kept: it is part of the document's layout
+        if not v or not v.strip():
+            raise ValueError('Text cannot be empty')
+        return v
+    
+    @validator('target_language')
+    def validate_language(cls, v):
+        if v.lower() not in SUPPORTED_LANGUAGES:
+            raise ValueError(f'Unsupported language code: {v}')
+        return v.lower()
+
+class JobSubmitRequest(BaseModel):
+    texts: List[str] = Field(..., description="Texts to translate in the background")
+    target_language: str = Field(..., description="Target language ISO code")
+    
+    @validator('texts')
+    def validate_texts(cls, v):
+        if not v:
+            raise ValueError('Texts list cannot be empty')
+        
+        for i, text in enumerate(v):
+            if not text or not text.strip():
+                raise ValueError(f'Text at index {i} cannot be empty')
+            if len(text) > 1000:
+                raise ValueError(f'Text at index {i} exceeds maximum length of 1000 characters')
+        
+        return [text.strip() for text in v]
+    
+    @validator('target_language')
+    def validate_language(cls, v):
+        if v.lower() not in SUPPORTED_LANGUAGES:
+            raise ValueError(f'Unsupported language code: {v}')
+        return v.lower()
+
 class TranslationResponse(BaseModel):
     success: bool
     original_text: str
@@ -66,6 +112,44 @@ class BulkTranslationResponse(BaseModel):
     total_translations: int
     timestamp: datetime
 
+class DocumentTranslationResponse(BaseModel):
+    success: bool
+    original_text: str
+    translated_text: str
+    source_language: str
+    target_language: str
+    translation_id: str
+    segments: int
+    unique_segments: int
+    timestamp: datetime
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str
+    target_language: str
+    total_items: int
+    completed_items: int
+    failed_items: int
+    progress: float
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+class JobItemResult(BaseModel):
+    position: int
+    status: str
+    original_text: str
+    translated_text: Optional[str] = None
+    source_language: Optional[str] = None
+    translation_id: Optional[str] = None
+    error: Optional[str] = None
+
+class JobResultsResponse(BaseModel):
+    job_id: str
+    status: str
+    results: List[JobItemResult]
+    next_after: Optional[int] = None
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: datetime
@@ -1,27 +1,110 @@
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, event, inspect, insert, select, MetaData, Table
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy import Column, ForeignKey, Integer, String, Text, DateTime, Index
 from datetime import datetime
+import hashlib
+import logging
 from app.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+# Async drivers used when DATABASE_ASYNC is enabled
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+def _is_memory_sqlite(url: str) -> bool:
+    database = make_url(url).database
+    return _is_sqlite(url) and (not database or database == ":memory:")
+
+def _engine_kwargs(url: str) -> dict:
+    """Connection and pool options for ``url``"""
+    kwargs = {}
+    if _is_sqlite(url):
+        kwargs["connect_args"] = {
+            "check_same_thread": False,
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000
+        }
+    if not _is_memory_sqlite(url):
+        kwargs.update(
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+            pool_pre_ping=True
+        )
+    return kwargs
+
+def _configure_sqlite(engine):
+    """Apply WAL journaling and write tuning to every new SQLite connection"""
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if not _is_memory_sqlite(str(engine.url)):
+            cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.close()
+
+def _async_url(url: str) -> str:
+    """Swap the sync driver in ``url`` for its async counterpart"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+engine = create_engine(settings.DATABASE_URL, **_engine_kwargs(settings.DATABASE_URL))
+if _is_sqlite(settings.DATABASE_URL):
+    _configure_sqlite(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+async_engine = None
+AsyncSessionLocal = None
+if settings.DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    
+    async_engine = create_async_engine(_async_url(settings.DATABASE_URL), **_engine_kwargs(settings.DATABASE_URL))
+    if _is_sqlite(settings.DATABASE_URL):
+        _configure_sqlite(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+def text_hash(text: str) -> str:
+    """Content address of a text: hex BLAKE2b-128 of its UTF-8 bytes"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def insert_ignore(dialect_name: str, model):
+    """INSERT that skips rows whose primary key already exists"""
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert(model).on_conflict_do_nothing()
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+        return postgresql_insert(model).on_conflict_do_nothing()
+    return insert(model)
+
+class TranslationText(Base):
+    """Each distinct original/translated text, stored once and keyed by content hash"""
+    __tablename__ = "translation_texts"
+    
+    hash = Column(String(32), primary_key=True)
+    text = Column(Text, nullable=False)
+
 class TranslationLog(Base):
     __tablename__ = "translation_logs"
     
     id = Column(Integer, primary_key=True, index=True)
     translation_id = Column(String(50), unique=True, index=True)
-    original_text = Column(Text, nullable=False)
-    translated_text = Column(Text, nullable=False)
+    original_text_hash = Column(String(32), ForeignKey("translation_texts.hash"), nullable=False)
+    translated_text_hash = Column(String(32), ForeignKey("translation_texts.hash"), nullable=False)
     source_language = Column(String(10), nullable=False)
     target_language = Column(String(10), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -32,16 +115,181 @@ class TranslationLog(Base):
     __table_args__ = (
         Index('idx_created_at', 'created_at'),
         Index('idx_target_language', 'target_language'),
+        # Keyset pagination on (created_at, id), optionally filtered by language
+        Index('idx_created_at_id', 'created_at', 'id'),
+        Index('idx_target_language_created_at_id', 'target_language', 'created_at', 'id'),
     )
+    
+    # Texts are joined in the same query whenever logs are loaded
+    original = relationship(TranslationText, foreign_keys=[original_text_hash], lazy="joined", innerjoin=True)
+    translated = relationship(TranslationText, foreign_keys=[translated_text_hash], lazy="joined", innerjoin=True)
+    
+    @property
+    def original_text(self) -> str:
+        return self.original.text
+    
+    @property
+    def translated_text(self) -> str:
+        return self.translated.text
+
+class TranslationJob(Base):
+    """Offline batch translation job; progress is checkpointed per chunk"""
+    __tablename__ = "translation_jobs"
+    
+    id = Column(String(36), primary_key=True)
+    status = Column(String(20), nullable=False, default="pending")
+    target_language = Column(String(10), nullable=False)
+    total_items = Column(Integer, nullable=False, default=0)
+    completed_items = Column(Integer, nullable=False, default=0)
+    failed_items = Column(Integer, nullable=False, default=0)
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('idx_job_status', 'status'),
+    )
+
+class TranslationJobItem(Base):
+    __tablename__ = "translation_job_items"
+    
+    id = Column(Integer, primary_key=True)
+    job_id = Column(String(36), ForeignKey("translation_jobs.id"), nullable=False)
+    position = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    original_text = Column(Text, nullable=False)
+    translated_text = Column(Text)
+    source_language = Column(String(10))
+    translation_id = Column(String(50))
+    error = Column(Text)
+    
+    __table_args__ = (
+        Index('idx_job_item_position', 'job_id', 'position'),
+        Index('idx_job_item_status', 'job_id', 'status', 'position'),
+    )
+
+# Rows copied per transaction when rebuilding log tables with inline texts
+MIGRATION_BATCH_SIZE = 5000
+
+def _legacy_log_tables(bind) -> list:
+    """Log and archive tables still storing texts inline instead of in translation_texts"""
+    from app.services.retention import ARCHIVE_PREFIX
+    
+    inspector = inspect(bind)
+    legacy = []
+    for name in inspector.get_table_names():
+        if name != TranslationLog.__tablename__ and not name.startswith(ARCHIVE_PREFIX):
+            continue
+        columns = {column["name"] for column in inspector.get_columns(name)}
+        if "original_text" in columns and "original_text_hash" not in columns:
+            legacy.append(name)
+    return legacy
+
+def _rebuild_log_table(bind, name: str, batch_size: int = MIGRATION_BATCH_SIZE) -> int:
+    """
+    Rebuild one log table in the translation_texts layout; returns rows copied
+    
+    Rows are copied in id order into ``<name>_migrating`` with their texts
+    stored once by hash, then the copy replaces the original in a single
+    transaction. An interrupted run leaves the original untouched and the
+    partial copy is rebuilt on the next start.
+    """
+    metadata = MetaData()
+    old = Table(name, metadata, autoload_with=bind)
+    hot = name == TranslationLog.__tablename__
+    if hot:
+        Table(TranslationText.__tablename__, metadata, autoload_with=bind)
+    # Archives carry no foreign keys; indexes are added by their usual names afterwards
+    new = Table(
+        f"{name}_migrating", metadata,
+        *(Column(column.name, column.type,
+                 *([ForeignKey(key.target_fullname) for key in column.foreign_keys] if hot else []),
+                 primary_key=column.primary_key, nullable=column.nullable)
+          for column in TranslationLog.__table__.columns)
+    )
+    new.drop(bind=bind, checkfirst=True)
+    new.create(bind=bind)
+    
+    copied = 0
+    last_id = None
+    while True:
+        with bind.begin() as connection:
+            statement = select(old).order_by(old.c.id).limit(batch_size)
+            if last_id is not None:
+                statement = statement.where(old.c.id > last_id)
+            rows = connection.execute(statement).mappings().all()
+            if not rows:
+                break
+            
+            texts = {}
+            records = []
+            for row in rows:
+                record = {column.name: row[column.name] for column in new.columns if column.name in row}
+                record['original_text_hash'] = text_hash(row['original_text'])
+                record['translated_text_hash'] = text_hash(row['translated_text'])
+                texts[record['original_text_hash']] = row['original_text']
+                texts[record['translated_text_hash']] = row['translated_text']
+                records.append(record)
+            connection.execute(
+                insert_ignore(bind.dialect.name, TranslationText),
+                [{'hash': digest, 'text': text} for digest, text in texts.items()]
+            )
+            connection.execute(insert(new), records)
+            copied += len(records)
+            last_id = rows[-1]['id']
+    
+    preparer = bind.dialect.identifier_preparer
+    with bind.begin() as connection:
+        old.drop(bind=connection)
+        connection.exec_driver_sql(
+            f"ALTER TABLE {preparer.quote(new.name)} RENAME TO {preparer.quote(name)}"
+        )
+    if not hot:
+        from app.services.retention import archive_table
+        
+        for index in archive_table(name).indexes:
+            index.create(bind=bind, checkfirst=True)
+    return copied
+
+def migrate_log_texts(bind=None) -> dict:
+    """Move inline log texts of tables created before translation_texts; returns rows copied per table"""
+    bind = bind or engine
+    return {name: _rebuild_log_table(bind, name) for name in _legacy_log_tables(bind)}
 
 def create_tables():
     """Create database tables"""
     Base.metadata.create_all(bind=engine)
+    
+    # Logs written before texts moved to translation_texts keep them inline
+    migrated = migrate_log_texts(engine)
+    if migrated:
+        logger.warning("Moved inline texts of %s into translation_texts", migrated)
+    
+    # create_all skips existing tables, so add indexes introduced since
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
-def get_db():
-    """Database dependency"""
+async def get_db():
+    """
+    Database dependency
+    
+    Yields an ``AsyncSession`` when DATABASE_ASYNC is enabled, otherwise a
+    regular ``Session``.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+    
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def dispose_engines():
+    """Close pooled database connections"""
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
\ No newline at end of file
@@ -4,8 +4,18 @@ from fastapi.responses import JSONResponse
 from datetime import datetime
 
 from app.config import get_settings
-from app.database import create_tables
-from app.api.routes import health, translation
+from app.database import create_tables, dispose_engines
+from app.api.routes import health, jobs, metrics, translation
+from app.services.translation_service import init_translation_service, shutdown_translation_service
+from app.services.log_writer import init_log_writer, shutdown_log_writer
+from app.services.translation_memory import get_translation_memory, shutdown_translation_memory
+from app.services.retention import init_retention_scheduler, shutdown_retention_scheduler
+from app.services.job_manager import init_job_manager, shutdown_job_manager
+from app.services.metrics import MetricsMiddleware
+from app.services.timing import ServerTimingMiddleware
+from app.services.profiling import RequestProfilerMiddleware
+from app.services.admission import AdmissionMiddleware, init_admission_controller
+from app.utils.helpers import parse_networks
 from app.core.exceptions import TranslationServiceException
 
 # Initialize settings
@@ -29,10 +39,53 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create database tables on startup
+# Report per-stage request timings in a Server-Timing header
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware, path_prefix="/api/v1")
+
+# Dump cProfile stats for sampled or slow requests
+if settings.PROFILE_SAMPLE_RATE or settings.PROFILE_SLOW_REQUEST_MS:
+    app.add_middleware(
+        RequestProfilerMiddleware,
+        profile_dir=settings.PROFILE_DIR,
+        sample_rate=settings.PROFILE_SAMPLE_RATE,
+        slow_request_ms=settings.PROFILE_SLOW_REQUEST_MS,
+        path_prefix="/api/v1"
+    )
+
+# Shed load once the translation routes are saturated
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionMiddleware,
+        controller=init_admission_controller(),
+        retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS,
+        trusted_proxies=parse_networks(settings.ADMISSION_TRUSTED_PROXIES)
+    )
+
+# Record per-route request metrics
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Create database tables and shared services on startup
 @app.on_event("startup")
 async def startup_event():
     create_tables()
+    init_translation_service()
+    if get_translation_memory() is not None:
+        get_translation_memory().start()
+    init_log_writer().start()
+    init_retention_scheduler()
+    init_job_manager().start()
+
+# Release shared services on shutdown
+@app.on_event("shutdown")
+async def shutdown_event():
+    await shutdown_job_manager()
+    await shutdown_retention_scheduler()
+    await shutdown_log_writer()
+    await shutdown_translation_memory()
+    await shutdown_translation_service()
+    await dispose_engines()
 
 # Global exception handler
 @app.exception_handler(TranslationServiceException)
@@ -74,6 +127,9 @@ async def general_exception_handler(request: Request, exc: Exception):
 # Include routers
 app.include_router(health.router)
 app.include_router(translation.router)
+app.include_router(jobs.router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics.router)
 
 # Root endpoint
 @app.get("/")
@@ -1,5 +1,86 @@
 import random
 
+MOCK_LANGUAGES = ["hi", "ta", "kn", "bn"]
+
+# Marks the end of a phrase inside a trie node; never produced by str.split()
+_TERMINAL = ""
+
+
+class PhraseIndex:
+    """Word-level trie over every source phrase of every language.
+
+    Each terminal node maps a target language code to its translation, so a
+    lookup costs one dict hop per word regardless of how large the lexicon is.
+    """
+
+    def __init__(self):
+        self.root = {}
+        self.max_phrase_length = 0
+
+    def add(self, phrase, target_language, translation):
+        """Register a translation, keeping any earlier entry for the same target"""
+        words = phrase.lower().split()
+        if not words:
+            return
+
+        node = self.root
+        for word in words:
+            node = node.setdefault(word, {})
+        node.setdefault(_TERMINAL, {}).setdefault(target_language, translation)
+        self.max_phrase_length = max(self.max_phrase_length, len(words))
+
+    def longest_match(self, words, start, target_language):
+        """Return (translation, word_count) of the longest phrase at ``start``"""
+        node = self.root
+        best, best_length = None, 0
+        for offset in range(start, min(len(words), start + self.max_phrase_length)):
+            node = node.get(words[offset])
+            if node is None:
+                break
+            targets = node.get(_TERMINAL)
+            if targets is not None and target_language in targets:
+                best, best_length = targets[target_language], offset - start + 1
+        return best, best_length
+
+    def translate_words(self, words, target_language):
+        """Greedy longest-match over ``words``: (translated words, whether any phrase matched)"""
+        translated_words = []
+        matched = False
+        position = 0
+        while position < len(words):
+            translated, length = self.longest_match(words, position, target_language)
+            if translated is None:
+                # Keep original word if translation is not available
+                translated_words.append(words[position])
+                position += 1
+            else:
+                translated_words.append(translated)
+                matched = True
+                position += length
+        return translated_words, matched
+
+    @classmethod
+    def from_translations(cls, translations):
+        """Build the index from the ``{"en": {...}, "hi": {...}, ...}`` layout.
+
+        English entries are added first, then each language in turn, so an
+        ambiguous phrase resolves the same way the per-language scan used to.
+        Non-English phrases reach other languages by pivoting through English.
+        """
+        index = cls()
+        english = translations.get("en", {})
+        for phrase, targets in english.items():
+            for target_language, translation in targets.items():
+                index.add(phrase, target_language, translation)
+
+        for lang in MOCK_LANGUAGES:
+            for phrase, english_phrase in translations.get(lang, {}).items():
+                index.add(phrase, "en", english_phrase)
+                for target_language, translation in english.get(english_phrase, {}).items():
+                    index.add(phrase, target_language, translation)
+        return index
+
+
 class MockGoogleTranslate:
     def __init__(self):
         self.translations = {
@@ -140,38 +221,18 @@ class MockGoogleTranslate:
             }
         }
 
+        self.index = PhraseIndex.from_translations(self.translations)
+
     def translate(self, text, target_language):
-        # If the text is a single word or phrase that exists in our dictionary
         text = text.lower().strip()
-        
-        # Direct translation if available
-        if text in self.translations["en"]:
-            if target_language in ["hi", "ta", "kn", "bn"]:
-                return self.translations["en"][text][target_language]
-        
-        for lang in ["hi", "ta", "kn", "bn"]:
-            if text in self.translations[lang]:
-                if target_language == "en":
-                    return self.translations[lang][text]
-                elif target_language in ["hi", "ta", "kn", "bn"]:
-                    # Translate through English
-                    eng = self.translations[lang][text]
-                    if eng in self.translations["en"]:
-                        return self.translations["en"][eng][target_language]
-        
-        # If the text is a sentence, try to translate word by word
         words = text.split()
-        if len(words) > 1:
-            translated_words = []
-            for word in words:
-                translated_word = self.translate(word, target_language)
-                if translated_word != "Translation not available":
-                    translated_words.append(translated_word)
-                else:
-                    # Keep original word if translation is not available
-                    translated_words.append(word)
+
+        # Greedy longest-match over the phrase index in a single pass
+        translated_words, matched = self.index.translate_words(words, target_language)
+
+        if len(words) > 1 or matched:
             return " ".join(translated_words)
-        
+
         return "Translation not available"
 
 
@@ -0,0 +1,240 @@
+import asyncio
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Collection, Deque, Dict, Optional, Sequence
+
+from app.config import get_settings
+from app.services.metrics import ADMISSION_QUEUE_WAIT, ADMISSION_REJECTED, registry
+from app.utils.helpers import get_peer_ip
+from app.utils.serialization import dumps
+
+settings = get_settings()
+
+# Rejection reasons, as reported in metrics and error codes
+REJECT_CLIENT_LIMIT = "client_limit"
+REJECT_QUEUE_FULL = "queue_full"
+REJECT_QUEUE_TIMEOUT = "queue_timeout"
+
+# Routes that do translation work; lookups such as the logs and stats
+# routes are cheap and stay available under load
+TRANSLATION_PATHS = (
+    "/api/v1/translate",
+    "/api/v1/translate/bulk",
+    "/api/v1/translate/document",
+    "/api/v1/translate/stream",
+)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed instead of admitted"""
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(reason)
+
+
+class AdmissionController:
+    """
+    Bounds the number of requests being handled at once.
+
+    Up to ``max_concurrency`` requests run; the next ``queue_size`` wait in
+    FIFO order for at most ``queue_timeout`` seconds, and anything beyond
+    that is rejected straight away. Each client (keyed by IP) may have at
+    most ``per_client_limit`` requests running or queued, so one noisy
+    client cannot take every slot. Limits of 0 disable that check.
+
+    Shedding early keeps the admitted requests fast: without it, a spike
+    queues unbounded work behind the provider and the log writer until
+    every request times out.
+    """
+    def __init__(self, max_concurrency: int, queue_size: int, queue_timeout: float,
+                 per_client_limit: int = 0):
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.per_client_limit = per_client_limit
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._clients: Dict[str, int] = {}
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {REJECT_CLIENT_LIMIT: 0, REJECT_QUEUE_FULL: 0, REJECT_QUEUE_TIMEOUT: 0}
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, client: Optional[str] = None):
+        """Take a slot, waiting in the queue if needed; raises AdmissionRejected"""
+        if client is not None and self.per_client_limit:
+            if self._clients.get(client, 0) >= self.per_client_limit:
+                self._reject(REJECT_CLIENT_LIMIT)
+            self._clients[client] = self._clients.get(client, 0) + 1
+
+        try:
+            if self.max_concurrency and (self.active >= self.max_concurrency or self._waiters):
+                await self._wait()
+            else:
+                self.active += 1
+        except BaseException:
+            self._release_client(client)
+            raise
+        self.admitted += 1
+
+    async def _wait(self):
+        if self.queue_size and len(self._waiters) >= self.queue_size:
+            self._reject(REJECT_QUEUE_FULL)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout or None)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            self._reject(REJECT_QUEUE_TIMEOUT)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        finally:
+            ADMISSION_QUEUE_WAIT.observe(time.perf_counter() - start)
+
+    def _abandon(self, waiter: asyncio.Future):
+        """Leave the queue, passing on a slot that was handed over meanwhile"""
+        if waiter.done() and not waiter.cancelled():
+            self.release()
+        else:
+            waiter.cancel()
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def release(self, client: Optional[str] = None):
+        """Free a slot, handing it straight to the longest waiting request"""
+        self._release_client(client)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot moves to the waiter; active stays the same
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _release_client(self, client: Optional[str]):
+        if client is None or not self.per_client_limit:
+            return
+        remaining = self._clients.get(client, 0) - 1
+        if remaining > 0:
+            self._clients[client] = remaining
+        else:
+            self._clients.pop(client, None)
+
+    def _reject(self, reason: str):
+        self.rejected[reason] += 1
+        ADMISSION_REJECTED.labels(reason).inc()
+        raise AdmissionRejected(reason)
+
+    def stats(self) -> dict:
+        return {
+            'active': self.active,
+            'queued': self.queued,
+            'max_concurrency': self.max_concurrency,
+            'queue_size': self.queue_size,
+            'per_client_limit': self.per_client_limit,
+            'admitted': self.admitted,
+            'rejected': dict(self.rejected),
+        }
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that runs requests to ``paths`` through an
+    AdmissionController.
+
+    Shed requests get a fast JSON error with ``Retry-After``: 429 when the
+    client is over its own limit, 503 when the service as a whole is
+    saturated. Streaming responses hold their slot until they finish.
+
+    Clients are told apart by their connection address; forwarding headers
+    count only on connections from ``trusted_proxies``, so a client cannot
+    escape its limit by rotating ``X-Forwarded-For``.
+    """
+    def __init__(self, app, controller: AdmissionController, paths: Collection[str] = TRANSLATION_PATHS,
+                 retry_after: float = 1.0, trusted_proxies: Sequence = ()):
+        self.app = app
+        self.controller = controller
+        self.paths = frozenset(paths)
+        self.retry_after = str(max(1, math.ceil(retry_after)))
+        self.trusted_proxies = list(trusted_proxies)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].rstrip("/") not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        client = get_peer_ip(scope, self.trusted_proxies) if self.controller.per_client_limit else None
+        try:
+            await self.controller.acquire(client)
+        except AdmissionRejected as e:
+            await self._reject(e.reason, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(client)
+
+    async def _reject(self, reason: str, send):
+        if reason == REJECT_CLIENT_LIMIT:
+            status, message = 429, "Too many concurrent requests from this client"
+        else:
+            status, message = 503, "Service overloaded, retry later"
+        body = dumps({
+            "success": False,
+            "error": message,
+            "error_code": f"OVERLOADED_{reason.upper()}",
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", self.retry_after.encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+def init_admission_controller() -> AdmissionController:
+    """Create the application-wide admission controller"""
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController(
+            max_concurrency=settings.ADMISSION_MAX_CONCURRENCY,
+            queue_size=settings.ADMISSION_QUEUE_SIZE,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_MS / 1000,
+            per_client_limit=settings.ADMISSION_PER_CLIENT_LIMIT
+        )
+    return _admission_controller
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """Application-wide admission controller, if admission control is enabled"""
+    return _admission_controller
+
+def _collect_metrics():
+    """Occupancy of the application-wide admission controller"""
+    controller = _admission_controller
+    if controller is None:
+        return []
+    return [
+        ("admission_active_requests", "gauge", "Admitted requests being handled", [({}, controller.active)]),
+        ("admission_queued_requests", "gauge", "Requests waiting for admission", [({}, controller.queued)]),
+        ("admission_admitted_requests", "counter", "Requests admitted", [({}, controller.admitted)]),
+    ]
+
+registry.register_collector(_collect_metrics)
@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+class TranslationCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL.
+    
+    Entries are evicted least-recently-used first once ``max_size`` is reached,
+    and lazily dropped on lookup once older than ``ttl_seconds``.
+    """
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 3600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    @staticmethod
+    def make_key(text: str, source_language: Optional[str], target_language: str) -> tuple:
+        """Build a cache key from whitespace-normalized text and the language pair"""
+        return (" ".join(text.split()), source_language or "auto", target_language)
+    
+    def get(self, key: Hashable) -> Optional[object]:
+        """Return the cached value, or None on a miss or expired entry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: object):
+        """Store a value, evicting the least recently used entry when full"""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop every entry, keeping the counters"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def stats(self) -> dict:
+        """Cache counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,421 @@
+import asyncio
+import logging
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import AsyncIterator, Callable, List, Optional
+
+from sqlalchemy import bindparam, select, update
+
+from app.config import get_settings
+from app.core.exceptions import TranslationServiceException, ValidationException
+from app.database import SessionLocal, TranslationJob, TranslationJobItem
+from app.services.logging_service import LoggingService
+from app.services.providers import MockProvider, backend_name
+from app.services.translation_service import TranslationService, get_translation_service
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+JOB_UPLOADING = "uploading"
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+UNFINISHED_STATUSES = (JOB_PENDING, JOB_RUNNING)
+
+ITEM_PENDING = "pending"
+ITEM_DONE = "done"
+ITEM_FAILED = "failed"
+
+# Rows written per transaction while an upload is being read
+UPLOAD_BATCH_SIZE = 1000
+
+
+def _mock_translate_chunk(texts: List[str], target_language: str) -> List[tuple]:
+    """Dictionary translation of a chunk, run in a worker process"""
+    provider = MockProvider()
+    return [provider.lookup(text, target_language) for text in texts]
+
+
+def _process_context():
+    """
+    Start method for chunk worker processes. The pool is created inside the
+    running event loop, whose threads (executor, database pool) hold locks a
+    forked child would inherit mid-use; workers start from a clean process.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _job_to_dict(job: TranslationJob) -> dict:
+    processed = job.completed_items + job.failed_items
+    return {
+        'job_id': job.id,
+        'status': job.status,
+        'target_language': job.target_language,
+        'total_items': job.total_items,
+        'completed_items': job.completed_items,
+        'failed_items': job.failed_items,
+        'progress': processed / job.total_items if job.total_items else 1.0,
+        'error': job.error,
+        'created_at': job.created_at,
+        'updated_at': job.updated_at
+    }
+
+
+class JobManager:
+    """
+    Runs offline translation jobs on a pool of background workers.
+
+    Submitted texts are stored as job items; workers take ``chunk_size``
+    pending items at a time, translate them and checkpoint the results, the
+    job counters and the translation logs in one transaction. Anything not yet
+    checkpointed is still pending, so unfinished jobs resume after a restart.
+
+    With the mock provider, chunks are translated in a process pool
+    (``process_workers``) since dictionary work is CPU-bound; other providers
+    are called asynchronously under the bulk concurrency limit.
+    """
+    def __init__(self, translation_service: TranslationService, session_factory: Callable = SessionLocal,
+                 workers: int = 2, chunk_size: int = 100, process_workers: int = 2, max_items: int = 1000000):
+        self.translation_service = translation_service
+        self.session_factory = session_factory
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.process_workers = process_workers
+        self.max_items = max_items
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        """Start the workers and re-queue jobs left unfinished by a previous run"""
+        if self._tasks:
+            return
+
+        self._queue = asyncio.Queue()
+        if self.process_workers and backend_name(self.translation_service.provider) == MockProvider.name:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers, mp_context=_process_context())
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._resume()))
+
+    async def stop(self):
+        """Stop the workers; in-progress chunks are redone on the next start"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    async def submit(self, texts: List[str], target_language: str) -> dict:
+        """Create a job from a list of texts and queue it"""
+        async def items():
+            for text in texts:
+                yield text
+        return await self.submit_stream(items(), target_language)
+
+    async def submit_stream(self, texts: AsyncIterator[str], target_language: str) -> dict:
+        """Create a job from an async stream of texts, storing them in batches as they arrive"""
+        if self._queue is None:
+            self.start()
+
+        job_id = str(uuid.uuid4())
+        await asyncio.to_thread(self._create_job, job_id, target_language)
+
+        total = 0
+        batch = []
+        try:
+            async for text in texts:
+                if total == self.max_items:
+                    raise ValidationException(f"Job exceeds {self.max_items} items", "JOB_TOO_LARGE")
+                batch.append({'job_id': job_id, 'position': total, 'original_text': text})
+                total += 1
+                if len(batch) == UPLOAD_BATCH_SIZE:
+                    await asyncio.to_thread(self._add_items, batch)
+                    batch = []
+            if batch:
+                await asyncio.to_thread(self._add_items, batch)
+        except Exception as e:
+            message = e.message if isinstance(e, TranslationServiceException) else str(e)
+            await asyncio.to_thread(self._finish_job, job_id, JOB_FAILED, f"Upload failed: {message}")
+            raise
+
+        if not total:
+            await asyncio.to_thread(self._finish_job, job_id, JOB_FAILED, "Job has no items")
+            raise ValidationException("Job has no items", "EMPTY_JOB")
+
+        job = await asyncio.to_thread(self._mark_pending, job_id, total)
+        await self._queue.put(job_id)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        db = self.session_factory()
+        try:
+            job = db.get(TranslationJob, job_id)
+            return _job_to_dict(job) if job else None
+        finally:
+            db.close()
+
+    def get_results(self, job_id: str, after: int = -1, limit: int = 100) -> List[dict]:
+        """Processed and pending items with ``position > after``, in order"""
+        db = self.session_factory()
+        try:
+            items = db.execute(
+                select(TranslationJobItem)
+                .where(TranslationJobItem.job_id == job_id, TranslationJobItem.position > after)
+                .order_by(TranslationJobItem.position)
+                .limit(limit)
+            ).scalars().all()
+            return [{
+                'position': item.position,
+                'status': item.status,
+                'original_text': item.original_text,
+                'translated_text': item.translated_text,
+                'source_language': item.source_language,
+                'translation_id': item.translation_id,
+                'error': item.error
+            } for item in items]
+        finally:
+            db.close()
+
+    def cancel(self, job_id: str) -> Optional[dict]:
+        """Cancel an unfinished job; workers stop at the next chunk boundary"""
+        db = self.session_factory()
+        try:
+            job = db.get(TranslationJob, job_id)
+            if job is None:
+                return None
+            if job.status in UNFINISHED_STATUSES:
+                job.status = JOB_CANCELLED
+                job.updated_at = datetime.utcnow()
+                db.commit()
+            return _job_to_dict(job)
+        finally:
+            db.close()
+
+    async def _resume(self):
+        for job_id in await asyncio.to_thread(self._unfinished_job_ids):
+            await self._queue.put(job_id)
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Translation job %s failed", job_id)
+                await asyncio.to_thread(self._finish_job, job_id, JOB_FAILED, str(e))
+
+    async def _run_job(self, job_id: str):
+        if not await asyncio.to_thread(self._claim_job, job_id):
+            return
+
+        while True:
+            items, target_language = await asyncio.to_thread(self._load_pending_items, job_id)
+            if not items:
+                break
+            results = await self._translate_chunk(items, target_language)
+            if not await asyncio.to_thread(self._checkpoint, job_id, target_language, results):
+                return  # cancelled while the chunk was in flight
+
+        await asyncio.to_thread(self._finish_job, job_id, JOB_COMPLETED)
+
+    async def _translate_chunk(self, items: List[TranslationJobItem], target_language: str) -> List[dict]:
+        """Translate a chunk, returning one checkpoint row per item"""
+        timestamp = datetime.utcnow()
+
+        if self._process_pool is not None:
+            loop = asyncio.get_running_loop()
+            outcomes = await loop.run_in_executor(
+                self._process_pool, _mock_translate_chunk, [item.original_text for item in items], target_language
+            )
+        else:
+            semaphore = asyncio.Semaphore(settings.BULK_TRANSLATION_CONCURRENCY)
+
+            async def translate_one(text: str):
+                async with semaphore:
+                    result = await self.translation_service.translate_text(text, target_language)
+                    return result['translated_text'], result['source_language']
+
+            outcomes = await asyncio.gather(
+                *(translate_one(item.original_text) for item in items), return_exceptions=True
+            )
+
+        results = []
+        for item, outcome in zip(items, outcomes):
+            row = {'item_id': item.id, 'original_text': item.original_text, 'timestamp': timestamp}
+            if isinstance(outcome, Exception):
+                message = outcome.message if isinstance(outcome, TranslationServiceException) else str(outcome)
+                row.update(status=ITEM_FAILED, translated_text=None, source_language=None,
+                           translation_id=None, error=message)
+            else:
+                row.update(status=ITEM_DONE, translated_text=outcome[0], source_language=outcome[1],
+                           translation_id=str(uuid.uuid4()), error=None)
+            results.append(row)
+        return results
+
+    # Blocking database helpers, called through asyncio.to_thread
+
+    def _create_job(self, job_id: str, target_language: str):
+        db = self.session_factory()
+        try:
+            # Not queued until the upload finishes, so it is not resumed half-written
+            db.add(TranslationJob(id=job_id, status=JOB_UPLOADING, target_language=target_language))
+            db.commit()
+        finally:
+            db.close()
+
+    def _add_items(self, rows: List[dict]):
+        db = self.session_factory()
+        try:
+            db.execute(TranslationJobItem.__table__.insert(), rows)
+            db.commit()
+        finally:
+            db.close()
+
+    def _mark_pending(self, job_id: str, total: int) -> dict:
+        db = self.session_factory()
+        try:
+            job = db.get(TranslationJob, job_id)
+            job.status = JOB_PENDING
+            job.total_items = total
+            job.updated_at = datetime.utcnow()
+            db.commit()
+            return _job_to_dict(job)
+        finally:
+            db.close()
+
+    def _unfinished_job_ids(self) -> List[str]:
+        db = self.session_factory()
+        try:
+            return list(db.execute(
+                select(TranslationJob.id)
+                .where(TranslationJob.status.in_(UNFINISHED_STATUSES))
+                .order_by(TranslationJob.created_at)
+            ).scalars())
+        finally:
+            db.close()
+
+    def _claim_job(self, job_id: str) -> bool:
+        db = self.session_factory()
+        try:
+            claimed = db.execute(
+                update(TranslationJob)
+                .where(TranslationJob.id == job_id, TranslationJob.status.in_(UNFINISHED_STATUSES))
+                .values(status=JOB_RUNNING, updated_at=datetime.utcnow())
+            ).rowcount
+            db.commit()
+            return bool(claimed)
+        finally:
+            db.close()
+
+    def _load_pending_items(self, job_id: str):
+        db = self.session_factory()
+        try:
+            target_language = db.execute(
+                select(TranslationJob.target_language).where(TranslationJob.id == job_id)
+            ).scalar_one()
+            items = db.execute(
+                select(TranslationJobItem)
+                .where(TranslationJobItem.job_id == job_id, TranslationJobItem.status == ITEM_PENDING)
+                .order_by(TranslationJobItem.position)
+                .limit(self.chunk_size)
+            ).scalars().all()
+            db.expunge_all()
+            return items, target_language
+        finally:
+            db.close()
+
+    def _checkpoint(self, job_id: str, target_language: str, results: List[dict]) -> bool:
+        """Store a chunk's results, counters and logs atomically; False if the job was cancelled"""
+        db = self.session_factory()
+        try:
+            status = db.execute(
+                select(TranslationJob.status).where(TranslationJob.id == job_id)
+            ).scalar_one()
+            if status != JOB_RUNNING:
+                return False
+
+            db.execute(
+                update(TranslationJobItem.__table__)
+                .where(TranslationJobItem.__table__.c.id == bindparam('item_id'))
+                .values(
+                    status=bindparam('status'),
+                    translated_text=bindparam('translated_text'),
+                    source_language=bindparam('source_language'),
+                    translation_id=bindparam('translation_id'),
+                    error=bindparam('error')
+                ),
+                [{key: row[key] for key in ('item_id', 'status', 'translated_text', 'source_language',
+                                            'translation_id', 'error')} for row in results]
+            )
+
+            done = [row for row in results if row['status'] == ITEM_DONE]
+            db.execute(
+                update(TranslationJob)
+                .where(TranslationJob.id == job_id)
+                .values(
+                    completed_items=TranslationJob.completed_items + len(done),
+                    failed_items=TranslationJob.failed_items + (len(results) - len(done)),
+                    updated_at=datetime.utcnow()
+                )
+            )
+
+            # insert_log_records commits the whole checkpoint
+            LoggingService(db).insert_log_records([
+                LoggingService.build_log_record(
+                    {**row, 'target_language': target_language}, user_agent=f"translation-job/{job_id}"
+                )
+                for row in done
+            ])
+            db.commit()
+            return True
+        finally:
+            db.close()
+
+    def _finish_job(self, job_id: str, status: str, error: Optional[str] = None):
+        db = self.session_factory()
+        try:
+            db.execute(
+                update(TranslationJob)
+                .where(TranslationJob.id == job_id, TranslationJob.status != JOB_CANCELLED)
+                .values(status=status, error=error, updated_at=datetime.utcnow())
+            )
+            db.commit()
+        finally:
+            db.close()
+
+
+_job_manager: Optional[JobManager] = None
+
+def init_job_manager() -> JobManager:
+    """Create the application-wide job manager"""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager(
+            translation_service=get_translation_service(),
+            workers=settings.JOB_WORKERS,
+            chunk_size=settings.JOB_CHUNK_SIZE,
+            process_workers=settings.JOB_PROCESS_WORKERS,
+            max_items=settings.JOB_MAX_ITEMS
+        )
+    return _job_manager
+
+async def shutdown_job_manager():
+    """Stop the application-wide job manager"""
+    global _job_manager
+    if _job_manager is not None:
+        await _job_manager.stop()
+        _job_manager = None
+
+def get_job_manager() -> JobManager:
+    """Job manager dependency"""
+    return init_job_manager()
@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy.exc import OperationalError
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.services.logging_service import LoggingService
+from app.services.metrics import registry
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+QUEUE_FULL_POLICIES = ("block", "drop_new", "drop_oldest")
+
+# Queued by stop() to tell the flusher to drain and exit
+_STOP = object()
+
+def _database_unavailable(error: BaseException) -> bool:
+    """Whether a write failed because of the database rather than the rows in it"""
+    while error is not None:
+        if isinstance(error, (OperationalError, ConnectionError)):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+class LogWriter:
+    """
+    Write-behind translation logger.
+
+    Request handlers enqueue prepared log rows and return immediately. A single
+    background task batches them and writes each batch with one multi-row
+    insert on a worker thread, flushing when ``batch_size`` rows are queued or
+    ``flush_interval`` seconds have passed since the first row of the batch.
+
+    When the queue is full, ``full_policy`` decides what happens: ``block``
+    makes the caller wait (backpressure), ``drop_new`` discards the incoming
+    row and ``drop_oldest`` discards the oldest queued row.
+
+    A failed batch is retried up to ``max_retries`` times with doubling
+    delays from ``retry_delay``. Rows keep queueing meanwhile, so the full
+    policy bounds what a database outage costs. A batch that still fails is
+    written in halves, and those in halves again, so that a row the
+    database rejects costs only itself; when the database is unreachable
+    instead, the whole batch is logged with its size and counted as failed.
+    """
+    def __init__(self, session_factory: Callable = SessionLocal, max_queue_size: int = 10000,
+                 batch_size: int = 500, flush_interval: float = 0.5, full_policy: str = "block",
+                 max_retries: int = 3, retry_delay: float = 0.5):
+        if full_policy not in QUEUE_FULL_POLICIES:
+            raise ValueError(f"Unknown queue full policy: {full_policy}")
+
+        self.session_factory = session_factory
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.full_policy = full_policy
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retries = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+        self.last_error: Optional[str] = None
+
+    def start(self):
+        """Start the background flusher on the running event loop"""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, record: dict) -> bool:
+        """Queue one log row; returns False if it was dropped"""
+        if self._closing:
+            self.dropped += 1
+            return False
+        if self._task is None:
+            self.start()
+
+        if self.full_policy == "block":
+            await self._queue.put(record)
+        elif self._queue.full() and self.full_policy == "drop_new":
+            self.dropped += 1
+            return False
+        else:
+            if self._queue.full():
+                self._queue.get_nowait()
+                self.dropped += 1
+            self._queue.put_nowait(record)
+
+        self.enqueued += 1
+        return True
+
+    async def submit_many(self, records: List[dict]):
+        """Queue several log rows"""
+        for record in records:
+            await self.submit(record)
+
+    async def stop(self):
+        """Stop accepting rows, flush everything queued and wait for the flusher"""
+        if self._task is None:
+            return
+
+        self._closing = True
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            record = await self._queue.get()
+            if record is _STOP:
+                break
+
+            batch = [record]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                # Take whatever is already queued without waiting
+                if not self._queue.empty():
+                    record = self._queue.get_nowait()
+                else:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        record = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                if record is _STOP:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[dict]):
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._write_timed(batch)
+                self.written += len(batch)
+                return
+            except Exception as e:
+                self.last_error = str(e)
+                if attempt == self.max_retries:
+                    if len(batch) > 1 and not _database_unavailable(e):
+                        logger.warning("Failed to flush %d translation log rows %d times (%s); "
+                                       "writing them in parts", len(batch), attempt + 1, e)
+                        await self._flush_parts(batch)
+                    else:
+                        self.failed += len(batch)
+                        logger.exception("Dropping %d translation log rows after %d failed flushes",
+                                         len(batch), attempt + 1)
+                    return
+                delay = self.retry_delay * 2 ** attempt
+                self.retries += 1
+                logger.warning("Failed to flush %d translation log rows (%s); retrying in %.2fs",
+                               len(batch), e, delay)
+                await asyncio.sleep(delay)
+
+    async def _flush_parts(self, rows: List[dict]):
+        """Write each half of ``rows``, splitting further any half that fails"""
+        middle = len(rows) // 2
+        for part in (rows[:middle], rows[middle:]):
+            try:
+                await self._write_timed(part)
+                self.written += len(part)
+            except Exception as e:
+                self.last_error = str(e)
+                if len(part) > 1 and not _database_unavailable(e):
+                    await self._flush_parts(part)
+                else:
+                    self.failed += len(part)
+                    logger.error("Dropping %d translation log rows that could not be written: %s", len(part), e)
+
+    async def _write_timed(self, batch: List[dict]):
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(self._write, batch)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.flushes += 1
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self.total_flush_ms += elapsed_ms
+
+    def _write(self, batch: List[dict]):
+        db = self.session_factory()
+        try:
+            LoggingService(db).insert_log_records(batch)
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        """Queue depth, throughput and flush latency counters"""
+        return {
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'max_queue_size': self.max_queue_size,
+            'full_policy': self.full_policy,
+            'enqueued': self.enqueued,
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'retries': self.retries,
+            'flushes': self.flushes,
+            'last_flush_ms': self.last_flush_ms,
+            'max_flush_ms': self.max_flush_ms,
+            'avg_flush_ms': self.total_flush_ms / self.flushes if self.flushes else 0.0,
+            'last_error': self.last_error
+        }
+
+
+_log_writer: Optional[LogWriter] = None
+
+def init_log_writer() -> LogWriter:
+    """Create the application-wide log writer"""
+    global _log_writer
+    if _log_writer is None:
+        _log_writer = LogWriter(
+            max_queue_size=settings.LOG_QUEUE_MAX_SIZE,
+            batch_size=settings.LOG_BATCH_SIZE,
+            flush_interval=settings.LOG_FLUSH_INTERVAL_SECONDS,
+            full_policy=settings.LOG_QUEUE_FULL_POLICY,
+            max_retries=settings.LOG_FLUSH_MAX_RETRIES,
+            retry_delay=settings.LOG_FLUSH_RETRY_DELAY_SECONDS
+        )
+    return _log_writer
+
+def _collect_metrics():
+    """Queue and throughput counters of the application-wide log writer"""
+    writer = _log_writer
+    if writer is None:
+        return []
+    stats = writer.stats()
+    return [
+        ("log_writer_queue_depth", "gauge", "Log rows waiting to be written", [({}, stats['queue_depth'])]),
+        ("log_writer_rows", "counter", "Log rows by outcome", [
+            ({'outcome': outcome}, stats[outcome]) for outcome in ('written', 'dropped', 'failed')
+        ]),
+        ("log_writer_flushes", "counter", "Log batch flush attempts", [({}, stats['flushes'])]),
+        ("log_writer_flush_retries", "counter", "Log batch flushes retried after a failure", [({}, stats['retries'])]),
+    ]
+
+registry.register_collector(_collect_metrics)
+
+async def shutdown_log_writer():
+    """Drain and stop the application-wide log writer"""
+    global _log_writer
+    if _log_writer is not None:
+        await _log_writer.stop()
+        _log_writer = None
+
+def get_log_writer() -> LogWriter:
+    """Log writer dependency"""
+    return init_log_writer()
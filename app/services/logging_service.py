@@ -0,0 +1,230 @@
+import base64
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
+from datetime import datetime
+from sqlalchemy import Table, insert, or_, select, union_all
+from sqlalchemy.orm import Session, aliased
+from starlette.concurrency import run_in_threadpool
+from app.database import TranslationLog, TranslationText, insert_ignore, text_hash
+from app.core.exceptions import DatabaseException, ValidationException
+from app.services.metrics import DB_COMMIT_DURATION, DB_QUERY_DURATION
+from app.services.timing import span
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+def _insert_ignore(db: Session, model):
+    """INSERT that skips rows whose primary key already exists"""
+    return insert_ignore(db.get_bind().dialect.name, model)
+
+class LoggingService:
+    def __init__(self, db: Union[Session, "AsyncSession"]):
+        self.db = db
+    
+    @staticmethod
+    def build_log_record(translation_data: dict, user_agent: Optional[str] = None, ip_address: Optional[str] = None) -> dict:
+        """Build a translation_logs row from a translation result"""
+        return {
+            'translation_id': translation_data['translation_id'],
+            'original_text': translation_data['original_text'],
+            'translated_text': translation_data['translated_text'],
+            'source_language': translation_data['source_language'],
+            'target_language': translation_data['target_language'],
+            'created_at': datetime.utcnow(),
+            'user_agent': user_agent,
+            'ip_address': ip_address
+        }
+    
+    def log_translation(self, translation_data: dict, user_agent: Optional[str] = None, ip_address: Optional[str] = None):
+        """Log a single translation request"""
+        try:
+            self._insert_log_records([self.build_log_record(translation_data, user_agent, ip_address)])
+            
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseException(f"Failed to log translation: {str(e)}", "DB_LOG_ERROR")
+    
+    def log_bulk_translations(self, translations: List[dict], user_agent: Optional[str] = None, ip_address: Optional[str] = None):
+        """Log multiple translation requests"""
+        try:
+            self._insert_log_records([
+                self.build_log_record(translation, user_agent, ip_address)
+                for translation in translations
+                if translation.get('success', True)  # Only log successful translations
+            ])
+            
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseException(f"Failed to log bulk translations: {str(e)}", "DB_BULK_LOG_ERROR")
+    
+    def insert_log_records(self, records: List[dict]):
+        """Write prepared log rows in a single multi-row insert"""
+        try:
+            self._insert_log_records(records)
+            
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseException(f"Failed to insert log batch: {str(e)}", "DB_BATCH_LOG_ERROR")
+    
+    def _insert_log_records(self, records: List[dict]):
+        """
+        Resolve the batch's texts to content hashes, store any new texts once,
+        then insert the log rows referencing them, all in one transaction
+        """
+        if not records:
+            return
+        
+        with DB_COMMIT_DURATION.labels("insert_logs").time():
+            self._write_log_records(records)
+    
+    def _write_log_records(self, records: List[dict]):
+        texts = {}
+        rows = []
+        for record in records:
+            row = dict(record)
+            original_text = row.pop('original_text')
+            translated_text = row.pop('translated_text')
+            row['original_text_hash'] = text_hash(original_text)
+            row['translated_text_hash'] = text_hash(translated_text)
+            texts[row['original_text_hash']] = original_text
+            texts[row['translated_text_hash']] = translated_text
+            rows.append(row)
+        
+        existing = set(self.db.execute(
+            select(TranslationText.hash).where(TranslationText.hash.in_(list(texts)))
+        ).scalars())
+        missing = [{'hash': key, 'text': text} for key, text in texts.items() if key not in existing]
+        if missing:
+            self.db.execute(_insert_ignore(self.db, TranslationText), missing)
+        
+        self.db.execute(insert(TranslationLog), rows)
+        self.db.commit()
+    
+    @staticmethod
+    def encode_cursor(log: TranslationLog) -> str:
+        """Build an opaque pagination cursor pointing after ``log``"""
+        raw = f"{log.created_at.isoformat()}|{log.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """Decode a cursor produced by ``encode_cursor``"""
+        try:
+            created_at, log_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(created_at), int(log_id)
+        except Exception:
+            raise ValidationException("Invalid pagination cursor", "INVALID_CURSOR")
+    
+    @staticmethod
+    def _filter_conditions(target_language: Optional[str] = None, source_language: Optional[str] = None,
+                           start_time: Optional[datetime] = None, end_time: Optional[datetime] = None,
+                           entity=TranslationLog) -> list:
+        """Build WHERE conditions for the log filters that are set"""
+        conditions = []
+        if target_language:
+            conditions.append(entity.target_language == target_language)
+        if source_language:
+            conditions.append(entity.source_language == source_language)
+        if start_time:
+            conditions.append(entity.created_at >= start_time)
+        if end_time:
+            conditions.append(entity.created_at < end_time)
+        return conditions
+    
+    def _logs_statement(self, limit: int = 50, offset: int = 0, cursor: Optional[str] = None,
+                        target_language: Optional[str] = None, source_language: Optional[str] = None,
+                        start_time: Optional[datetime] = None, end_time: Optional[datetime] = None,
+                        archive_tables: Optional[List[Table]] = None):
+        """
+        Build the paginated, filtered logs query
+        
+        With ``archive_tables``, the hot table and those archives are queried
+        together as one ``UNION ALL``; archived rows keep their original ids so
+        cursors work across both.
+        """
+        entity = TranslationLog
+        if archive_tables:
+            columns = TranslationLog.__table__.columns
+            sources = [select(*columns)] + [select(*[table.c[column.name] for column in columns]) for table in archive_tables]
+            entity = aliased(TranslationLog, union_all(*sources).subquery("all_translation_logs"))
+        
+        statement = select(entity).filter(
+            *self._filter_conditions(target_language, source_language, start_time, end_time, entity=entity)
+        )
+        
+        if cursor:
+            cursor_created_at, cursor_id = self.decode_cursor(cursor)
+            # The redundant upper bound lets the planner use a range scan on the index
+            statement = statement.filter(
+                entity.created_at <= cursor_created_at,
+                or_(entity.created_at < cursor_created_at, entity.id < cursor_id)
+            )
+            offset = 0
+        
+        return statement.order_by(entity.created_at.desc(), entity.id.desc())\
+                        .offset(offset)\
+                        .limit(limit)
+    
+    def get_translation_logs(self, limit: int = 50, offset: int = 0, cursor: Optional[str] = None,
+                             target_language: Optional[str] = None, source_language: Optional[str] = None,
+                             start_time: Optional[datetime] = None, end_time: Optional[datetime] = None,
+                             archive_tables: Optional[List[Table]] = None) -> List[TranslationLog]:
+        """
+        Retrieve translation logs, newest first
+        
+        When ``cursor`` is given, rows strictly after it in ``(created_at, id)``
+        order are returned (keyset pagination) and ``offset`` is ignored.
+        Pass ``archive_tables`` to include archived rows.
+        """
+        statement = self._logs_statement(limit, offset, cursor, target_language, source_language,
+                                         start_time, end_time, archive_tables)
+        try:
+            with span("db"), DB_QUERY_DURATION.labels("get_logs").time():
+                return list(self.db.execute(statement).scalars().all())
+        except Exception as e:
+            raise DatabaseException(f"Failed to retrieve logs: {str(e)}", "DB_RETRIEVE_ERROR")
+    
+    async def fetch_translation_logs(self, **kwargs) -> List[TranslationLog]:
+        """
+        Async variant of ``get_translation_logs`` for request handlers
+        
+        Awaits the query on an ``AsyncSession``; with a regular ``Session`` the
+        query runs on the threadpool so it never blocks the event loop.
+        """
+        if isinstance(self.db, Session):
+            return await run_in_threadpool(self.get_translation_logs, **kwargs)
+        
+        statement = self._logs_statement(**kwargs)
+        try:
+            with span("db"), DB_QUERY_DURATION.labels("get_logs").time():
+                result = await self.db.execute(statement)
+                return list(result.scalars().all())
+        except Exception as e:
+            raise DatabaseException(f"Failed to retrieve logs: {str(e)}", "DB_RETRIEVE_ERROR")
+    
+    def iter_translation_logs(self, target_language: Optional[str] = None, source_language: Optional[str] = None,
+                              start_time: Optional[datetime] = None, end_time: Optional[datetime] = None,
+                              batch_size: int = 1000) -> Iterator[dict]:
+        """
+        Stream translation logs oldest first as plain dicts
+        
+        Rows are fetched through a server-side cursor ``batch_size`` at a time,
+        so memory stays flat however many rows match.
+        """
+        original = aliased(TranslationText)
+        translated = aliased(TranslationText)
+        columns = [
+            column for column in TranslationLog.__table__.columns
+            if column.name not in ('original_text_hash', 'translated_text_hash')
+        ]
+        statement = select(*columns, original.text.label('original_text'), translated.text.label('translated_text'))\
+            .join(original, original.hash == TranslationLog.original_text_hash)\
+            .join(translated, translated.hash == TranslationLog.translated_text_hash)\
+            .filter(*self._filter_conditions(target_language, source_language, start_time, end_time))\
+            .order_by(TranslationLog.created_at, TranslationLog.id)\
+            .execution_options(yield_per=batch_size)
+        
+        try:
+            for row in self.db.execute(statement).mappings():
+                yield dict(row)
+        except Exception as e:
+            raise DatabaseException(f"Failed to export logs: {str(e)}", "DB_EXPORT_ERROR")
@@ -0,0 +1,307 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# A collector returns (name, type, help, [(labels, value), ...]) families at scrape time
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Tuple[dict, float]]]]]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base for labelled metric families; children are created on first use"""
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self._new_child()
+
+    def labels(self, *values):
+        """Child for one combination of label values"""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _label_sets(self):
+        if not self.labelnames:
+            return [({}, self._default)]
+        return [(dict(zip(self.labelnames, values)), child) for values, child in list(self._children.items())]
+
+    def samples(self) -> List[Tuple[str, dict, float]]:
+        raise NotImplementedError
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def samples(self):
+        return [(f"{self.name}_total", labels, child.value) for labels, child in self._label_sets()]
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default.dec(amount)
+
+    def set(self, value: float):
+        self._default.set(value)
+
+    def samples(self):
+        return [(self.name, labels, child.value) for labels, child in self._label_sets()]
+
+
+class _HistogramValue:
+    __slots__ = ("upper_bounds", "counts", "sum", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self):
+        """Observe the duration of the ``with`` block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramValue(self.upper_bounds)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+    def samples(self):
+        samples = []
+        for labels, child in self._label_sets():
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for upper_bound, count in zip(self.upper_bounds + (float("inf"),), counts):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(upper_bound)}, cumulative))
+            samples.append((f"{self.name}_count", labels, cumulative))
+            samples.append((f"{self.name}_sum", labels, total))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    In-process metrics in the Prometheus text exposition format.
+
+    Recording is a dict lookup, a bisect and an uncontended lock, so it is
+    cheap enough to leave on under full load. Values owned by other services
+    (cache and log writer counters) are read by collectors at scrape time
+    instead of being recorded on the hot path.
+    """
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Collector):
+        """Add a callback producing metric families at scrape time"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Every metric in the Prometheus text format"""
+        lines = []
+        for metric in self._metrics.values():
+            family = f"{metric.name}_total" if metric.type == "counter" else metric.name
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for collector in self._collectors:
+            for name, metric_type, documentation, samples in collector():
+                family = f"{name}_total" if metric_type == "counter" else name
+                lines.append(f"# HELP {family} {documentation}")
+                lines.append(f"# TYPE {family} {metric_type}")
+                for labels, value in samples:
+                    lines.append(f"{family}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request count, latency and concurrency per route.
+
+    Requests are labelled with the matched route template (``/api/v1/translate``),
+    never the raw path, so label cardinality stays bounded. Streaming
+    responses are timed until the last chunk is sent.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the shared scope
+            route = getattr(scope.get("route"), "path", "<unmatched>")
+            HTTP_REQUEST_DURATION.labels(scope["method"], route).observe(elapsed)
+            HTTP_REQUESTS.labels(scope["method"], route, str(status)).inc()
+
+
+registry = MetricsRegistry()
+
+# HTTP
+HTTP_REQUESTS = registry.counter(
+    "http_requests", "HTTP requests handled", ["method", "route", "status"])
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route"])
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled")
+
+# Translation provider
+PROVIDER_REQUEST_DURATION = registry.histogram(
+    "translation_provider_request_duration_seconds", "Translation provider call latency",
+    ["provider", "target_language"])
+PROVIDER_ERRORS = registry.counter(
+    "translation_provider_errors", "Failed translation provider calls", ["provider", "target_language"])
+PROVIDER_FALLBACK_RESPONSES = registry.counter(
+    "translation_provider_fallback_responses", "Fallback translations served while the provider was unavailable",
+    ["provider", "target_language"])
+PROVIDER_IN_FLIGHT = registry.gauge(
+    "translation_provider_in_flight", "Translation provider calls in progress", ["provider"])
+TRANSLATED_CHARACTERS = registry.counter(
+    "translation_characters", "Characters of source text translated", ["target_language"])
+
+# Database
+DB_COMMIT_DURATION = registry.histogram(
+    "db_commit_duration_seconds", "Database write transaction latency", ["operation"])
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds", "Database query latency", ["operation"])
+
+# Admission control
+ADMISSION_REJECTED = registry.counter(
+    "admission_rejected_requests", "Requests shed by admission control", ["reason"])
+ADMISSION_QUEUE_WAIT = registry.histogram(
+    "admission_queue_wait_seconds", "Time requests spent waiting for admission",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+
+# Provider resilience
+PROVIDER_CIRCUIT_STATE = registry.gauge(
+    "translation_provider_circuit_state", "Provider circuit breaker state (0 closed, 1 half open, 2 open)",
+    ["provider"])
+PROVIDER_RESILIENCE_EVENTS = registry.counter(
+    "translation_provider_resilience_events", "Provider retries, hedges, fallbacks and rejections",
+    ["provider", "event"])
+
+# Translation memory
+TRANSLATION_MEMORY_LOOKUP_DURATION = registry.histogram(
+    "translation_memory_lookup_duration_seconds", "Translation memory lookup latency",
+    buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01))
@@ -0,0 +1,73 @@
+import asyncio
+import cProfile
+import logging
+import os
+import re
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class RequestProfilerMiddleware:
+    """
+    Opt-in ASGI middleware that profiles requests with cProfile and dumps
+    the stats to ``profile_dir`` for offline analysis (``python -m pstats``,
+    snakeviz, ...).
+
+    Every ``sample_rate``-th request under ``path_prefix`` is profiled and
+    kept. With ``slow_request_ms`` set, every request is a candidate and its
+    profile is also kept when it takes longer than the threshold; fast ones
+    are discarded. Only one request is profiled at a time, and the profile
+    includes whatever else the event loop ran meanwhile.
+    """
+    def __init__(self, app, profile_dir: str, sample_rate: int = 0, slow_request_ms: float = 0.0,
+                 path_prefix: str = "/api/v1"):
+        self.app = app
+        self.profile_dir = profile_dir
+        self.sample_rate = sample_rate
+        self.slow_request_ms = slow_request_ms
+        self.path_prefix = path_prefix
+        self._requests = 0
+        self._active = False
+        self.profiles_written = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        self._requests += 1
+        sampled = bool(self.sample_rate) and self._requests % self.sample_rate == 0
+        if self._active or not (sampled or self.slow_request_ms):
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self._active = False
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if sampled or elapsed_ms >= self.slow_request_ms:
+                await self._dump(profiler, scope, elapsed_ms, "sampled" if sampled else "slow")
+
+    async def _dump(self, profiler: cProfile.Profile, scope, elapsed_ms: float, reason: str):
+        route = getattr(scope.get("route"), "path", scope["path"])
+        name = _UNSAFE.sub("_", f"{datetime.utcnow():%Y%m%dT%H%M%S%f}_{reason}_{scope['method']}{route}_{elapsed_ms:.0f}ms")
+        path = os.path.join(self.profile_dir, f"{name}.prof")
+        try:
+            await asyncio.to_thread(self._write, profiler, path)
+            self.profiles_written += 1
+        except Exception:
+            logger.exception("Failed to write request profile %s", path)
+
+    def _write(self, profiler: cProfile.Profile, path: str):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        profiler.dump_stats(path)
@@ -0,0 +1,452 @@
+import asyncio
+import inspect
+import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Type
+
+import httpx
+
+from app.core.exceptions import TranslationAPIException
+from app.mock_translation import MOCK_LANGUAGES, PhraseIndex, mock_translator
+from app.utils.language_detection import detect_language, text_script
+
+
+class TranslationProvider:
+    """
+    Async translation backend.
+
+    Subclasses implement ``translate`` returning ``(translated_text, source_language)``
+    and release any resources in ``close``. Backends with a native multi-text
+    call override ``translate_batch``.
+
+    ``source_hints`` backends detect the source themselves when it is not
+    given, so a locally detected ``source_language`` saves them that work.
+    """
+    name = "base"
+    source_hints = True
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        raise NotImplementedError
+
+    async def translate_batch(self, texts: List[str], target_language: str,
+                              source_language: Optional[str] = None) -> list:
+        """
+        Translate several texts to one language
+
+        Returns one entry per text, in order: a ``(translated_text, source_language)``
+        tuple, or the exception raised for that text.
+        """
+        return await asyncio.gather(
+            *(self.translate(text, target_language, source_language) for text in texts),
+            return_exceptions=True
+        )
+
+    def stats(self) -> dict:
+        """Provider counters"""
+        return {'name': self.name}
+
+    async def close(self):
+        """Release provider resources"""
+        pass
+
+
+class ThreadPoolProvider(TranslationProvider):
+    """
+    Base for backends whose client blocks.
+
+    ``translate_sync`` runs on a bounded thread pool so a slow upstream call
+    never stalls the event loop.
+    """
+    def __init__(self, max_workers: int = 8):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{self.name}-provider")
+
+    def translate_sync(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        raise NotImplementedError
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            partial(self.translate_sync, text, target_language, source_language)
+        )
+
+    async def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def backend_name(provider: TranslationProvider) -> str:
+    """Name of the backend under any wrapping providers, for labelling its metrics"""
+    while isinstance(getattr(provider, 'provider', None), TranslationProvider):
+        provider = provider.provider
+    return provider.name
+
+
+class MockProvider(TranslationProvider):
+    """Dictionary-backed provider for demo purposes"""
+    name = "mock"
+
+    # Source languages of the phrase index's entries
+    SOURCE_LANGUAGES = ('en', *MOCK_LANGUAGES)
+    # Which of them a text is in, going by its script
+    SCRIPT_LANGUAGES = {"latin": "en", "devanagari": "hi", "tamil": "ta", "kannada": "kn", "bengali": "bn"}
+
+    def __init__(self, index: Optional[PhraseIndex] = None):
+        # The Flask demo's phrase index, so both mock paths translate alike
+        self.index = index if index is not None else mock_translator.index
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        return self.lookup(text, target_language, source_language)
+
+    async def translate_batch(self, texts: List[str], target_language: str,
+                              source_language: Optional[str] = None) -> list:
+        return [self.lookup(text, target_language, source_language) for text in texts]
+
+    def lookup(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        """Synchronous dictionary lookup, usable outside the event loop"""
+        if source_language is None:
+            # Route by the text's script; only text in another script needs full detection
+            script = text_script(text)
+            source_language = self.SCRIPT_LANGUAGES.get(script) if script is not None else 'en'
+            if source_language is None:
+                source_language = detect_language(text).language
+
+        # Only the dictionaries' own languages can match
+        if source_language in self.SOURCE_LANGUAGES:
+            translated_words, matched = self.index.translate_words(text.lower().split(), target_language)
+            if matched:
+                return " ".join(translated_words), source_language
+
+        # If no translation found, return a formatted response
+        return f"[{target_language.upper()}] {text}", source_language
+
+
+class FakeProvider(TranslationProvider):
+    """
+    Dictionary-backed provider with injectable latency and failures.
+
+    Stands in for a degrading upstream in load and resilience tests: every
+    call waits ``latency`` plus up to ``jitter`` seconds, a ``slow_rate``
+    fraction of calls wait ``slow_latency`` instead, and a ``failure_rate``
+    fraction raise. The attributes can be changed while it is in use to
+    simulate an outage starting or ending.
+    """
+    name = "fake"
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, slow_rate: float = 0.0,
+                 slow_latency: float = 1.0, failure_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.mock = MockProvider()
+        self.calls = 0
+        self.failures = 0
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        self.calls += 1
+        if self.random.random() < self.slow_rate:
+            delay = self.slow_latency
+        else:
+            delay = self.latency + self.random.uniform(0, self.jitter)
+        await asyncio.sleep(delay)
+        if self.random.random() < self.failure_rate:
+            self.failures += 1
+            raise TranslationAPIException("Fake provider failure", "FAKE_API_ERROR")
+        return self.mock.lookup(text, target_language, source_language)
+
+    def stats(self) -> dict:
+        return {'name': self.name, 'calls': self.calls, 'failures': self.failures}
+
+
+class GoogleTranslateProvider(ThreadPoolProvider):
+    """
+    googletrans backend.
+
+    Newer googletrans releases expose a coroutine ``Translator.translate`` which
+    is awaited directly; older releases block and run on the thread pool.
+    """
+    name = "googletrans"
+
+    def __init__(self, max_workers: int = 8, translator=None):
+        super().__init__(max_workers=max_workers)
+        if translator is None:
+            from googletrans import Translator
+            translator = Translator()
+        self.translator = translator
+        self.native_async = inspect.iscoroutinefunction(translator.translate)
+
+    def translate_sync(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        result = self.translator.translate(text, dest=target_language, src=source_language or 'auto')
+        return result.text, result.src
+
+    def translate_batch_sync(self, texts: List[str], target_language: str,
+                             source_language: Optional[str] = None) -> list:
+        results = self.translator.translate(texts, dest=target_language, src=source_language or 'auto')
+        return [(result.text, result.src) for result in results]
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        try:
+            if self.native_async:
+                result = await self.translator.translate(text, dest=target_language, src=source_language or 'auto')
+                return result.text, result.src
+            return await super().translate(text, target_language, source_language)
+        except Exception as e:
+            raise TranslationAPIException(f"Google Translate error: {str(e)}", "GOOGLE_API_ERROR")
+
+    async def translate_batch(self, texts: List[str], target_language: str,
+                              source_language: Optional[str] = None) -> list:
+        """One upstream call for the whole list, using googletrans' list form"""
+        try:
+            if self.native_async:
+                results = await self.translator.translate(texts, dest=target_language, src=source_language or 'auto')
+                return [(result.text, result.src) for result in results]
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor,
+                partial(self.translate_batch_sync, texts, target_language, source_language)
+            )
+        except Exception as e:
+            error = TranslationAPIException(f"Google Translate error: {str(e)}", "GOOGLE_API_ERROR")
+            return [error] * len(texts)
+
+    async def close(self):
+        client = getattr(self.translator, 'client', None)
+        if client is not None:
+            if hasattr(client, 'aclose'):
+                await client.aclose()
+            else:
+                client.close()
+        await super().close()
+
+
+class HTTPTranslationProvider(TranslationProvider):
+    """
+    Generic JSON-over-HTTP backend using a pooled keep-alive async client.
+
+    Sends ``{"text", "target_language", "source_language"}`` to ``url`` and
+    expects ``{"translated_text", "source_language"}`` back.
+    """
+    name = "http"
+
+    def __init__(self, url: str, api_key: Optional[str] = None, timeout: float = 10.0,
+                 max_connections: int = 100, max_keepalive_connections: int = 20,
+                 client: Optional[httpx.AsyncClient] = None):
+        if not url:
+            raise TranslationAPIException("TRANSLATION_HTTP_URL is not configured", "TRANSLATOR_ERROR")
+
+        self.url = url
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.client = client or httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        try:
+            response = await self.client.post(self.url, json={
+                "text": text,
+                "target_language": target_language,
+                "source_language": source_language
+            })
+            response.raise_for_status()
+            data = response.json()
+            return data["translated_text"], data.get("source_language") or source_language or "unknown"
+        except Exception as e:
+            raise TranslationAPIException(f"HTTP translation error: {str(e)}", "HTTP_API_ERROR")
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class _PendingBatch:
+    __slots__ = ("texts", "futures", "enqueued_at", "timer")
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self.futures: List[asyncio.Future] = []
+        self.enqueued_at: List[float] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatchingProvider(TranslationProvider):
+    """
+    Aggregates single-text calls into batched upstream calls.
+
+    Calls are grouped by language pair. A group is sent to the wrapped
+    provider's ``translate_batch`` once ``max_batch_size`` texts are waiting
+    or ``window`` seconds after its first text arrived, whichever comes first,
+    and the results are handed back to each waiting caller.
+
+    A longer window makes larger batches (fewer, cheaper upstream calls per
+    text) at the cost of up to ``window`` extra latency; ``stats`` reports
+    both sides of that trade-off.
+    """
+    name = "batching"
+
+    def __init__(self, provider: TranslationProvider, window: float = 0.005, max_batch_size: int = 50):
+        self.provider = provider
+        self.source_hints = provider.source_hints
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[tuple, _PendingBatch] = {}
+        self._in_flight = set()
+
+        self.requests = 0
+        self.batches = 0
+        self.full_flushes = 0
+        self.max_seen_batch = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.total_upstream_ms = 0.0
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        loop = asyncio.get_running_loop()
+        key = (target_language, source_language)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch()
+            batch.timer = loop.call_later(self.window, self._flush, key)
+
+        future = loop.create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        batch.enqueued_at.append(loop.time())
+        self.requests += 1
+
+        if len(batch.texts) >= self.max_batch_size:
+            self.full_flushes += 1
+            self._flush(key)
+        return await future
+
+    async def translate_batch(self, texts: List[str], target_language: str,
+                              source_language: Optional[str] = None) -> list:
+        return await self.provider.translate_batch(texts, target_language, source_language)
+
+    def _flush(self, key: tuple):
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        task = asyncio.ensure_future(self._send(key, batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, key: tuple, batch: _PendingBatch):
+        loop = asyncio.get_running_loop()
+        sent_at = loop.time()
+        waits = [(sent_at - enqueued_at) * 1000 for enqueued_at in batch.enqueued_at]
+        self.batches += 1
+        self.max_seen_batch = max(self.max_seen_batch, len(batch.texts))
+        self.total_wait_ms += sum(waits)
+        self.max_wait_ms = max(self.max_wait_ms, max(waits))
+
+        target_language, source_language = key
+        try:
+            outcomes = await self.provider.translate_batch(batch.texts, target_language, source_language)
+        except Exception as e:
+            outcomes = [e] * len(batch.texts)
+        finally:
+            self.total_upstream_ms += (loop.time() - sent_at) * 1000
+
+        for future, outcome in zip(batch.futures, outcomes):
+            if future.done():
+                continue  # caller went away
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    def stats(self) -> dict:
+        """Batch size, queueing delay and upstream call counters"""
+        return {
+            'name': self.name,
+            'provider': self.provider.stats(),
+            'window_ms': self.window * 1000,
+            'max_batch_size': self.max_batch_size,
+            'requests': self.requests,
+            'batches': self.batches,
+            'full_flushes': self.full_flushes,
+            'avg_batch_size': self.requests_sent / self.batches if self.batches else 0.0,
+            'max_seen_batch': self.max_seen_batch,
+            'avg_wait_ms': self.total_wait_ms / self.requests_sent if self.requests_sent else 0.0,
+            'max_wait_ms': self.max_wait_ms,
+            'avg_upstream_ms': self.total_upstream_ms / self.batches if self.batches else 0.0
+        }
+
+    @property
+    def requests_sent(self) -> int:
+        return self.requests - sum(len(batch.texts) for batch in self._pending.values())
+
+    async def close(self):
+        for key in list(self._pending):
+            self._flush(key)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        await self.provider.close()
+
+
+PROVIDERS: Dict[str, Type[TranslationProvider]] = {
+    MockProvider.name: MockProvider,
+    FakeProvider.name: FakeProvider,
+    GoogleTranslateProvider.name: GoogleTranslateProvider,
+    HTTPTranslationProvider.name: HTTPTranslationProvider,
+}
+
+def create_provider(settings) -> TranslationProvider:
+    """
+    Build the provider selected by ``settings.TRANSLATION_PROVIDER``.
+
+    Remote backends are wrapped in a ``ResilientProvider`` when
+    ``PROVIDER_RESILIENCE_ENABLED`` is set, and the result in a
+    ``MicroBatchingProvider`` when ``PROVIDER_BATCHING_ENABLED`` is set, so
+    each batch is one call through the circuit breaker.
+    """
+    provider = _create_backend(settings)
+    if settings.PROVIDER_RESILIENCE_ENABLED and provider.name != MockProvider.name:
+        from app.services.resilience import create_resilient_provider
+        provider = create_resilient_provider(provider, settings)
+    if settings.PROVIDER_BATCHING_ENABLED:
+        return MicroBatchingProvider(
+            provider,
+            window=settings.PROVIDER_BATCH_WINDOW_MS / 1000,
+            max_batch_size=settings.PROVIDER_BATCH_MAX_SIZE
+        )
+    return provider
+
+def _create_backend(settings) -> TranslationProvider:
+    name = settings.TRANSLATION_PROVIDER
+    if name is None:
+        name = MockProvider.name if settings.USE_MOCK_TRANSLATION else GoogleTranslateProvider.name
+
+    if name == MockProvider.name:
+        return MockProvider()
+    if name == FakeProvider.name:
+        return FakeProvider(
+            latency=settings.FAKE_PROVIDER_LATENCY_MS / 1000,
+            jitter=settings.FAKE_PROVIDER_JITTER_MS / 1000,
+            slow_rate=settings.FAKE_PROVIDER_SLOW_RATE,
+            slow_latency=settings.FAKE_PROVIDER_SLOW_LATENCY_MS / 1000,
+            failure_rate=settings.FAKE_PROVIDER_FAILURE_RATE
+        )
+    if name == GoogleTranslateProvider.name:
+        return GoogleTranslateProvider(max_workers=settings.PROVIDER_THREAD_POOL_SIZE)
+    if name == HTTPTranslationProvider.name:
+        return HTTPTranslationProvider(
+            url=settings.TRANSLATION_HTTP_URL,
+            api_key=settings.TRANSLATION_HTTP_API_KEY,
+            timeout=settings.TRANSLATION_HTTP_TIMEOUT_SECONDS,
+            max_connections=settings.TRANSLATION_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.TRANSLATION_HTTP_MAX_KEEPALIVE
+        )
+
+    raise TranslationAPIException(
+        f"Unknown translation provider: {name} (expected one of {', '.join(sorted(PROVIDERS))})",
+        "TRANSLATOR_ERROR"
+    )
@@ -0,0 +1,409 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+import httpx
+
+from app.core.exceptions import TranslationAPIException, TranslationServiceException
+from app.services.metrics import PROVIDER_CIRCUIT_STATE, PROVIDER_RESILIENCE_EVENTS
+from app.services.providers import MockProvider, TranslationProvider
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+_CIRCUIT_STATE_VALUES = {CIRCUIT_CLOSED: 0, CIRCUIT_HALF_OPEN: 1, CIRCUIT_OPEN: 2}
+
+# Error codes of failures worth repeating; providers wrap the upstream error,
+# so the wrapped cause is examined too
+TRANSIENT_ERROR_CODES = {"PROVIDER_TIMEOUT", "FAKE_API_ERROR"}
+
+
+class DegradedTranslation(tuple):
+    """A fallback ``(translated_text, source_language)`` result that must not be cached"""
+    degraded = True
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Whether a failed call may succeed if made again: timeouts, connection
+    errors and 5xx or 429 responses. A 4xx answer or a malformed response
+    would fail the same way every time.
+    """
+    while error is not None:
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status >= 500 or status == 429
+        if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError, httpx.TransportError)):
+            return True
+        if isinstance(error, TranslationServiceException) and error.error_code in TRANSIENT_ERROR_CODES:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker over the last ``window`` calls.
+
+    Calls that fail or take longer than ``slow_call`` seconds count as
+    failures. Once at least ``min_calls`` outcomes are known and the failure
+    ratio reaches ``failure_ratio`` the circuit opens and rejects calls for
+    ``open_duration`` seconds. It then lets ``half_open_calls`` probes
+    through: if they all succeed it closes, and any failure reopens it.
+    """
+    def __init__(self, failure_ratio: float = 0.5, window: int = 50, min_calls: int = 20,
+                 slow_call: float = 3.0, open_duration: float = 10.0, half_open_calls: int = 3,
+                 name: str = "provider"):
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.slow_call = slow_call
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.name = name
+        self.state = CIRCUIT_CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._failures = 0
+        self._changed_at = time.monotonic()
+        self._probes = 0
+        self._probe_successes = 0
+        self.opened = 0
+        self.rejected = 0
+        PROVIDER_CIRCUIT_STATE.labels(name).set(_CIRCUIT_STATE_VALUES[self.state])
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now"""
+        if self.state == CIRCUIT_CLOSED:
+            return True
+
+        now = time.monotonic()
+        if self.state == CIRCUIT_OPEN:
+            if now - self._changed_at < self.open_duration:
+                self.rejected += 1
+                return False
+            self._transition(CIRCUIT_HALF_OPEN)
+
+        # Half open; probes that never reported back are written off after a while
+        if self._probes >= self.half_open_calls and now - self._changed_at >= self.open_duration:
+            self._changed_at = now
+            self._probes = self._probe_successes = 0
+        if self._probes < self.half_open_calls:
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record(self, success: bool, elapsed: float):
+        """Report the outcome of a call that was allowed through"""
+        failed = not success or elapsed >= self.slow_call
+        if self.state == CIRCUIT_HALF_OPEN:
+            if failed:
+                self._transition(CIRCUIT_OPEN)
+            else:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_calls:
+                    self._transition(CIRCUIT_CLOSED)
+            return
+        if self.state == CIRCUIT_OPEN:
+            return  # a call that started before the circuit opened
+
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(failed)
+        self._failures += failed
+        if len(self._outcomes) >= self.min_calls and self._failures >= self.failure_ratio * len(self._outcomes):
+            self._transition(CIRCUIT_OPEN)
+
+    def _transition(self, state: str):
+        self.state = state
+        self._changed_at = time.monotonic()
+        self._probes = self._probe_successes = 0
+        if state == CIRCUIT_OPEN:
+            self.opened += 1
+        elif state == CIRCUIT_CLOSED:
+            self._outcomes.clear()
+            self._failures = 0
+        PROVIDER_CIRCUIT_STATE.labels(self.name).set(_CIRCUIT_STATE_VALUES[state])
+
+    def stats(self) -> dict:
+        return {
+            'state': self.state,
+            'recent_calls': len(self._outcomes),
+            'recent_failures': self._failures,
+            'opened': self.opened,
+            'rejected': self.rejected,
+        }
+
+
+class RetryBudget:
+    """
+    Token bucket capping retries and hedges to a fraction of traffic.
+
+    Every request deposits ``ratio`` tokens and every extra attempt costs
+    one; the bucket starts full and holds at most ``reserve`` tokens. Beyond
+    that initial burst, retries add at most ``ratio`` load on top of normal
+    traffic instead of multiplying it while the upstream is struggling.
+    """
+    def __init__(self, ratio: float = 0.1, reserve: int = 10):
+        self.ratio = ratio
+        self.reserve = reserve
+        self.tokens = float(reserve)
+        self.exhausted = 0
+
+    def deposit(self):
+        self.tokens = min(self.tokens + self.ratio, float(self.reserve))
+
+    def withdraw(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        self.exhausted += 1
+        return False
+
+
+class LatencyTracker:
+    """Percentiles of recent successful call latencies"""
+    def __init__(self, window: int = 256, refresh_every: int = 32):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._refresh_every = refresh_every
+        self._since_refresh = 0
+        self._sorted: List[float] = []
+
+    def observe(self, seconds: float):
+        self._samples.append(seconds)
+        self._since_refresh += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency at ``pct``, or None until enough samples are collected"""
+        if len(self._samples) < self._refresh_every:
+            return None
+        if self._since_refresh >= self._refresh_every or not self._sorted:
+            self._sorted = sorted(self._samples)
+            self._since_refresh = 0
+        index = min(len(self._sorted) - 1, int(len(self._sorted) * pct / 100))
+        return self._sorted[index]
+
+
+class ResilientProvider(TranslationProvider):
+    """
+    Wraps a remote provider so its failures and slowdowns stay contained.
+
+    - Each attempt is bounded by ``attempt_timeout``.
+    - A ``CircuitBreaker`` stops calling an upstream that keeps failing or
+      timing out; while it is open, calls go to ``fallback`` (dictionary
+      translations, not cached) or fail fast with ``PROVIDER_UNAVAILABLE``.
+    - A call still running after the ``hedge_percentile`` latency of recent
+      calls is hedged with a second attempt, and the first success wins.
+    - Attempts that failed transiently (see ``is_transient``) are retried
+      up to ``max_retries`` times after a full-jitter exponential backoff.
+      Other errors, such as a 4xx answer, are raised at once and do not
+      count against the circuit: the upstream is up, the request is bad.
+
+    Hedges and retries draw on a shared ``RetryBudget``.
+    """
+    name = "resilient"
+
+    def __init__(self, provider: TranslationProvider, breaker: Optional[CircuitBreaker] = None,
+                 budget: Optional[RetryBudget] = None, fallback: Optional[TranslationProvider] = None,
+                 attempt_timeout: float = 5.0, max_retries: int = 2, retry_base_delay: float = 0.05,
+                 retry_max_delay: float = 1.0, hedging: bool = True, hedge_percentile: float = 95.0,
+                 hedge_min_delay: float = 0.02):
+        self.provider = provider
+        self.source_hints = provider.source_hints
+        self.breaker = breaker or CircuitBreaker(name=provider.name)
+        self.budget = budget or RetryBudget()
+        self.fallback = fallback
+        self.attempt_timeout = attempt_timeout
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.hedging = hedging
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.latencies = LatencyTracker()
+
+        self.requests = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.fallbacks = 0
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
+        self.requests += 1
+        if not self.breaker.allow():
+            return await self._unavailable(text, target_language, source_language)
+
+        self.budget.deposit()
+        retries = 0
+        while True:
+            try:
+                return await self._hedged(text, target_language, source_language)
+            except Exception as e:
+                if retries >= self.max_retries or not is_transient(e):
+                    raise
+                if not self.breaker.allow():
+                    return await self._unavailable(text, target_language, source_language)
+                if not self.budget.withdraw():
+                    self._event("budget_exhausted")
+                    raise
+            retries += 1
+            self.retries += 1
+            self._event("retry")
+            cap = min(self.retry_max_delay, self.retry_base_delay * 2 ** retries)
+            await asyncio.sleep(random.uniform(0, cap))
+
+    async def translate_batch(self, texts: List[str], target_language: str,
+                              source_language: Optional[str] = None) -> list:
+        """One upstream batch call through the breaker; no hedging or retries"""
+        self.requests += 1
+        if not self.breaker.allow():
+            if self.fallback is None:
+                return [self._unavailable_error()] * len(texts)
+            self.fallbacks += len(texts)
+            self._event("fallback", len(texts))
+            outcomes = await self.fallback.translate_batch(texts, target_language, source_language)
+            return [DegradedTranslation(outcome) if isinstance(outcome, tuple) else outcome for outcome in outcomes]
+
+        start = time.perf_counter()
+        try:
+            outcomes = await asyncio.wait_for(
+                self.provider.translate_batch(texts, target_language, source_language), self.attempt_timeout
+            )
+        except Exception as e:
+            self.breaker.record(not is_transient(e), time.perf_counter() - start)
+            return [e] * len(texts)
+        failed = all(isinstance(outcome, BaseException) and is_transient(outcome) for outcome in outcomes)
+        self.breaker.record(not failed, time.perf_counter() - start)
+        return outcomes
+
+    async def _attempt(self, text: str, target_language: str, source_language: Optional[str]) -> tuple:
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                self.provider.translate(text, target_language, source_language), self.attempt_timeout
+            )
+        except asyncio.CancelledError:
+            raise  # a losing hedge; says nothing about upstream health
+        except asyncio.TimeoutError:
+            self.breaker.record(False, time.perf_counter() - start)
+            raise TranslationAPIException(
+                f"{self.provider.name} provider timed out after {self.attempt_timeout:g}s", "PROVIDER_TIMEOUT"
+            )
+        except Exception as e:
+            self.breaker.record(not is_transient(e), time.perf_counter() - start)
+            raise
+        elapsed = time.perf_counter() - start
+        self.breaker.record(True, elapsed)
+        self.latencies.observe(elapsed)
+        return result
+
+    async def _hedged(self, text: str, target_language: str, source_language: Optional[str]) -> tuple:
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._attempt(text, target_language, source_language)
+
+        primary = asyncio.ensure_future(self._attempt(text, target_language, source_language))
+        attempts = {primary}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if done or self.breaker.state != CIRCUIT_CLOSED or not self.budget.withdraw():
+                return await primary
+
+            hedge = asyncio.ensure_future(self._attempt(text, target_language, source_language))
+            attempts.add(hedge)
+            self.hedges += 1
+            self._event("hedge")
+            error = None
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is hedge:
+                            self.hedge_wins += 1
+                            self._event("hedge_win")
+                        return attempt.result()
+                    error = attempt.exception()
+                    if not is_transient(error):
+                        # The other attempt would be turned down the same way
+                        raise error
+            raise error
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+    def _hedge_delay(self) -> Optional[float]:
+        if not self.hedging:
+            return None
+        latency = self.latencies.percentile(self.hedge_percentile)
+        if latency is None:
+            return None
+        return max(latency, self.hedge_min_delay)
+
+    async def _unavailable(self, text: str, target_language: str, source_language: Optional[str]) -> tuple:
+        if self.fallback is None:
+            self._event("rejected")
+            raise self._unavailable_error()
+        self.fallbacks += 1
+        self._event("fallback")
+        return DegradedTranslation(await self.fallback.translate(text, target_language, source_language))
+
+    def _unavailable_error(self) -> TranslationAPIException:
+        return TranslationAPIException(
+            f"{self.provider.name} provider unavailable (circuit open)", "PROVIDER_UNAVAILABLE"
+        )
+
+    def _event(self, event: str, amount: int = 1):
+        PROVIDER_RESILIENCE_EVENTS.labels(self.provider.name, event).inc(amount)
+
+    def stats(self) -> dict:
+        """Breaker state and retry, hedge and fallback counters"""
+        return {
+            'name': self.name,
+            'provider': self.provider.stats(),
+            'circuit': self.breaker.stats(),
+            'requests': self.requests,
+            'retries': self.retries,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+            'hedge_delay_ms': (self._hedge_delay() or 0.0) * 1000,
+            'fallbacks': self.fallbacks,
+            'retry_budget_tokens': self.budget.tokens,
+            'retry_budget_exhausted': self.budget.exhausted,
+        }
+
+    async def close(self):
+        await self.provider.close()
+        if self.fallback is not None:
+            await self.fallback.close()
+
+
+def create_resilient_provider(provider: TranslationProvider, settings) -> ResilientProvider:
+    """Wrap ``provider`` according to the PROVIDER_* resilience settings"""
+    return ResilientProvider(
+        provider,
+        breaker=CircuitBreaker(
+            failure_ratio=settings.PROVIDER_CIRCUIT_FAILURE_RATIO,
+            window=settings.PROVIDER_CIRCUIT_WINDOW,
+            min_calls=settings.PROVIDER_CIRCUIT_MIN_CALLS,
+            slow_call=settings.PROVIDER_CIRCUIT_SLOW_CALL_MS / 1000,
+            open_duration=settings.PROVIDER_CIRCUIT_OPEN_SECONDS,
+            half_open_calls=settings.PROVIDER_CIRCUIT_HALF_OPEN_CALLS,
+            name=provider.name
+        ),
+        budget=RetryBudget(
+            ratio=settings.PROVIDER_RETRY_BUDGET_RATIO,
+            reserve=settings.PROVIDER_RETRY_BUDGET_RESERVE
+        ),
+        fallback=MockProvider() if settings.PROVIDER_FALLBACK_TO_MOCK else None,
+        attempt_timeout=settings.PROVIDER_ATTEMPT_TIMEOUT_SECONDS,
+        max_retries=settings.PROVIDER_MAX_RETRIES,
+        retry_base_delay=settings.PROVIDER_RETRY_BASE_DELAY_MS / 1000,
+        retry_max_delay=settings.PROVIDER_RETRY_MAX_DELAY_MS / 1000,
+        hedging=settings.PROVIDER_HEDGING_ENABLED,
+        hedge_percentile=settings.PROVIDER_HEDGE_PERCENTILE,
+        hedge_min_delay=settings.PROVIDER_HEDGE_MIN_DELAY_MS / 1000
+    )
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Column, Index, MetaData, Table, delete, func, inspect, select
+
+from app.config import get_settings
+from app.database import TranslationLog, engine as default_engine
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ARCHIVE_PREFIX = "translation_logs_archive_"
+ARCHIVE_GRANULARITIES = ("day", "month")
+_ARCHIVE_NAME = re.compile(rf"^{ARCHIVE_PREFIX}(\d{{4}})_(\d{{2}})(?:_(\d{{2}}))?$")
+
+archive_metadata = MetaData()
+
+
+def period_bounds(moment: datetime, granularity: str) -> Tuple[datetime, datetime]:
+    """Return the [start, end) of the day or month containing ``moment``"""
+    if granularity == "day":
+        start = datetime(moment.year, moment.month, moment.day)
+        return start, start + timedelta(days=1)
+
+    start = datetime(moment.year, moment.month, 1)
+    if moment.month == 12:
+        return start, datetime(moment.year + 1, 1, 1)
+    return start, datetime(moment.year, moment.month + 1, 1)
+
+
+def archive_table_name(period_start: datetime, granularity: str) -> str:
+    if granularity == "day":
+        return f"{ARCHIVE_PREFIX}{period_start:%Y_%m_%d}"
+    return f"{ARCHIVE_PREFIX}{period_start:%Y_%m}"
+
+
+def archive_table(name: str) -> Table:
+    """
+    Table object for an archive partition.
+
+    Archives mirror ``translation_logs`` but carry a single (created_at, id)
+    index instead of the hot table's unique and language indexes.
+    """
+    if name in archive_metadata.tables:
+        return archive_metadata.tables[name]
+
+    columns = [
+        Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+        for column in TranslationLog.__table__.columns
+    ]
+    return Table(name, archive_metadata, *columns, Index(f"idx_{name}_created_at_id", "created_at", "id"))
+
+
+def list_archive_tables(bind=None) -> Dict[str, Tuple[datetime, datetime]]:
+    """Map each existing archive table name to the [start, end) period it holds"""
+    tables = {}
+    for name in inspect(bind or default_engine).get_table_names():
+        match = _ARCHIVE_NAME.match(name)
+        if not match:
+            continue
+        year, month, day = match.groups()
+        if day:
+            tables[name] = period_bounds(datetime(int(year), int(month), int(day)), "day")
+        else:
+            tables[name] = period_bounds(datetime(int(year), int(month), 1), "month")
+    return tables
+
+
+def archive_tables_for_range(start_time: Optional[datetime] = None, end_time: Optional[datetime] = None,
+                             bind=None) -> List[Table]:
+    """Archive tables whose period overlaps [start_time, end_time), newest first"""
+    overlapping = [
+        (period_start, name)
+        for name, (period_start, period_end) in list_archive_tables(bind).items()
+        if (end_time is None or period_start < end_time) and (start_time is None or period_end > start_time)
+    ]
+    return [archive_table(name) for _, name in sorted(overlapping, reverse=True)]
+
+
+class RetentionService:
+    """
+    Moves translation logs older than the retention window into archive tables.
+
+    Rows are rolled into one ``translation_logs_archive_YYYY_MM[_DD]`` table
+    per day or month, in chunks of ``batch_size`` rows per transaction, so the
+    hot table and its indexes stay bounded by the retention window.
+    """
+    def __init__(self, bind=None, retention_days: int = 30, granularity: str = "month", batch_size: int = 10000):
+        if granularity not in ARCHIVE_GRANULARITIES:
+            raise ValueError(f"Unknown archive granularity: {granularity}")
+
+        self.bind = bind or default_engine
+        self.retention_days = retention_days
+        self.granularity = granularity
+        self.batch_size = batch_size
+
+        self.runs = 0
+        self.archived_rows = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_run_ms = 0.0
+        self.last_error: Optional[str] = None
+
+    def archive_expired(self, now: Optional[datetime] = None) -> int:
+        """Archive every row created before the retention cutoff; returns rows moved"""
+        cutoff = (now or datetime.utcnow()) - timedelta(days=self.retention_days)
+        started = datetime.utcnow()
+        moved = 0
+
+        while True:
+            # Jump straight to the next period that still has expired rows
+            with self.bind.connect() as connection:
+                oldest = connection.execute(
+                    select(func.min(TranslationLog.created_at)).where(TranslationLog.created_at < cutoff)
+                ).scalar()
+            if oldest is None:
+                break
+
+            period_start, period_end = period_bounds(oldest, self.granularity)
+            moved += self._archive_period(period_start, min(period_end, cutoff))
+
+        self.runs += 1
+        self.archived_rows += moved
+        self.last_run_at = started
+        self.last_run_ms = (datetime.utcnow() - started).total_seconds() * 1000
+        return moved
+
+    def _archive_period(self, period_start: datetime, period_end: datetime) -> int:
+        table = archive_table(archive_table_name(period_start, self.granularity))
+        table.create(bind=self.bind, checkfirst=True)
+
+        columns = [column.name for column in TranslationLog.__table__.columns]
+        in_period = (TranslationLog.created_at >= period_start, TranslationLog.created_at < period_end)
+        moved = 0
+
+        while True:
+            with self.bind.begin() as connection:
+                # Upper id bound for this chunk; None means the rest of the period fits
+                boundary = connection.execute(
+                    select(TranslationLog.id).where(*in_period)
+                    .order_by(TranslationLog.id).offset(self.batch_size - 1).limit(1)
+                ).scalar()
+                chunk = in_period if boundary is None else (*in_period, TranslationLog.id <= boundary)
+
+                connection.execute(table.insert().from_select(
+                    columns, select(*TranslationLog.__table__.columns).where(*chunk)
+                ))
+                moved += connection.execute(delete(TranslationLog).where(*chunk)).rowcount
+
+            if boundary is None:
+                return moved
+
+    def stats(self) -> dict:
+        """Retention run counters"""
+        return {
+            'retention_days': self.retention_days,
+            'granularity': self.granularity,
+            'runs': self.runs,
+            'archived_rows': self.archived_rows,
+            'archive_tables': len(list_archive_tables(self.bind)),
+            'last_run_at': self.last_run_at,
+            'last_run_ms': self.last_run_ms,
+            'last_error': self.last_error
+        }
+
+
+class RetentionScheduler:
+    """Runs ``RetentionService.archive_expired`` on a worker thread at a fixed interval"""
+    def __init__(self, service: RetentionService, interval: float = 3600):
+        self.service = service
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.service.archive_expired)
+            except Exception as e:
+                self.service.last_error = str(e)
+                logger.exception("Translation log retention run failed")
+            await asyncio.sleep(self.interval)
+
+
+_retention_scheduler: Optional[RetentionScheduler] = None
+
+def init_retention_scheduler() -> Optional[RetentionScheduler]:
+    """Start background archiving when LOG_RETENTION_ENABLED is set"""
+    global _retention_scheduler
+    if _retention_scheduler is None and settings.LOG_RETENTION_ENABLED:
+        service = RetentionService(
+            retention_days=settings.LOG_RETENTION_DAYS,
+            granularity=settings.LOG_ARCHIVE_GRANULARITY,
+            batch_size=settings.LOG_ARCHIVE_BATCH_SIZE
+        )
+        _retention_scheduler = RetentionScheduler(service, interval=settings.LOG_RETENTION_INTERVAL_SECONDS)
+        _retention_scheduler.start()
+    return _retention_scheduler
+
+async def shutdown_retention_scheduler():
+    """Stop background archiving"""
+    global _retention_scheduler
+    if _retention_scheduler is not None:
+        await _retention_scheduler.stop()
+        _retention_scheduler = None
@@ -0,0 +1,110 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+# Stage descriptions sent with the Server-Timing header
+STAGE_DESCRIPTIONS = {
+    "parse": "routing, body parsing and validation",
+    "cache": "translation cache lookup",
+    "memory": "translation memory lookup",
+    "provider": "translation provider calls",
+    "log": "queueing translation logs",
+    "db": "database queries",
+    "encode": "response serialization",
+}
+
+
+class RequestTimings:
+    """Durations of the stages of one request, summed per stage"""
+    __slots__ = ("started", "_last_mark", "durations", "counts")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last_mark = self.started
+        self.durations: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, stage: str, seconds: float):
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    def mark(self, stage: str):
+        """Attribute the time since the previous mark (or request start) to ``stage``"""
+        now = time.perf_counter()
+        self.add(stage, now - self._last_mark)
+        self._last_mark = now
+
+    def header(self) -> str:
+        """Server-Timing header value, ending with the total so far"""
+        entries = []
+        for stage, seconds in self.durations.items():
+            entry = f"{stage};dur={seconds * 1000:.3f}"
+            description = STAGE_DESCRIPTIONS.get(stage)
+            if self.counts[stage] > 1:
+                description = f"{description or stage} ({self.counts[stage]} calls)"
+            if description:
+                entry += f';desc="{description}"'
+            entries.append(entry)
+        entries.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.3f}")
+        return ", ".join(entries)
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+def current_timings() -> Optional[RequestTimings]:
+    """Timings of the request being handled, if it is being timed"""
+    return _current_timings.get()
+
+@contextmanager
+def span(stage: str):
+    """Add the duration of the ``with`` block to ``stage`` of the current request"""
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(stage, time.perf_counter() - start)
+
+def mark(stage: str):
+    """Close ``stage`` of the current request at this point"""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.mark(stage)
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware that times requests under ``path_prefix`` and reports
+    their stages in a ``Server-Timing`` response header.
+
+    Code on the request path records stages with ``span``/``mark``; they are
+    no-ops outside a timed request. Streaming responses report the stages
+    finished before the first byte.
+    """
+    def __init__(self, app, path_prefix: str = "/api/v1"):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.header().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = _current_timings.set(timings)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_timings.reset(token)
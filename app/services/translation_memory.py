@@ -0,0 +1,413 @@
+import asyncio
+import heapq
+import logging
+import random
+import re
+import string
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from app.config import get_settings
+from app.database import SessionLocal, TranslationLog, TranslationText
+from app.services.metrics import TRANSLATION_MEMORY_LOOKUP_DURATION, registry
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_WHITESPACE = re.compile(r"\s+")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+# Stripped from the ends of words before comparing them; "#" marks a number
+_PUNCTUATION = "".join(char for char in string.punctuation if char != "#") + "।॥…“”‘’«»¿¡、。，！？"
+_HASH_MASK = (1 << 64) - 1
+_EMPTY = 1 << 64
+_ROTATION_OFFSET = 1 << 56
+
+# Lookup cost bounds: buckets holding more entries are ignored, and at most
+# this many candidates are compared in full
+MAX_BUCKET_SIZE = 128
+MAX_CANDIDATES = 4
+
+
+class MemoryMatch(NamedTuple):
+    translated_text: str
+    source_language: str
+    similarity: float
+    matched_text: str
+
+
+class _Entry(NamedTuple):
+    target_language: str
+    normalized: str
+    words: tuple
+    numbers: tuple
+    original_text: str
+    translated_text: str
+    source_language: str
+    keys: tuple  # LSH bucket keys
+
+
+def normalize(text: str) -> tuple:
+    """Case- and whitespace-folded text with numbers masked, and the numbers"""
+    folded = _WHITESPACE.sub(" ", text.strip().lower())
+    return _NUMBER.sub("#", folded), _NUMBER.findall(folded)
+
+def words(normalized: str) -> tuple:
+    """Words of a normalized text, without surrounding punctuation"""
+    return tuple(word for word in (token.strip(_PUNCTUATION) for token in normalized.split(" ")) if word)
+
+def is_placeholder(original_text: str, target_language: str, translated_text: str) -> bool:
+    """Whether a translation is the ``[XX] text`` echo served when no translation was available"""
+    return translated_text == f"[{target_language.upper()}] {original_text}"
+
+def shingles(normalized: str, size: int = 3) -> Set[str]:
+    """Overlapping character n-grams, with the text's edges marked"""
+    padded = f" {normalized} "
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i:i + size] for i in range(len(padded) - size + 1)}
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+class TranslationMemory:
+    """
+    Fuzzy translation memory over past translations.
+
+    Texts are compared by the Jaccard similarity of their character
+    trigrams, after folding case and whitespace and masking numbers.
+    Candidates come from a MinHash LSH index (``bands`` bands of ``rows``
+    hashes per target language), so a lookup touches a handful of entries
+    however many are stored; the best candidate at or above ``threshold``
+    is considered.
+
+    Similar is not the same, though: "is ready" and "is not ready", or the
+    same letter to another name, score well above any useful threshold. A
+    match is only served when its words equal the query's apart from
+    numbers, case, whitespace and punctuation. Numbers are the one slot
+    that is substituted: each stored number that appears once in the stored
+    translation is swapped for the query's. Any other difference, or a
+    number that cannot be swapped, is a miss.
+
+    ``[XX] text`` placeholders, echoed when no translation was available,
+    are never stored.
+
+    The ``max_entries`` most recently added texts are kept. ``start`` loads
+    the newest rows of ``translation_logs`` and then tails the table, so
+    translations logged by any process are picked up.
+    """
+    def __init__(self, threshold: float = 0.85, max_entries: int = 200000, bands: int = 8, rows: int = 4,
+                 session_factory: Callable = SessionLocal, refresh_interval: float = 5.0,
+                 batch_size: int = 5000, seed: int = 1):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.bands = bands
+        self.rows = rows
+        self.session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self.batch_size = batch_size
+        self._size = bands * rows
+        self._salt = random.Random(seed).getrandbits(64)
+
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._exact: Dict[tuple, int] = {}
+        self._buckets: Dict[int, Set[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._last_log_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.lookups = 0
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.number_rewrites = 0
+        self.number_mismatches = 0
+        self.word_mismatches = 0
+        self.total_lookup_seconds = 0.0
+        self.max_lookup_seconds = 0.0
+        self.indexed_rows = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _signature(self, grams: Set[str]) -> List[int]:
+        """
+        One-permutation MinHash: each shingle is hashed once into one of the
+        signature's bins and each bin keeps its minimum. Empty bins borrow
+        the next filled bin's value (rotation densification), so short texts
+        still get comparable signatures.
+        """
+        size = self._size
+        signature = [_EMPTY] * size
+        salt = self._salt
+        for gram in grams:
+            value = hash(gram) ^ salt
+            index = value % size
+            value = (value & _HASH_MASK) >> 8
+            if value < signature[index]:
+                signature[index] = value
+        if _EMPTY in signature:
+            filled = [index for index, value in enumerate(signature) if value != _EMPTY]
+            for index in range(size):
+                if signature[index] == _EMPTY:
+                    distance = next((other - index) % size for other in filled if other > index) if filled[-1] > index \
+                        else filled[0] + size - index
+                    signature[index] = signature[(index + distance) % size] + distance * _ROTATION_OFFSET
+        return signature
+
+    def _band_keys(self, target_language: str, signature: List[int]) -> List[int]:
+        rows = self.rows
+        return [
+            hash((target_language, band, *signature[band * rows:(band + 1) * rows]))
+            for band in range(self.bands)
+        ]
+
+    def add(self, original_text: str, target_language: str, translated_text: str, source_language: str):
+        """Store one translation; a newer translation of the same text replaces the older one"""
+        self.add_many([(original_text, target_language, translated_text, source_language)])
+
+    def add_many(self, translations: List[tuple]):
+        """Store ``(original_text, target_language, translated_text, source_language)`` tuples"""
+        for original_text, target_language, translated_text, source_language in translations:
+            if is_placeholder(original_text, target_language, translated_text):
+                continue
+            normalized, numbers = normalize(original_text)
+            if not normalized:
+                continue
+            # Hashing is done outside the lock; lookups only wait for the inserts
+            keys = tuple(self._band_keys(target_language, self._signature(shingles(normalized))))
+            entry = _Entry(target_language, normalized, words(normalized), tuple(numbers), original_text,
+                           translated_text, source_language, keys)
+            with self._lock:
+                previous = self._exact.get((target_language, normalized))
+                if previous is not None:
+                    self._remove(previous)
+                entry_id = self._next_id
+                self._next_id += 1
+                self._entries[entry_id] = entry
+                self._exact[(target_language, normalized)] = entry_id
+                for key in keys:
+                    self._buckets.setdefault(key, set()).add(entry_id)
+                while len(self._entries) > self.max_entries:
+                    self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_id: int):
+        entry = self._entries.pop(entry_id)
+        if self._exact.get((entry.target_language, entry.normalized)) == entry_id:
+            del self._exact[(entry.target_language, entry.normalized)]
+        for key in entry.keys:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def lookup(self, text: str, target_language: str) -> Optional[MemoryMatch]:
+        """Best stored translation of a text similar to ``text``, if any"""
+        start = time.perf_counter()
+        try:
+            return self._lookup(text, target_language)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.lookups += 1
+            self.total_lookup_seconds += elapsed
+            self.max_lookup_seconds = max(self.max_lookup_seconds, elapsed)
+            TRANSLATION_MEMORY_LOOKUP_DURATION.observe(elapsed)
+
+    def _lookup(self, text: str, target_language: str) -> Optional[MemoryMatch]:
+        normalized, numbers = normalize(text)
+        if not normalized:
+            return None
+
+        with self._lock:
+            exact = self._exact.get((target_language, normalized))
+            exact_entry = self._entries.get(exact) if exact is not None else None
+        if exact_entry is not None:
+            match = self._serve(exact_entry, numbers, 1.0)
+            if match is not None:
+                self.exact_hits += 1
+                return match
+
+        grams = shingles(normalized)
+        keys = self._band_keys(target_language, self._signature(grams))
+        with self._lock:
+            # Rank candidates by shared bands; crowded buckets say little and are skipped
+            shared: Dict[int, int] = {}
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket is None or len(bucket) > MAX_BUCKET_SIZE:
+                    continue
+                for entry_id in bucket:
+                    shared[entry_id] = shared.get(entry_id, 0) + 1
+            shared.pop(exact, None)
+            candidates = [self._entries[entry_id] for entry_id in heapq.nlargest(MAX_CANDIDATES, shared, key=shared.get)]
+
+        scored = sorted(
+            ((jaccard(grams, shingles(entry.normalized)), entry) for entry in candidates),
+            key=lambda pair: pair[0], reverse=True
+        )
+        query_words = words(normalized)
+        for similarity, entry in scored:
+            if similarity < self.threshold:
+                break
+            if entry.words != query_words:
+                # Another name, a negation, a changed word: not the same sentence
+                self.word_mismatches += 1
+                continue
+            match = self._serve(entry, numbers, similarity)
+            if match is not None:
+                self.fuzzy_hits += 1
+                return match
+        return None
+
+    def _serve(self, entry: _Entry, numbers: List[str], similarity: float) -> Optional[MemoryMatch]:
+        """The entry's translation with the query's numbers, or None when they cannot be carried over"""
+        translated = entry.translated_text
+        if list(entry.numbers) != numbers:
+            replacements = self._number_replacements(entry, numbers)
+            if replacements is None:
+                self.number_mismatches += 1
+                return None
+            translated = _NUMBER.sub(lambda match: replacements.get(match.group(), match.group()), translated)
+            self.number_rewrites += 1
+        return MemoryMatch(translated, entry.source_language, similarity, entry.original_text)
+
+    @staticmethod
+    def _number_replacements(entry: _Entry, numbers: List[str]) -> Optional[Dict[str, str]]:
+        """Stored number to query number, if each changed number appears exactly once in the translation"""
+        if len(entry.numbers) != len(numbers):
+            return None
+        translated_numbers = _NUMBER.findall(entry.translated_text)
+        replacements = {}
+        for old, new in zip(entry.numbers, numbers):
+            if old == new:
+                continue
+            if replacements.setdefault(old, new) != new or translated_numbers.count(old) != 1:
+                return None
+        return replacements
+
+    # Loading from translation_logs
+
+    def start(self):
+        """Load recent translation logs and keep following new ones in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._follow_logs())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _follow_logs(self):
+        while True:
+            try:
+                if self._last_log_id is None:
+                    self._last_log_id = await asyncio.to_thread(self._initial_log_id)
+                while await asyncio.to_thread(self._index_new_logs):
+                    pass
+            except Exception:
+                logger.exception("Translation memory refresh failed")
+            await asyncio.sleep(self.refresh_interval)
+
+    def _initial_log_id(self) -> int:
+        """Id just before the ``max_entries`` newest logs"""
+        db = self.session_factory()
+        try:
+            boundary = db.execute(
+                select(TranslationLog.id).order_by(TranslationLog.id.desc()).offset(self.max_entries).limit(1)
+            ).scalar()
+            return boundary or 0
+        finally:
+            db.close()
+
+    def _index_new_logs(self) -> bool:
+        """Index the next batch of logs; True when there may be more"""
+        original = aliased(TranslationText)
+        translated = aliased(TranslationText)
+        db = self.session_factory()
+        try:
+            rows = db.execute(
+                select(TranslationLog.id, original.text, TranslationLog.target_language,
+                       translated.text, TranslationLog.source_language)
+                .join(original, original.hash == TranslationLog.original_text_hash)
+                .join(translated, translated.hash == TranslationLog.translated_text_hash)
+                .where(TranslationLog.id > self._last_log_id)
+                .order_by(TranslationLog.id)
+                .limit(self.batch_size)
+            ).all()
+        finally:
+            db.close()
+        if not rows:
+            return False
+        self.add_many([tuple(row[1:]) for row in rows])
+        self._last_log_id = rows[-1][0]
+        self.indexed_rows += len(rows)
+        return len(rows) == self.batch_size
+
+    def stats(self) -> dict:
+        """Size, match rate and lookup latency"""
+        hits = self.exact_hits + self.fuzzy_hits
+        return {
+            'entries': len(self._entries),
+            'indexed_rows': self.indexed_rows,
+            'threshold': self.threshold,
+            'lookups': self.lookups,
+            'exact_hits': self.exact_hits,
+            'fuzzy_hits': self.fuzzy_hits,
+            'match_rate': hits / self.lookups if self.lookups else 0.0,
+            'number_rewrites': self.number_rewrites,
+            'number_mismatches': self.number_mismatches,
+            'word_mismatches': self.word_mismatches,
+            'avg_lookup_us': self.total_lookup_seconds / self.lookups * 1e6 if self.lookups else 0.0,
+            'max_lookup_us': self.max_lookup_seconds * 1e6,
+        }
+
+
+_translation_memory: Optional[TranslationMemory] = None
+
+def init_translation_memory() -> TranslationMemory:
+    """Create the application-wide translation memory"""
+    global _translation_memory
+    if _translation_memory is None:
+        _translation_memory = TranslationMemory(
+            threshold=settings.TRANSLATION_MEMORY_THRESHOLD,
+            max_entries=settings.TRANSLATION_MEMORY_MAX_ENTRIES,
+            refresh_interval=settings.TRANSLATION_MEMORY_REFRESH_SECONDS,
+            batch_size=settings.TRANSLATION_MEMORY_LOAD_BATCH_SIZE
+        )
+    return _translation_memory
+
+async def shutdown_translation_memory():
+    """Stop following the translation logs"""
+    global _translation_memory
+    if _translation_memory is not None:
+        await _translation_memory.stop()
+        _translation_memory = None
+
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """Application-wide translation memory, if it is enabled"""
+    return _translation_memory
+
+def _collect_metrics():
+    """Match counters of the application-wide translation memory"""
+    memory = _translation_memory
+    if memory is None:
+        return []
+    return [
+        ("translation_memory_entries", "gauge", "Texts in the translation memory", [({}, len(memory))]),
+        ("translation_memory_lookups", "counter", "Translation memory lookups", [({}, memory.lookups)]),
+        ("translation_memory_hits", "counter", "Translation memory matches served", [
+            ({'kind': 'exact'}, memory.exact_hits), ({'kind': 'fuzzy'}, memory.fuzzy_hits)
+        ]),
+    ]
+
+registry.register_collector(_collect_metrics)
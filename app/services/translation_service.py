@@ -1,56 +1,63 @@
+import asyncio
+import time
 import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
-from googletrans import Translator
 from app.core.exceptions import TranslationAPIException
 from app.config import get_settings
+from app.services.cache import TranslationCache
+from app.services.timing import span
+from app.services.metrics import (
+    PROVIDER_ERRORS, PROVIDER_FALLBACK_RESPONSES, PROVIDER_IN_FLIGHT, PROVIDER_REQUEST_DURATION,
+    TRANSLATED_CHARACTERS, registry
+)
+from app.services.providers import TranslationProvider, backend_name, create_provider
+from app.services.translation_memory import TranslationMemory, init_translation_memory
+from app.utils.language_detection import detect_language
+from app.utils.segmentation import segment_document
 
 settings = get_settings()
 
 class TranslationService:
-    def __init__(self):
-        self.translator = Translator() if not settings.USE_MOCK_TRANSLATION else None
-        
-        # Mock translations for demo purposes
-        self.mock_translations = {
-            'hi': {
-                'hello': 'नमस्ते',
-                'how are you': 'आप कैसे हैं',
-                'good morning': 'सुप्रभात',
-                'thank you': 'धन्यवाद',
-                'goodbye': 'अलविदा'
-            },
-            'ta': {
-                'hello': 'வணக்கம்',
-                'how are you': 'எப்படி இருக்கீங்க',
-                'good morning': 'காலை வணக்கம்',
-                'thank you': 'நன்றி',
-                'goodbye': 'பிரியாவிடை'
-            },
-            'kn': {
-                'hello': 'ನಮಸ್ಕಾರ',
-                'how are you': 'ನೀವು ಹೇಗಿದ್ದೀರಿ',
-                'good morning': 'ಶುಭೋದಯ',
-                'thank you': 'ಧನ್ಯವಾದಗಳು',
-                'goodbye': 'ವಿದಾಯ'
-            },
-            'bn': {
-                'hello': 'হ্যালো',
-                'how are you': 'আপনি কেমন আছেন',
-                'good morning': 'শুভ সকাল',
-                'thank you': 'ধন্যবাদ',
-                'goodbye': 'বিদায়'
-            }
-        }
+    """
+    Translation service shared by every request.
+    
+    One instance is created at application startup so the provider (and its
+    pooled keep-alive HTTP connections) is built once instead of per request.
+    Call ``close()`` on shutdown.
     
-    async def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> dict:
+    Concurrent cache misses for the same text and language pair are coalesced
+    (single-flight): the first caller makes the provider call and the others
+    await its result, each still getting its own ``translation_id``.
+    
+    With a translation ``memory``, cache misses are first matched against
+    past translations of similar texts before the provider is called.
+    """
+    def __init__(self, provider: Optional[TranslationProvider] = None, coalesce: Optional[bool] = None,
+                 memory: Optional[TranslationMemory] = None):
+        self.provider = provider or create_provider(settings)
+        # Provider metrics are labelled with the backend, not its wrappers
+        self.provider_name = backend_name(self.provider)
+        self.memory = memory
+        self.cache = TranslationCache(
+            max_size=settings.TRANSLATION_CACHE_MAX_SIZE,
+            ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS
+        ) if settings.TRANSLATION_CACHE_ENABLED else None
+        self.coalesce = settings.TRANSLATION_COALESCING_ENABLED if coalesce is None else coalesce
+        self._in_flight: Dict[tuple, asyncio.Future] = {}
+        self.provider_calls = 0
+        self.coalesced = 0
+    
+    async def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None,
+                             use_cache: bool = True) -> dict:
         """
         Translate a single text
         
         Args:
             text: Text to translate
             target_language: Target language code
-            source_language: Source language code (optional)
+            source_language: Source language code (optional; detected locally on a cache miss)
+            use_cache: Set to False to bypass the result cache
             
         Returns:
             Dictionary containing translation result
@@ -58,13 +65,36 @@ class TranslationService:
         try:
             translation_id = str(uuid.uuid4())
             
-            if settings.USE_MOCK_TRANSLATION:
-                translated_text, detected_language = await self._mock_translate(text, target_language)
+            cache_key = None
+            cached = None
+            if use_cache and self.cache is not None:
+                with span("cache"):
+                    cache_key = self.cache.make_key(text, source_language, target_language)
+                    cached = self.cache.get(cache_key)
+            
+            memory_match = None
+            if cached is None and use_cache and self.memory is not None:
+                with span("memory"):
+                    memory_match = self.memory.lookup(text, target_language)
+            
+            if cached is not None:
+                translated_text, detected_language = cached
+            elif memory_match is not None:
+                translated_text, detected_language = memory_match.translated_text, memory_match.source_language
+                if cache_key is not None:
+                    self.cache.set(cache_key, (translated_text, detected_language))
+            elif use_cache and self.coalesce:
+                with span("provider"):
+                    translated_text, detected_language = await self._coalesced_translate(
+                        text, target_language, source_language, cache_key
+                    )
             else:
-                translated_text, detected_language = await self._google_translate(
-                    text, target_language, source_language
-                )
+                with span("provider"):
+                    translated_text, detected_language = await self._provider_translate(
+                        text, target_language, source_language, cache_key
+                    )
             
+            TRANSLATED_CHARACTERS.labels(target_language).inc(len(text))
             return {
                 'success': True,
                 'original_text': text,
@@ -78,24 +108,117 @@ class TranslationService:
         except Exception as e:
             raise TranslationAPIException(f"Translation failed: {str(e)}", "TRANSLATION_ERROR")
     
-    async def translate_bulk(self, texts: List[str], target_language: str) -> dict:
+    async def _provider_translate(self, text: str, target_language: str, source_language: Optional[str],
+                                  cache_key: Optional[tuple]) -> tuple:
+        """Call the provider and cache the result"""
+        detected = None
+        if source_language is None and settings.LANGUAGE_DETECTION_ENABLED:
+            detection = detect_language(text)
+            if detection is not None and detection.confidence >= settings.LANGUAGE_DETECTION_MIN_CONFIDENCE:
+                detected = detection.language
+        # Name the source upstream rather than paying for its detection; the
+        # cache stays keyed on what the caller asked for
+        hint = source_language or (detected if self.provider.source_hints else None)
+        
+        self.provider_calls += 1
+        in_flight = PROVIDER_IN_FLIGHT.labels(self.provider_name)
+        in_flight.inc()
+        start = time.perf_counter()
+        degraded = False
+        try:
+            result = await self.provider.translate(text, target_language, hint)
+            degraded = getattr(result, 'degraded', False)
+        except Exception:
+            PROVIDER_ERRORS.labels(self.provider_name, target_language).inc()
+            raise
+        finally:
+            in_flight.dec()
+            if degraded:
+                # Served by the fallback; the backend was not called
+                PROVIDER_FALLBACK_RESPONSES.labels(self.provider_name, target_language).inc()
+            else:
+                PROVIDER_REQUEST_DURATION.labels(self.provider_name, target_language).observe(
+                    time.perf_counter() - start
+                )
+        if detected is not None and result[1] != detected:
+            # Whatever the backend reports, a confident local detection names the source
+            result = type(result)((result[0], detected))
+        # Fallback translations served while the provider is down are not cached
+        if cache_key is not None and not degraded:
+            self.cache.set(cache_key, result)
+        return result
+    
+    async def _coalesced_translate(self, text: str, target_language: str, source_language: Optional[str],
+                                   cache_key: Optional[tuple]) -> tuple:
+        """
+        Share one provider call between concurrent identical requests
+        
+        The call runs as its own task and callers await it shielded, so a
+        cancelled caller never cancels the translation others are waiting on.
+        """
+        key = cache_key or TranslationCache.make_key(text, source_language, target_language)
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._provider_translate(text, target_language, source_language, cache_key)
+            )
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish_flight(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+    
+    def _finish_flight(self, key: tuple, future: asyncio.Future):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Mark the error retrieved in case every caller was cancelled
+            future.exception()
+    
+    async def translate_bulk(self, texts: List[str], target_language: str, use_cache: bool = True) -> dict:
         """
         Translate multiple texts
         
         Args:
             texts: List of texts to translate
             target_language: Target language code
+            use_cache: Set to False to bypass the result cache
             
         Returns:
             Dictionary containing bulk translation results
         """
-        translations = []
+        semaphore = asyncio.Semaphore(settings.BULK_TRANSLATION_CONCURRENCY)
+        timeout = settings.BULK_TRANSLATION_ITEM_TIMEOUT_SECONDS
+        
+        async def translate_one(text: str) -> dict:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.translate_text(text, target_language, use_cache=use_cache),
+                        timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    raise TranslationAPIException(
+                        f"Translation timed out after {timeout} seconds", "TRANSLATION_TIMEOUT"
+                    )
         
+        # Translate each distinct text once, concurrently
+        unique_texts = list(dict.fromkeys(texts))
+        outcomes = await asyncio.gather(
+            *(translate_one(text) for text in unique_texts),
+            return_exceptions=True
+        )
+        results_by_text = dict(zip(unique_texts, outcomes))
+        
+        # Fan results back out in request order
+        translations = []
+        seen = set()
         for text in texts:
-            try:
-                result = await self.translate_text(text, target_language)
-                translations.append(result)
-            except Exception as e:
+            outcome = results_by_text[text]
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+            
+            if isinstance(outcome, Exception):
                 # Continue with other translations even if one fails
                 translations.append({
                     'success': False,
@@ -105,8 +228,14 @@ class TranslationService:
                     'target_language': target_language,
                     'translation_id': str(uuid.uuid4()),
                     'timestamp': datetime.utcnow(),
-                    'error': str(e)
+                    'error': str(outcome)
                 })
+            elif text in seen:
+                # Duplicates share the translation but are logged separately
+                translations.append({**outcome, 'translation_id': str(uuid.uuid4())})
+            else:
+                seen.add(text)
+                translations.append(outcome)
         
         return {
             'success': True,
@@ -115,36 +244,137 @@ class TranslationService:
             'timestamp': datetime.utcnow()
         }
     
-    async def _mock_translate(self, text: str, target_language: str) -> tuple:
-        """Mock translation for demo purposes"""
-        text_lower = text.lower().strip()
+    async def translate_document(self, text: str, target_language: str, use_cache: bool = True) -> dict:
+        """
+        Translate a long document sentence by sentence
+        
+        The document is split into segments at sentence, line and markup
+        boundaries; each distinct segment is translated once, concurrently,
+        and the translations are put back between the original whitespace
+        and markup.
         
-        if target_language in self.mock_translations:
-            # Check for exact matches first
-            if text_lower in self.mock_translations[target_language]:
-                return self.mock_translations[target_language][text_lower], 'en'
+        Args:
+            text: Document to translate
+            target_language: Target language code
+            use_cache: Set to False to bypass the result cache
             
-            # Check for partial matches
-            for key, value in self.mock_translations[target_language].items():
-                if key in text_lower:
-                    return text.replace(key, value, 1), 'en'
+        Returns:
+            Dictionary containing the translated document
+        """
+        document = segment_document(text, settings.DOCUMENT_SEGMENT_MAX_LENGTH)
+        segments = document.texts()
+        semaphore = asyncio.Semaphore(settings.DOCUMENT_TRANSLATION_CONCURRENCY)
+        timeout = settings.BULK_TRANSLATION_ITEM_TIMEOUT_SECONDS
         
-        # If no translation found, return a formatted response
-        return f"[{target_language.upper()}] {text}", 'en'
-    
-    async def _google_translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> tuple:
-        """Google Translate API translation"""
-        if not self.translator:
-            raise TranslationAPIException("Google Translator not initialized", "TRANSLATOR_ERROR")
+        async def translate_one(segment: str) -> dict:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.translate_text(segment, target_language, use_cache=use_cache),
+                        timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    raise TranslationAPIException(
+                        f"Segment translation timed out after {timeout} seconds", "TRANSLATION_TIMEOUT"
+                    )
         
-        try:
-            result = self.translator.translate(
-                text,
-                dest=target_language,
-                src=source_language
-            )
-            
-            return result.text, result.src
-            
-        except Exception as e:
-            raise TranslationAPIException(f"Google Translate error: {str(e)}", "GOOGLE_API_ERROR")
\ No newline at end of file
+        # Translate each distinct segment once; a failed segment fails the document
+        unique_segments = list(dict.fromkeys(segments))
+        outcomes = await asyncio.gather(
+            *(translate_one(segment) for segment in unique_segments),
+            return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        results_by_segment = dict(zip(unique_segments, outcomes))
+        
+        # The most common detected language stands for the whole document
+        detected = [results_by_segment[segment]['source_language'] for segment in segments]
+        source_language = max(set(detected), key=detected.count) if detected else 'unknown'
+        
+        return {
+            'success': True,
+            'original_text': text,
+            'translated_text': document.join(
+                [results_by_segment[segment]['translated_text'] for segment in segments]
+            ),
+            'source_language': source_language,
+            'target_language': target_language,
+            'translation_id': str(uuid.uuid4()),
+            'segments': len(segments),
+            'unique_segments': len(unique_segments),
+            'timestamp': datetime.utcnow()
+        }
+    
+    def cache_stats(self) -> dict:
+        """Result cache counters"""
+        if self.cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.cache.stats()}
+    
+    def memory_stats(self) -> dict:
+        """Translation memory size, match rate and lookup latency"""
+        if self.memory is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.memory.stats()}
+    
+    def coalescing_stats(self) -> dict:
+        """Provider call and single-flight counters"""
+        return {
+            'enabled': self.coalesce,
+            'provider_calls': self.provider_calls,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._in_flight)
+        }
+    
+    async def close(self):
+        """Release provider resources"""
+        await self.provider.close()
+
+
+_translation_service: Optional[TranslationService] = None
+
+def init_translation_service() -> TranslationService:
+    """Create the application-wide translation service"""
+    global _translation_service
+    if _translation_service is None:
+        _translation_service = TranslationService(
+            memory=init_translation_memory() if settings.TRANSLATION_MEMORY_ENABLED else None
+        )
+    return _translation_service
+
+async def shutdown_translation_service():
+    """Close the application-wide translation service"""
+    global _translation_service
+    if _translation_service is not None:
+        await _translation_service.close()
+        _translation_service = None
+
+def get_translation_service() -> TranslationService:
+    """Translation service dependency"""
+    return init_translation_service()
+
+def _collect_metrics():
+    """Cache and coalescing counters of the application-wide service"""
+    service = _translation_service
+    if service is None:
+        return []
+    
+    families = [
+        ("translation_provider_calls", "counter", "Translation provider calls made",
+         [({}, service.provider_calls)]),
+        ("translation_coalesced_requests", "counter", "Requests served by an identical in-flight call",
+         [({}, service.coalesced)]),
+    ]
+    if service.cache is not None:
+        cache = service.cache
+        families += [
+            ("translation_cache_hits", "counter", "Translation cache hits", [({}, cache.hits)]),
+            ("translation_cache_misses", "counter", "Translation cache misses", [({}, cache.misses)]),
+            ("translation_cache_evictions", "counter", "Translation cache LRU evictions", [({}, cache.evictions)]),
+            ("translation_cache_entries", "gauge", "Entries in the translation cache", [({}, len(cache))]),
+        ]
+    return families
+
+registry.register_collector(_collect_metrics)
@@ -1,25 +1,55 @@
-import re
-from typing import Optional
+import ipaddress
+from typing import List, Optional, Sequence, Union
+from fastapi import Request
 
-def is_valid_language_code(language_code: str) -> bool:
-    """Validate language code format"""
-    # Check if it's a valid 2-3 character language code
-    pattern = r'^[a-z]{2,3}$'
-    return bool(re.match(pattern, language_code.lower()))
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
 
-def sanitize_text(text: str) -> str:
-    """Sanitize input text"""
-    if not text:
-        return ""
+def get_client_ip(request: Request) -> Optional[str]:
+    """Get client IP address, honouring reverse proxy headers"""
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
     
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    real_ip = request.headers.get("x-real-ip")
+    if real_ip:
+        return real_ip.strip()
     
-    # Remove potentially harmful characters (basic sanitization)
-    text = re.sub(r'[<>]', '', text)
-    
-    return text
+    return request.client.host if request.client else None
+
+def get_user_agent(request: Request) -> Optional[str]:
+    """Get user agent string, truncated to fit the log column"""
+    user_agent = request.headers.get("user-agent")
+    return user_agent[:500] if user_agent else None
+
+def parse_networks(value: str) -> List[Network]:
+    """Parse a comma-separated list of IP addresses and CIDR ranges"""
+    return [ipaddress.ip_network(item.strip(), strict=False) for item in value.split(",") if item.strip()]
 
-def validate_text_length(text: str, max_length: int = 1000) -> bool:
-    """Validate text length"""
-    return len(text) <= max_length
+def _in_networks(address: str, networks: Sequence[Network]) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+def get_peer_ip(scope: dict, trusted_proxies: Sequence[Network] = ()) -> Optional[str]:
+    """
+    Client address of an ASGI connection, not spoofable by the client
+    
+    ``X-Forwarded-For`` is only honoured when the connection comes from one
+    of ``trusted_proxies``; the client is then the rightmost forwarded
+    address that is not itself a trusted proxy.
+    """
+    client = scope.get("client")
+    peer = client[0] if client else None
+    if peer is None or not trusted_proxies or not _in_networks(peer, trusted_proxies):
+        return peer
+    
+    forwarded = []
+    for name, value in scope.get("headers", ()):
+        if name == b"x-forwarded-for":
+            forwarded.extend(item.strip() for item in value.decode("latin-1").split(","))
+    for address in reversed(forwarded):
+        if address and not _in_networks(address, trusted_proxies):
+            return address
+    return peer
@@ -0,0 +1,219 @@
+import re
+from bisect import bisect_right
+from typing import Dict, NamedTuple, Optional
+
+# Unicode blocks of the scripts of SUPPORTED_LANGUAGES: (first, last, script)
+_SCRIPT_RANGES = sorted([
+    (0x0041, 0x005A, "latin"), (0x0061, 0x007A, "latin"), (0x00C0, 0x024F, "latin"),
+    (0x1E00, 0x1EFF, "latin"),
+    (0x0400, 0x04FF, "cyrillic"),
+    (0x0600, 0x06FF, "arabic"), (0x0750, 0x077F, "arabic"), (0xFB50, 0xFDFF, "arabic"), (0xFE70, 0xFEFF, "arabic"),
+    (0x0900, 0x097F, "devanagari"),
+    (0x0980, 0x09FF, "bengali"),
+    (0x0A00, 0x0A7F, "gurmukhi"),
+    (0x0A80, 0x0AFF, "gujarati"),
+    (0x0B00, 0x0B7F, "oriya"),
+    (0x0B80, 0x0BFF, "tamil"),
+    (0x0C00, 0x0C7F, "telugu"),
+    (0x0C80, 0x0CFF, "kannada"),
+    (0x0D00, 0x0D7F, "malayalam"),
+    (0x0E00, 0x0E7F, "thai"),
+    (0x1100, 0x11FF, "hangul"), (0x3130, 0x318F, "hangul"), (0xAC00, 0xD7AF, "hangul"),
+    (0x3040, 0x309F, "kana"), (0x30A0, 0x30FF, "kana"), (0x31F0, 0x31FF, "kana"), (0xFF66, 0xFF9F, "kana"),
+    (0x3400, 0x4DBF, "han"), (0x4E00, 0x9FFF, "han"), (0xF900, 0xFAFF, "han"),
+])
+_RANGE_STARTS = [first for first, _, _ in _SCRIPT_RANGES]
+
+# Scripts written by exactly one supported language
+_SCRIPT_LANGUAGES = {
+    "cyrillic": "ru", "arabic": "ar", "gurmukhi": "pa", "gujarati": "gu", "oriya": "or", "tamil": "ta",
+    "telugu": "te", "kannada": "kn", "malayalam": "ml", "thai": "th", "hangul": "ko",
+}
+
+# Only the first letters are examined; scripts are decided well before this
+_MAX_LETTERS = 256
+
+_LATIN_WORD = re.compile(r"[a-zà-öø-ÿœßăđơưạ-ỹ']+")
+
+# Frequent function words and characteristic n-grams of the Latin-script
+# languages and of the languages sharing Devanagari and Bengali script
+_WORDS = {
+    "en": {"the", "and", "is", "are", "of", "to", "in", "it", "you", "that", "this", "with", "for", "was",
+           "have", "not", "what", "how", "my", "your", "i", "be", "on", "at", "we", "they", "hello", "thank"},
+    "fr": {"le", "la", "les", "et", "est", "des", "une", "un", "du", "que", "qui", "pas", "vous", "je", "nous",
+           "pour", "dans", "avec", "sur", "ce", "cette", "bonjour", "merci", "très", "au", "aux", "il", "elle"},
+    "es": {"el", "la", "los", "las", "y", "es", "del", "una", "que", "por", "para", "con", "no", "se", "muy",
+           "está", "estoy", "hola", "gracias", "como", "pero", "yo", "usted", "al", "lo", "más", "buenos"},
+    "de": {"der", "die", "das", "und", "ist", "nicht", "ein", "eine", "ich", "sie", "wir", "mit", "auf", "für",
+           "zu", "den", "dem", "von", "sehr", "danke", "guten", "wie", "es", "geht", "ihnen", "auch", "sind"},
+    "it": {"il", "lo", "la", "gli", "le", "e", "è", "di", "che", "non", "una", "un", "per", "con", "sono",
+           "come", "ciao", "grazie", "molto", "del", "della", "questo", "sta", "buongiorno", "anche", "io"},
+    "pt": {"o", "a", "os", "as", "e", "é", "do", "da", "dos", "das", "um", "uma", "que", "não", "com", "para",
+           "em", "você", "obrigado", "obrigada", "olá", "muito", "está", "eu", "bom", "dia", "tudo", "bem"},
+    "vi": {"và", "là", "của", "có", "không", "tôi", "bạn", "những", "được", "cho", "trong", "này", "một",
+           "xin", "chào", "cảm", "ơn", "rất", "khỏe", "người", "với", "các"},
+    "hi": {"है", "हैं", "और", "के", "की", "का", "में", "से", "को", "नहीं", "यह", "मैं", "आप", "था", "थी",
+           "हूँ", "हूं", "क्या", "कैसे", "पर", "भी"},
+    "mr": {"आहे", "आहेत", "आणि", "नाही", "मी", "तुम्ही", "तू", "हे", "ते", "काय", "कसे", "कसा", "होते", "आम्ही",
+           "मला", "तुमचे", "माझे", "पण", "झाले"},
+    "bn": {"এবং", "আমি", "আপনি", "কেমন", "আছেন", "না", "এই", "যে", "করে", "হয়", "ছিল", "তুমি", "কি"},
+    "as": {"আৰু", "মই", "আপুনি", "কেনে", "আছে", "নহয়", "এই", "কৰে", "হয়", "আছিল", "তুমি", "কি"},
+}
+_NGRAMS = {
+    "en": ("th", "ing", "wh", "ght", "ould"),
+    "fr": ("eau", "oi", "ais", "ç", "ê", "è", "œ", "qu'", "l'", "d'"),
+    "es": ("ñ", "ción", "¿", "¡", "ll", "á", "í", "ó", "ú"),
+    "de": ("sch", "ß", "ä", "ö", "ü", "ei", "ich", "cht"),
+    "it": ("zione", "gli", "cch", "ò", "ù", "ì", "zz"),
+    "pt": ("ão", "ões", "ç", "ã", "õ", "nh", "lh", "ê", "ô"),
+    "vi": ("ư", "ơ", "đ", "ă", "ạ", "ả", "ấ", "ầ", "ệ", "ộ", "ờ", "ữ"),
+    "mr": ("ळ", "च्या", "ऱ"),
+    "hi": ("ें", "ों"),
+    "as": ("ৰ", "ৱ"),
+    "bn": ("র",),
+}
+
+
+# Languages sharing a script, the most common first
+_SHARED_SCRIPT_CANDIDATES = {
+    "latin": ("en", "fr", "es", "de", "it", "pt", "vi"),
+    "devanagari": ("hi", "mr"),
+    "bengali": ("bn", "as"),
+}
+
+# (n-gram, language) pairs of each candidate set, keyed first by whether the
+# text is ASCII: such a text can only contain the ASCII n-grams
+_NGRAM_PAIRS = {
+    ascii_only: {
+        candidates: tuple(
+            (ngram, language) for language in candidates for ngram in _NGRAMS.get(language, ())
+            if ngram.isascii() or not ascii_only
+        )
+        for candidates in _SHARED_SCRIPT_CANDIDATES.values()
+    }
+    for ascii_only in (False, True)
+}
+
+# Languages using each function word
+_WORD_LANGUAGES: Dict[str, tuple] = {}
+for _language, _words in _WORDS.items():
+    for _word in _words:
+        _WORD_LANGUAGES[_word] = _WORD_LANGUAGES.get(_word, ()) + (_language,)
+
+# Only the start of a long text is scored
+_MAX_SCORED_CHARS = 400
+
+# Function-word hits needed before a Latin-script guess is confident; short
+# words like "no" or "a" are shared by too many of these languages
+_MIN_LATIN_WORD_HITS = 2
+_UNSURE_CONFIDENCE = 0.5
+
+_PUNCTUATION = ".,!?;:।\"'()"
+
+
+class Detection(NamedTuple):
+    language: str
+    confidence: float
+
+
+def _script(char: str) -> Optional[str]:
+    code = ord(char)
+    index = bisect_right(_RANGE_STARTS, code) - 1
+    if index >= 0:
+        first, last, script = _SCRIPT_RANGES[index]
+        if code <= last:
+            return script
+    return None
+
+
+# Script of every character seen so far; text uses a small alphabet
+_script_cache: Dict[str, Optional[str]] = {}
+
+
+def _score(text: str, candidates) -> tuple:
+    """Function-word and n-gram evidence, and function-word hits, for each candidate language"""
+    lowered = text[:_MAX_SCORED_CHARS].lower()
+    words = _LATIN_WORD.findall(lowered) if "en" in candidates else lowered.split()
+    scores = dict.fromkeys(candidates, 0.0)
+    hits = dict.fromkeys(candidates, 0)
+    for word in words:
+        for language in _WORD_LANGUAGES.get(word.strip(_PUNCTUATION), ()):
+            if language in scores:
+                scores[language] += 2.0
+                hits[language] += 1
+    for ngram, language in _NGRAM_PAIRS[lowered.isascii()][candidates]:
+        if ngram in lowered:
+            scores[language] += 0.5 * lowered.count(ngram)
+    return scores, hits
+
+
+def _dominant_script(text: str, max_letters: int = _MAX_LETTERS) -> Optional[tuple]:
+    """
+    ``(script, share, counts)`` for the most common script among the first
+    ``max_letters`` letters of ``text``, or None when it has no letters
+    """
+    if text.isascii():
+        # Every ASCII letter is Latin; skip the per-character lookups
+        letters = sum(map(str.isalpha, text[:max_letters])) or min(max_letters, sum(map(str.isalpha, text)))
+        return ("latin", 1.0, {"latin": letters}) if letters else None
+
+    counts: Dict[str, int] = {}
+    letters = 0
+    for char in text:
+        script = _script_cache.get(char, False)
+        if script is False:
+            script = _script_cache[char] = _script(char) if char.isalpha() else None
+        if script is None:
+            continue
+        counts[script] = counts.get(script, 0) + 1
+        letters += 1
+        if letters >= max_letters:
+            break
+    if not counts:
+        return None
+    script = max(counts, key=counts.get)
+    return script, counts[script] / letters, counts
+
+
+def text_script(text: str) -> Optional[str]:
+    """Most common script among the first letters of ``text``, or None when it has no letters"""
+    dominant = _dominant_script(text)
+    return dominant[0] if dominant is not None else None
+
+
+def detect_language(text: str) -> Optional[Detection]:
+    """
+    Language of ``text`` from its script and, within shared scripts,
+    function words and characteristic n-grams
+
+    Returns None for text without letters. Confidence is the share of
+    letters in the winning script, scaled within a shared script by the
+    winner's share of the evidence against the runner-up; a shared script
+    without evidence reports its most common language. Latin-script
+    results with fewer than two function-word hits are capped at 0.5.
+    """
+    dominant = _dominant_script(text)
+    if dominant is None:
+        return None
+
+    script, share, counts = dominant
+    if script in _SCRIPT_LANGUAGES:
+        return Detection(_SCRIPT_LANGUAGES[script], share)
+    if script in ("kana", "han"):
+        # Japanese mixes kana into kanji; Chinese never uses kana
+        if counts.get("kana"):
+            return Detection("ja", (counts.get("kana", 0) + counts.get("han", 0)) / sum(counts.values()))
+        return Detection("zh", share)
+
+    candidates = _SHARED_SCRIPT_CANDIDATES[script]
+    scores, hits = _score(text, candidates)
+    ranked = sorted(candidates, key=scores.get, reverse=True)
+    best, runner_up = ranked[0], ranked[1]
+    total = scores[best] + scores[runner_up]
+    if not total:
+        best, confidence = candidates[0], share
+    else:
+        confidence = share * scores[best] / total
+    if script == "latin" and hits[best] < _MIN_LATIN_WORD_HITS:
+        confidence = min(confidence, _UNSURE_CONFIDENCE)
+    return Detection(best, confidence)
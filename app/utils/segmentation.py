@@ -0,0 +1,138 @@
+import re
+from typing import List
+
+# Block-level markup is a segment boundary and copied through untouched;
+# inline tags (<b>, <a href>, ...) and entities stay inside their sentence
+_BLOCK_TAGS = (
+    "address|article|aside|blockquote|br|dd|div|dl|dt|figcaption|figure|footer|h[1-6]|header|hr|"
+    "li|main|nav|ol|p|pre|section|table|tbody|td|tfoot|th|thead|tr|ul"
+)
+_MARKUP = re.compile(rf"<!--.*?-->|</?(?:{_BLOCK_TAGS})\b[^<>]*>", re.DOTALL | re.IGNORECASE)
+
+# A sentence ends at terminal punctuation (Latin, Devanagari danda, CJK)
+# plus any closing quotes or brackets, followed by whitespace
+_SENTENCE_END = re.compile(r"(?<=[.!?।॥。！？])[\"'”’)\]]*\s+")
+
+# Blank lines and line breaks always separate segments
+_LINE_BREAK = re.compile(r"\s*\n\s*")
+
+# Preferred places to split a sentence that is too long, best first
+_SOFT_BREAKS = (re.compile(r"[;:]\s+"), re.compile(r",\s+"), re.compile(r"\s+"))
+
+
+class SegmentedDocument:
+    """
+    A document cut into translatable segments and the text between them.
+
+    ``parts`` concatenate back to the original document. The parts listed
+    in ``segments`` (by index) are sentences to translate; every other part
+    is whitespace, markup or text without letters, and is kept verbatim.
+    """
+    __slots__ = ("parts", "segments")
+
+    def __init__(self, parts: List[str], segments: List[int]):
+        self.parts = parts
+        self.segments = segments
+
+    def texts(self) -> List[str]:
+        """Segment texts, in document order"""
+        return [self.parts[index] for index in self.segments]
+
+    def join(self, translations: List[str]) -> str:
+        """Rebuild the document with each segment replaced by its translation"""
+        parts = list(self.parts)
+        for index, translation in zip(self.segments, translations):
+            parts[index] = translation
+        return "".join(parts)
+
+
+def segment_document(text: str, max_segment_length: int = 1000) -> SegmentedDocument:
+    """
+    Split ``text`` into sentences no longer than ``max_segment_length``
+
+    Block-level tags, comments, line breaks and the whitespace around
+    sentences become separator parts, so joining the translated segments back keeps
+    the document's layout.
+    """
+    parts: List[str] = []
+    segments: List[int] = []
+
+    def separator(value: str):
+        if not value:
+            return
+        if parts and (not segments or segments[-1] != len(parts) - 1):
+            parts[-1] += value
+        else:
+            parts.append(value)
+
+    def sentence(value: str):
+        stripped = value.strip()
+        if not any(char.isalpha() for char in stripped):
+            separator(value)
+            return
+        start = value.index(stripped)
+        separator(value[:start])
+        for piece in _split_long(stripped, max_segment_length):
+            core = piece.rstrip()
+            if not any(char.isalpha() for char in core):
+                # Nothing to translate in a piece cut off between words
+                separator(piece)
+                continue
+            segments.append(len(parts))
+            parts.append(core)
+            separator(piece[len(core):])
+        separator(value[start + len(stripped):])
+
+    position = 0
+    for markup in _MARKUP.finditer(text):
+        _split_sentences(text[position:markup.start()], sentence, separator)
+        separator(markup.group())
+        position = markup.end()
+    _split_sentences(text[position:], sentence, separator)
+    return SegmentedDocument(parts, segments)
+
+
+def _split_sentences(run: str, sentence, separator):
+    for line_start, line_end, gap_end in _spans(run, _LINE_BREAK):
+        line = run[line_start:line_end]
+        for start, end, next_start in _spans(line, _SENTENCE_END):
+            sentence(line[start:end])
+            separator(line[end:next_start])
+        separator(run[line_end:gap_end])
+
+
+def _spans(text: str, pattern):
+    """``(start, end, next_start)`` of the pieces of ``text`` between matches of ``pattern``"""
+    start = 0
+    for match in pattern.finditer(text):
+        yield start, match.start(), match.end()
+        start = match.end()
+    if start < len(text):
+        yield start, len(text), len(text)
+
+
+def _split_long(sentence: str, limit: int) -> List[str]:
+    """
+    Cut a sentence at clause or word boundaries so no piece exceeds ``limit``
+
+    Whitespace after a cut stays at the end of the piece before it, so
+    every piece starts with a non-space character; only that trailing
+    whitespace may take a piece past ``limit``.
+    """
+    pieces = []
+    while len(sentence) > limit:
+        cut = None
+        for pattern in _SOFT_BREAKS:
+            ends = [match.end() for match in pattern.finditer(sentence, 0, limit + 1) if match.end() <= limit]
+            if ends and ends[-1] > limit // 4:
+                cut = ends[-1]
+                break
+        if cut is None:
+            cut = limit
+        rest = sentence[cut:]
+        remainder = rest.lstrip()
+        pieces.append(sentence[:cut] + rest[:len(rest) - len(remainder)])
+        sentence = remainder
+    if sentence:
+        pieces.append(sentence)
+    return pieces
@@ -0,0 +1,41 @@
+import json
+from functools import lru_cache
+from datetime import datetime
+from typing import Any, Tuple, Type
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from app.services.timing import span
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_default(value):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+def dumps(content: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(content, default=str)
+    return json.dumps(content, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+@lru_cache(maxsize=None)
+def _field_names(model: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(model.model_fields)
+
+def project(model: Type[BaseModel], data: dict) -> dict:
+    """Keep only the fields ``model`` declares, in declaration order"""
+    return {name: data.get(name) for name in _field_names(model)}
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered straight to bytes.
+
+    Routes that return one skip FastAPI's ``response_model`` validation and
+    ``jsonable_encoder`` pass; the model still documents the schema, and
+    ``project`` keeps the payload to its fields.
+    """
+    def render(self, content: Any) -> bytes:
+        with span("encode"):
+            return dumps(content)
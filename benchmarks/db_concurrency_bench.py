@@ -0,0 +1,96 @@
+"""
+Mixed translate + log-read traffic against the FastAPI app, sync vs async DB.
+
+Each mode runs in a fresh interpreter (settings are read at import time)
+against its own temporary SQLite database, driving the app in-process over
+ASGI. Run from the repository root:
+
+    python -m benchmarks.db_concurrency_bench [clients] [requests_per_client]
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+READ_EVERY = 5  # one log read for every four translations
+
+
+async def run_workload(clients: int, requests_per_client: int) -> dict:
+    import httpx
+    from app.main import app
+
+    latencies = {"translate": [], "logs": []}
+    errors = 0
+
+    async def client_loop(client_id: int, client: httpx.AsyncClient):
+        nonlocal errors
+        for i in range(requests_per_client):
+            start = time.perf_counter()
+            if i % READ_EVERY == READ_EVERY - 1:
+                kind = "logs"
+                response = await client.get("/api/v1/translate/logs", params={"limit": 50})
+            else:
+                kind = "translate"
+                response = await client.post("/api/v1/translate", json={
+                    "text": f"hello {client_id}-{i}", "target_language": "hi"
+                })
+            latencies[kind].append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                errors += 1
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            start = time.perf_counter()
+            await asyncio.gather(*(client_loop(c, client) for c in range(clients)))
+            elapsed = time.perf_counter() - start
+
+    def percentile(values, pct):
+        values = sorted(values)
+        return values[min(len(values) - 1, int(len(values) * pct / 100))] if values else 0.0
+
+    total = clients * requests_per_client
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": total / elapsed,
+        **{f"{kind}_p50_ms": percentile(values, 50) for kind, values in latencies.items()},
+        **{f"{kind}_p99_ms": percentile(values, 99) for kind, values in latencies.items()},
+    }
+
+
+def run_mode(async_db: bool, clients: int, requests_per_client: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        env["DATABASE_ASYNC"] = "true" if async_db else "false"
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.db_concurrency_bench", "--child",
+             str(clients), str(requests_per_client)],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != "--child"]
+    clients = int(args[0]) if args else 50
+    requests_per_client = int(args[1]) if len(args) > 1 else 40
+
+    if "--child" in sys.argv:
+        print(json.dumps(asyncio.run(run_workload(clients, requests_per_client))))
+        return
+
+    print(f"clients={clients} requests/client={requests_per_client}")
+    for async_db in (False, True):
+        result = run_mode(async_db, clients, requests_per_client)
+        label = "async" if async_db else "sync"
+        print(f"{label:<6} " + " ".join(f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                                       for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark long-document translation against translating it sentence by sentence.
+
+The baseline is what clients did before: send the document's sentences one
+after another, paying the provider round trip for each. The fake provider
+takes 20 ms per call; the cache is bypassed so every run calls it.
+
+Run from the repository root:
+
+    python -m benchmarks.document_translation_bench
+"""
+import asyncio
+import time
+
+from app.services.providers import FakeProvider
+from app.services.translation_service import TranslationService
+from app.utils.segmentation import segment_document
+
+PROVIDER_LATENCY_SECONDS = 0.020
+SENTENCE_COUNTS = (10, 50, 200)
+REPEATED_FRACTION = 0.25  # boilerplate sentences that recur within a document
+
+
+def make_document(sentences: int) -> str:
+    lines = []
+    for i in range(sentences):
+        if i % int(1 / REPEATED_FRACTION) == 0:
+            sentence = "Thank you for reading this document."
+        else:
+            sentence = f"This is sentence number {i} of the <b>document</b>."
+        lines.append(sentence + ("\n\n" if i % 5 == 4 else " "))
+    return "".join(lines)
+
+
+async def serial(service, document: str):
+    for segment in segment_document(document).texts():
+        await service.translate_text(segment, "hi", use_cache=False)
+
+
+async def measure(run, service, document: str) -> float:
+    start = time.perf_counter()
+    await run(service, document)
+    return time.perf_counter() - start
+
+
+async def main_async():
+    service = TranslationService(provider=FakeProvider(latency=PROVIDER_LATENCY_SECONDS))
+    print(f"{'sentences':>9} {'chars':>7} {'unique':>7} {'serial ms':>10} {'document ms':>12} {'speedup':>8}")
+    for sentences in SENTENCE_COUNTS:
+        document = make_document(sentences)
+        unique = len(set(segment_document(document).texts()))
+        serial_time = await measure(serial, service, document)
+        document_time = await measure(
+            lambda service, document: service.translate_document(document, "hi", use_cache=False),
+            service, document
+        )
+        print(f"{sentences:>9} {len(document):>7} {unique:>7} {serial_time * 1000:>10.0f} "
+              f"{document_time * 1000:>12.0f} {serial_time / document_time:>7.1f}x")
+    await service.close()
+
+
+def main():
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
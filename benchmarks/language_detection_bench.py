@@ -0,0 +1,107 @@
+"""
+Benchmark local source language detection: accuracy per language and cost per call.
+
+Every code in SUPPORTED_LANGUAGES has a handful of labelled sentences. A
+detection counts as "confident" when it clears the confidence the service
+needs before naming the source upstream; wrong confident detections are the
+ones that would send a provider the wrong ``src``.
+
+Run from the repository root:
+
+    python -m benchmarks.language_detection_bench
+"""
+import time
+
+from app.config import get_settings
+from app.core.models import SUPPORTED_LANGUAGES
+from app.utils.language_detection import detect_language
+
+ITERATIONS = 2_000
+
+SAMPLES = {
+    "en": ["How are you today?", "Thank you for your help with the order.",
+           "The weather is nice and we are going to the park.", "What is the status of my refund?"],
+    "hi": ["आप कैसे हैं?", "मैं आज बाजार जा रहा हूँ।", "यह किताब बहुत अच्छी है।", "क्या आप मेरी मदद कर सकते हैं?"],
+    "mr": ["तुम्ही कसे आहात?", "मी आज बाजारात जात आहे.", "हे पुस्तक खूप छान आहे.", "माझे नाव राहुल आहे आणि मी पुण्यात राहतो."],
+    "bn": ["আপনি কেমন আছেন?", "আমি আজ বাজারে যাচ্ছি।", "এই বইটি খুব ভালো।", "আমার নাম রাহুল এবং আমি কলকাতায় থাকি।"],
+    "as": ["আপুনি কেনে আছে?", "মই আজি বজাৰলৈ গৈ আছো।", "এই কিতাপখন বৰ ভাল।", "মোৰ নাম ৰাহুল আৰু মই গুৱাহাটীত থাকো।"],
+    "ta": ["நீங்கள் எப்படி இருக்கிறீர்கள்?", "நான் இன்று சந்தைக்குப் போகிறேன்.", "இந்த புத்தகம் மிகவும் நல்லது.",
+           "என் பெயர் ராகுல்."],
+    "te": ["మీరు ఎలా ఉన్నారు?", "నేను ఈ రోజు మార్కెట్‌కి వెళ్తున్నాను.", "ఈ పుస్తకం చాలా బాగుంది.", "నా పేరు రాహుల్."],
+    "kn": ["ನೀವು ಹೇಗಿದ್ದೀರಿ?", "ನಾನು ಇಂದು ಮಾರುಕಟ್ಟೆಗೆ ಹೋಗುತ್ತಿದ್ದೇನೆ.", "ಈ ಪುಸ್ತಕ ತುಂಬಾ ಚೆನ್ನಾಗಿದೆ.", "ನನ್ನ ಹೆಸರು ರಾಹುಲ್."],
+    "ml": ["സുഖമാണോ?", "ഞാൻ ഇന്ന് ചന്തയിലേക്ക് പോകുന്നു.", "ഈ പുസ്തകം വളരെ നല്ലതാണ്.", "എന്റെ പേര് രാഹുൽ."],
+    "gu": ["તમે કેમ છો?", "હું આજે બજારમાં જાઉં છું.", "આ પુસ્તક ખૂબ સરસ છે.", "મારું નામ રાહુલ છે."],
+    "pa": ["ਤੁਸੀਂ ਕਿਵੇਂ ਹੋ?", "ਮੈਂ ਅੱਜ ਬਾਜ਼ਾਰ ਜਾ ਰਿਹਾ ਹਾਂ।", "ਇਹ ਕਿਤਾਬ ਬਹੁਤ ਵਧੀਆ ਹੈ।", "ਮੇਰਾ ਨਾਮ ਰਾਹੁਲ ਹੈ।"],
+    "or": ["ଆପଣ କେମିତି ଅଛନ୍ତି?", "ମୁଁ ଆଜି ବଜାରକୁ ଯାଉଛି।", "ଏହି ବହିଟି ବହୁତ ଭଲ।", "ମୋ ନାମ ରାହୁଲ।"],
+    "fr": ["Comment allez-vous aujourd'hui ?", "Merci pour votre aide avec la commande.",
+           "Il fait beau et nous allons au parc.", "Quel est le statut de mon remboursement ?"],
+    "es": ["¿Cómo estás hoy?", "Gracias por tu ayuda con el pedido.",
+           "Hace buen tiempo y vamos al parque.", "¿Cuál es el estado de mi reembolso?"],
+    "de": ["Wie geht es Ihnen heute?", "Danke für Ihre Hilfe mit der Bestellung.",
+           "Das Wetter ist schön und wir gehen in den Park.", "Wie ist der Status meiner Rückerstattung?"],
+    "it": ["Come stai oggi?", "Grazie per il tuo aiuto con l'ordine.",
+           "Il tempo è bello e andiamo al parco.", "Qual è lo stato del mio rimborso?"],
+    "pt": ["Como você está hoje?", "Obrigado pela sua ajuda com o pedido.",
+           "O tempo está bom e vamos ao parque.", "Qual é o status do meu reembolso?"],
+    "ru": ["Как дела сегодня?", "Спасибо за помощь с заказом.", "Погода хорошая, и мы идём в парк.",
+           "Каков статус моего возврата?"],
+    "ja": ["今日はお元気ですか？", "注文のお手伝いをありがとうございます。", "天気が良いので公園に行きます。",
+           "返金の状況はどうですか？"],
+    "ko": ["오늘 어떻게 지내세요?", "주문을 도와주셔서 감사합니다.", "날씨가 좋아서 공원에 갑니다.", "환불 상태는 어떻습니까?"],
+    "zh": ["你今天好吗？", "谢谢你帮我处理订单。", "天气很好，我们去公园。", "我的退款状态是什么？"],
+    "ar": ["كيف حالك اليوم؟", "شكرا لمساعدتك في الطلب.", "الطقس جميل ونحن ذاهبون إلى الحديقة.", "ما هي حالة استرداد أموالي؟"],
+    "th": ["วันนี้คุณเป็นอย่างไรบ้าง", "ขอบคุณที่ช่วยเรื่องคำสั่งซื้อ", "อากาศดีและเรากำลังไปสวนสาธารณะ", "สถานะการคืนเงินของฉันเป็นอย่างไร"],
+    "vi": ["Hôm nay bạn có khỏe không?", "Cảm ơn bạn đã giúp đỡ với đơn hàng.",
+           "Thời tiết đẹp và chúng tôi đi công viên.", "Tình trạng hoàn tiền của tôi thế nào?"],
+}
+
+
+def main():
+    missing = set(SUPPORTED_LANGUAGES) - set(SAMPLES)
+    assert not missing, f"no samples for {sorted(missing)}"
+    min_confidence = get_settings().LANGUAGE_DETECTION_MIN_CONFIDENCE
+
+    print(f"{'lang':<5} {'correct':>8} {'confident':>10} {'wrong+conf':>11} {'us/call':>8}  misses")
+    totals = [0, 0, 0, 0]
+    all_texts = []
+    for language in sorted(SAMPLES):
+        texts = SAMPLES[language]
+        all_texts.extend(texts)
+        correct = confident = wrong_confident = 0
+        misses = []
+        for text in texts:
+            detection = detect_language(text)
+            is_confident = detection is not None and detection.confidence >= min_confidence
+            if detection is not None and detection.language == language:
+                correct += 1
+                confident += is_confident
+            else:
+                misses.append(detection.language if detection else None)
+                wrong_confident += is_confident
+        start = time.perf_counter()
+        for _ in range(ITERATIONS // len(texts)):
+            for text in texts:
+                detect_language(text)
+        per_call = (time.perf_counter() - start) / (ITERATIONS // len(texts) * len(texts)) * 1e6
+        totals = [totals[0] + correct, totals[1] + confident, totals[2] + wrong_confident, totals[3] + len(texts)]
+        print(f"{language:<5} {correct:>4}/{len(texts):<3} {confident:>10} {wrong_confident:>11} {per_call:>8.1f}  "
+              f"{' '.join(str(miss) for miss in misses)}")
+
+    correct, confident, wrong_confident, count = totals
+    start = time.perf_counter()
+    for _ in range(ITERATIONS // len(all_texts)):
+        for text in all_texts:
+            detect_language(text)
+    per_call = (time.perf_counter() - start) / (ITERATIONS // len(all_texts) * len(all_texts)) * 1e6
+    long_text = " ".join(SAMPLES["en"]) * 20
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        detect_language(long_text)
+    long_per_call = (time.perf_counter() - start) / ITERATIONS * 1e6
+    print(f"accuracy {correct / count:.1%} ({correct}/{count}), sent upstream {confident / count:.1%}, "
+          f"wrong and sent {wrong_confident}, {per_call:.1f} us/call, "
+          f"{long_per_call:.1f} us for a {len(long_text)}-char text")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Database size and insert throughput: inline text columns vs content-addressed texts.
+
+Generates a skewed workload where most log rows repeat a few thousand
+strings, writes it once into a table with inline text columns (the previous
+schema) and once through LoggingService, then compares file sizes and
+rows per second. Run from the repository root:
+
+    python -m benchmarks.log_dedup_bench [rows] [distinct_texts]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, Text, create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.services.logging_service import LoggingService
+
+BATCH_SIZE = 500
+REPEAT_SHARE = 0.9
+
+legacy_metadata = MetaData()
+legacy_logs = Table(
+    "translation_logs", legacy_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("translation_id", String(50), unique=True, index=True),
+    Column("original_text", Text, nullable=False),
+    Column("translated_text", Text, nullable=False),
+    Column("source_language", String(10), nullable=False),
+    Column("target_language", String(10), nullable=False),
+    Column("created_at", DateTime),
+    Column("user_agent", String(500)),
+    Column("ip_address", String(45)),
+    Index("idx_created_at", "created_at"),
+    Index("idx_target_language", "target_language"),
+    Index("idx_created_at_id", "created_at", "id"),
+    Index("idx_target_language_created_at_id", "target_language", "created_at", "id"),
+)
+
+
+def workload(rows: int, distinct: int) -> list:
+    """90% of rows repeat one of ``distinct`` strings (Zipf-like), 10% are unique"""
+    rng = random.Random(42)
+    words = ["hello", "thank", "you", "product", "order", "shipping", "account", "please", "welcome", "price"]
+    common = [" ".join(rng.choice(words) for _ in range(rng.randint(3, 40))) + f" #{i}" for i in range(distinct)]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    start = datetime(2024, 1, 1)
+
+    records = []
+    for i in range(rows):
+        if rng.random() < REPEAT_SHARE:
+            text = rng.choices(common, weights)[0]
+        else:
+            text = f"unique message {uuid.uuid4()} " + " ".join(rng.choice(words) for _ in range(10))
+        records.append({
+            "translation_id": str(uuid.uuid4()),
+            "original_text": text,
+            "translated_text": f"[HI] {text}",
+            "source_language": "en",
+            "target_language": "hi",
+            "created_at": start + timedelta(seconds=i),
+            "user_agent": "bench",
+            "ip_address": "127.0.0.1",
+        })
+    return records
+
+
+def run(path: str, records: list, legacy: bool) -> float:
+    """Insert ``records`` in batches; returns rows per second"""
+    engine = create_engine(f"sqlite:///{path}")
+    (legacy_metadata if legacy else Base.metadata).create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    service = LoggingService(session)
+
+    start = time.perf_counter()
+    for offset in range(0, len(records), BATCH_SIZE):
+        batch = records[offset:offset + BATCH_SIZE]
+        if legacy:
+            session.execute(insert(legacy_logs), batch)
+            session.commit()
+        else:
+            service.insert_log_records(batch)
+    elapsed = time.perf_counter() - start
+
+    session.close()
+    with engine.connect() as connection:
+        connection.exec_driver_sql("VACUUM")
+    engine.dispose()
+    return len(records) / elapsed
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 3_000
+    records = workload(rows, distinct)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, legacy in (("inline text", True), ("content-addressed", False)):
+            path = os.path.join(tmp, f"{'legacy' if legacy else 'dedup'}.db")
+            rate = run(path, records, legacy)
+            results[label] = (os.path.getsize(path) / 1024 / 1024, rate)
+
+    print(f"rows={rows} distinct={distinct} repeats={REPEAT_SHARE:.0%}")
+    for label, (size_mb, rate) in results.items():
+        print(f"{label:<18} {size_mb:>8.1f} MB {rate:>10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compare offset and cursor pagination of translation logs at deep pages.
+
+Seeds a temporary SQLite database, then times fetching the same deep page
+with ``offset`` and with the keyset ``cursor``. Run from the repository root:
+
+    python -m benchmarks.log_pagination_bench [rows] [page]
+"""
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.services.logging_service import LoggingService
+
+PAGE_SIZE = 50
+REPEATS = 20
+LANGUAGES = ["hi", "ta", "kn", "bn"]
+
+
+def seed(service: LoggingService, rows: int):
+    start = datetime(2024, 1, 1)
+    batch = []
+    for i in range(rows):
+        batch.append({
+            "translation_id": str(uuid.uuid4()),
+            "original_text": f"hello {i % 1000}",
+            "translated_text": f"नमस्ते {i % 1000}",
+            "source_language": "en",
+            "target_language": LANGUAGES[i % len(LANGUAGES)],
+            "created_at": start + timedelta(milliseconds=i * 10),
+            "user_agent": "bench",
+            "ip_address": "127.0.0.1",
+        })
+        if len(batch) == 10_000:
+            service.insert_log_records(batch)
+            batch = []
+    service.insert_log_records(batch)
+
+
+def timed(fn) -> float:
+    """Median milliseconds over REPEATS calls"""
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    page = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        service = LoggingService(session)
+        seed(service, rows)
+
+        # Walk cursors to find the one that starts the target page
+        cursor = None
+        for _ in range(page - 1):
+            logs = service.get_translation_logs(limit=PAGE_SIZE, cursor=cursor)
+            cursor = LoggingService.encode_cursor(logs[-1])
+
+        offset = (page - 1) * PAGE_SIZE
+        offset_ms = timed(lambda: service.get_translation_logs(limit=PAGE_SIZE, offset=offset))
+        cursor_ms = timed(lambda: service.get_translation_logs(limit=PAGE_SIZE, cursor=cursor))
+        assert [log.id for log in service.get_translation_logs(limit=PAGE_SIZE, offset=offset)] == \
+               [log.id for log in service.get_translation_logs(limit=PAGE_SIZE, cursor=cursor)]
+
+        print(f"rows={rows} page={page} page_size={PAGE_SIZE}")
+        print(f"{'offset':<8} {offset_ms:>8.2f} ms")
+        print(f"{'cursor':<8} {cursor_ms:>8.2f} ms")
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Insert latency into translation_logs over simulated time, with and without retention.
+
+Each simulated day inserts a fixed number of rows in write-behind sized
+batches. With retention on, rows older than the window are archived at the
+end of every day. Run from the repository root:
+
+    python -m benchmarks.log_retention_bench [days] [rows_per_day]
+"""
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.services.logging_service import LoggingService
+from app.services.retention import RetentionService
+
+BATCH_SIZE = 500
+RETENTION_DAYS = 7
+REPORT_EVERY = 10
+START = datetime(2024, 1, 1)
+
+
+def simulate(days: int, rows_per_day: int, retention: bool) -> list:
+    """Return mean batch insert latency (ms) for each simulated day"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        service = LoggingService(session)
+        retention_service = RetentionService(bind=engine, retention_days=RETENTION_DAYS,
+                                             granularity="day", batch_size=50_000)
+
+        per_day = []
+        for day in range(days):
+            day_start = START + timedelta(days=day)
+            step = timedelta(days=1) / rows_per_day
+            samples = []
+            for offset in range(0, rows_per_day, BATCH_SIZE):
+                batch = [{
+                    "translation_id": str(uuid.uuid4()),
+                    "original_text": f"hello {i % 500}",
+                    "translated_text": f"नमस्ते {i % 500}",
+                    "source_language": "en",
+                    "target_language": "hi",
+                    "created_at": day_start + step * i,
+                    "user_agent": "bench",
+                    "ip_address": "127.0.0.1",
+                } for i in range(offset, min(offset + BATCH_SIZE, rows_per_day))]
+                start = time.perf_counter()
+                service.insert_log_records(batch)
+                samples.append((time.perf_counter() - start) * 1000)
+            per_day.append(sum(samples) / len(samples))
+
+            if retention:
+                retention_service.archive_expired(now=day_start + timedelta(days=1))
+
+        session.close()
+        engine.dispose()
+        return per_day
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rows_per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+    without = simulate(days, rows_per_day, retention=False)
+    with_retention = simulate(days, rows_per_day, retention=True)
+
+    print(f"days={days} rows/day={rows_per_day} batch={BATCH_SIZE} retention={RETENTION_DAYS}d")
+    print(f"{'days':>9} {'no retention ms':>16} {'retention ms':>13}")
+    for start in range(0, days, REPORT_EVERY):
+        end = min(start + REPORT_EVERY, days)
+        mean = lambda values: sum(values[start:end]) / (end - start)
+        print(f"{start + 1:>4}-{end:<4} {mean(without):>16.2f} {mean(with_retention):>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
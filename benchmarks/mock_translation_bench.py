@@ -0,0 +1,55 @@
+"""
+Benchmark MockGoogleTranslate against lexicons of increasing size.
+
+Run from the repository root:
+
+    python -m benchmarks.mock_translation_bench
+"""
+import copy
+import time
+
+from app.mock_translation import MockGoogleTranslate, PhraseIndex, MOCK_LANGUAGES
+
+LEXICON_SIZES = [0, 1_000, 10_000, 100_000, 250_000]
+SENTENCES = [
+    "hello",
+    "good morning my friend",
+    "i am happy today and you are fine thank you",
+    " ".join(["how are you"] * 20),
+]
+ITERATIONS = 2_000
+
+
+def build_translator(extra_entries: int) -> MockGoogleTranslate:
+    """Return a translator whose lexicon is padded with synthetic phrases"""
+    translator = MockGoogleTranslate()
+    translations = copy.deepcopy(translator.translations)
+    for i in range(extra_entries):
+        phrase = f"word{i}" if i % 2 else f"synthetic phrase {i}"
+        translations["en"][phrase] = {lang: f"{lang}-{i}" for lang in MOCK_LANGUAGES}
+    translator.translations = translations
+    translator.index = PhraseIndex.from_translations(translations)
+    return translator
+
+
+def time_per_call(translator: MockGoogleTranslate, text: str) -> float:
+    """Mean microseconds per translate() call"""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        translator.translate(text, "hi")
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    header = f"{'entries':>10} {'build ms':>10} " + " ".join(f"{len(s.split()):>6}w us" for s in SENTENCES)
+    print(header)
+    for size in LEXICON_SIZES:
+        start = time.perf_counter()
+        translator = build_translator(size)
+        build_ms = (time.perf_counter() - start) * 1000
+        timings = [time_per_call(translator, text) for text in SENTENCES]
+        print(f"{size:>10} {build_ms:>10.1f} " + " ".join(f"{t:>9.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark micro-batching of single translate calls against direct provider calls.
+
+The fake upstream charges a fixed round-trip cost per call plus a small cost
+per text, like a remote API that accepts a list of texts.
+
+Run from the repository root:
+
+    python -m benchmarks.provider_batching_bench
+"""
+import asyncio
+import time
+
+from app.services.providers import MicroBatchingProvider, TranslationProvider
+
+REQUESTS = 2_000
+CONCURRENCY_LEVELS = (8, 200)
+CALL_OVERHEAD_SECONDS = 0.010
+PER_TEXT_SECONDS = 0.0002
+UPSTREAM_CONNECTIONS = 20
+
+
+class FakeUpstream(TranslationProvider):
+    """Upstream with a per-call round trip and a bounded connection pool"""
+    name = "fake"
+
+    def __init__(self):
+        self.connections = asyncio.Semaphore(UPSTREAM_CONNECTIONS)
+        self.calls = 0
+
+    async def translate(self, text, target_language, source_language=None):
+        return (await self.translate_batch([text], target_language, source_language))[0]
+
+    async def translate_batch(self, texts, target_language, source_language=None):
+        async with self.connections:
+            self.calls += 1
+            await asyncio.sleep(CALL_OVERHEAD_SECONDS + PER_TEXT_SECONDS * len(texts))
+            return [(f"[{target_language.upper()}] {text}", "en") for text in texts]
+
+
+async def run(provider, upstream, concurrency):
+    latencies = []
+    slots = asyncio.Semaphore(concurrency)
+    languages = ["hi", "ta", "kn", "bn"]
+
+    async def one(i):
+        async with slots:
+            start = time.perf_counter()
+            await provider.translate(f"text {i}", languages[i % len(languages)])
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    await provider.close()
+
+    latencies.sort()
+    return {
+        "throughput": REQUESTS / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "upstream_calls": upstream.calls,
+    }
+
+
+async def scenario(window_ms, concurrency):
+    upstream = FakeUpstream()
+    if window_ms is None:
+        return await run(upstream, upstream, concurrency)
+    provider = MicroBatchingProvider(upstream, window=window_ms / 1000, max_batch_size=50)
+    result = await run(provider, upstream, concurrency)
+    result["avg_batch"] = provider.stats()["avg_batch_size"]
+    return result
+
+
+def main():
+    print(f"{'clients':>7} {'mode':<18} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'calls':>7} {'avg batch':>10}")
+    for concurrency in CONCURRENCY_LEVELS:
+        for window_ms in (None, 1, 2, 5, 10):
+            result = asyncio.run(scenario(window_ms, concurrency))
+            label = "direct" if window_ms is None else f"batched {window_ms} ms"
+            print(f"{concurrency:>7} {label:<18} {result['throughput']:>9.0f} {result['p50_ms']:>8.1f} "
+                  f"{result['p99_ms']:>8.1f} {result['upstream_calls']:>7} {result.get('avg_batch', 1.0):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
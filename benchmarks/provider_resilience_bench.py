@@ -0,0 +1,106 @@
+"""
+Benchmark the provider resilience layer against a degrading fake upstream.
+
+Scenarios, each run against the bare FakeProvider and the same provider
+wrapped in a ResilientProvider:
+
+    slow tail   20 ms calls, 2% of them stall for 1 s
+    errors      20 ms calls, 10% of them fail
+    outage      the upstream answers after 500 ms with an error for the
+                middle second of the run, then recovers
+
+Each run sends RATE requests per second for DURATION_SECONDS (open loop,
+so a slow upstream cannot slow the arrivals down); "fallback" counts
+requests served dictionary translations while the circuit was open.
+
+Run from the repository root:
+
+    python -m benchmarks.provider_resilience_bench
+"""
+import asyncio
+import time
+
+from app.services.providers import FakeProvider, MockProvider
+from app.services.resilience import CircuitBreaker, ResilientProvider, RetryBudget
+
+DURATION_SECONDS = 3.0
+RATE = 1000  # requests per second
+
+
+def resilient(upstream):
+    return ResilientProvider(
+        upstream,
+        breaker=CircuitBreaker(failure_ratio=0.5, window=50, min_calls=20, slow_call=1.0,
+                               open_duration=0.5, half_open_calls=3, name=upstream.name),
+        budget=RetryBudget(ratio=0.1, reserve=10),
+        fallback=MockProvider(),
+        attempt_timeout=2.0,
+        max_retries=2,
+        retry_base_delay=0.01,
+        retry_max_delay=0.1,
+        hedge_percentile=95.0,
+        hedge_min_delay=0.005
+    )
+
+
+async def run(provider, upstream, outage: bool):
+    latencies = []
+    errors = 0
+    total = int(RATE * DURATION_SECONDS)
+
+    async def one(i):
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            await provider.translate(f"text {i}", "hi")
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - start)
+
+    tasks = []
+    start = time.perf_counter()
+    for i in range(total):
+        if outage and i == total // 3:
+            upstream.latency, upstream.failure_rate = 0.5, 1.0
+        elif outage and i == 2 * total // 3:
+            upstream.latency, upstream.failure_rate = 0.02, 0.0
+        delay = start + i / RATE - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(one(i)))
+    await asyncio.gather(*tasks)
+    await provider.close()
+
+    latencies.sort()
+    return {
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "errors": errors,
+        "upstream_calls": upstream.calls,
+        "stats": provider.stats() if isinstance(provider, ResilientProvider) else {},
+    }
+
+
+SCENARIOS = {
+    "slow tail": (dict(latency=0.02, jitter=0.005, slow_rate=0.02, slow_latency=1.0), False),
+    "errors": (dict(latency=0.02, jitter=0.005, failure_rate=0.1), False),
+    "outage": (dict(latency=0.02, jitter=0.005), True),
+}
+
+
+def main():
+    print(f"{'scenario':<10} {'mode':<10} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7} "
+          f"{'calls':>6} {'hedges':>7} {'retries':>8} {'fallback':>9}")
+    for name, (options, outage) in SCENARIOS.items():
+        for mode in ("direct", "resilient"):
+            upstream = FakeProvider(seed=42, **options)
+            provider = upstream if mode == "direct" else resilient(upstream)
+            result = asyncio.run(run(provider, upstream, outage))
+            stats = result["stats"]
+            print(f"{name:<10} {mode:<10} {result['p50_ms']:>8.1f} "
+                  f"{result['p99_ms']:>8.1f} {result['errors']:>7} {result['upstream_calls']:>6} "
+                  f"{stats.get('hedges', 0):>7} {stats.get('retries', 0):>8} {stats.get('fallbacks', 0):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark response serialization cost: FastAPI's response_model path against
+the FastJSONResponse path used by the translation routes.
+
+Run from the repository root:
+
+    python -m benchmarks.serialization_bench
+"""
+import asyncio
+import time
+import uuid
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.models import BulkTranslationResponse, TranslationResponse
+from app.utils.serialization import FastJSONResponse, orjson, project
+
+TARGET_SECONDS = 0.5
+
+
+def translation(i):
+    return {
+        "success": True,
+        "original_text": f"good morning, this is sentence number {i}",
+        "translated_text": f"सुप्रभात, यह वाक्य संख्या {i} है",
+        "source_language": "en",
+        "target_language": "hi",
+        "translation_id": str(uuid.uuid4()),
+        "timestamp": datetime.utcnow(),
+    }
+
+
+def bulk(size):
+    return {
+        "success": True,
+        "translations": [translation(i) for i in range(size)],
+        "total_translations": size,
+        "timestamp": datetime.utcnow(),
+    }
+
+
+def logs(size):
+    rows = []
+    for i in range(size):
+        row = translation(i)
+        rows.append({
+            "id": i,
+            "translation_id": row["translation_id"],
+            "original_text": row["original_text"],
+            "translated_text": row["translated_text"],
+            "source_language": "en",
+            "target_language": "hi",
+            "created_at": row["timestamp"],
+            "user_agent": "Mozilla/5.0",
+            "ip_address": "10.0.0.1",
+        })
+    return {"success": True, "logs": rows, "total_returned": size, "limit": size, "offset": 0,
+            "next_cursor": None, "timestamp": datetime.utcnow()}
+
+
+def fastapi_path(model, build_model):
+    """Route returns a model; FastAPI validates it against response_model and encodes it"""
+    field = create_model_field(name="response", type_=model, mode="serialization") if model else None
+
+    async def render(data):
+        content = await serialize_response(field=field, response_content=build_model(data), is_coroutine=True)
+        return JSONResponse(content).body
+    return render
+
+
+def measure(render, data):
+    async def run():
+        async def call():
+            body = render(data)
+            return await body if asyncio.iscoroutine(body) else body
+
+        size = len(await call())
+        iterations = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < TARGET_SECONDS:
+            await call()
+            iterations += 1
+        return (time.perf_counter() - start) / iterations * 1e6, size
+    return asyncio.run(run())
+
+
+def main():
+    cases = [
+        ("single", translation(0),
+         fastapi_path(TranslationResponse, lambda data: TranslationResponse(**data)),
+         lambda data: FastJSONResponse(project(TranslationResponse, data)).body),
+    ]
+    for size in (10, 100, 1000):
+        cases.append((
+            f"bulk x{size}", bulk(size),
+            fastapi_path(BulkTranslationResponse, lambda data: BulkTranslationResponse(**data)),
+            lambda data: FastJSONResponse({
+                **project(BulkTranslationResponse, data),
+                "translations": [project(TranslationResponse, item) for item in data["translations"]],
+            }).body,
+        ))
+    for size in (50, 100, 1000):
+        cases.append((
+            f"logs x{size}", logs(size),
+            fastapi_path(None, lambda data: data),
+            lambda data: FastJSONResponse(data).body,
+        ))
+
+    print(f"encoder: {'orjson' if orjson is not None else 'json (orjson not installed)'}")
+    print(f"{'response':<12} {'bytes':>9} {'fastapi us':>12} {'fast us':>10} {'speedup':>8}")
+    for name, data, slow, fast in cases:
+        slow_us, size = measure(slow, data)
+        fast_us, _ = measure(fast, data)
+        print(f"{name:<12} {size:>9} {slow_us:>12.1f} {fast_us:>10.1f} {slow_us / fast_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark per-request TranslationService construction against a shared instance.
+
+Run from the repository root:
+
+    python -m benchmarks.service_lifetime_bench
+"""
+import asyncio
+import time
+
+from googletrans import Translator
+
+from app.services.translation_service import TranslationService
+
+ITERATIONS = 5_000
+TRANSLATOR_ITERATIONS = 200
+
+
+async def per_request(texts):
+    for text in texts:
+        service = TranslationService()
+        await service.translate_text(text, "hi")
+        await service.close()
+
+
+async def shared(texts):
+    service = TranslationService()
+    for text in texts:
+        await service.translate_text(text, "hi")
+    await service.close()
+
+
+async def translator_construction():
+    """Cost of building (and tearing down) a googletrans client per request"""
+    for _ in range(TRANSLATOR_ITERATIONS):
+        translator = Translator()
+        client = translator.client
+        if hasattr(client, "aclose"):
+            await client.aclose()
+        else:
+            client.close()
+
+
+def measure(coro_factory, iterations):
+    start = time.perf_counter()
+    asyncio.run(coro_factory())
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    texts = ["hello", "good morning", "thank you"] * (ITERATIONS // 3)
+    per_request_us = measure(lambda: per_request(texts), len(texts))
+    shared_us = measure(lambda: shared(texts), len(texts))
+    translator_us = measure(translator_construction, TRANSLATOR_ITERATIONS)
+
+    print(f"{'mock, service per request':<36} {per_request_us:>10.1f} us/request")
+    print(f"{'mock, shared service':<36} {shared_us:>10.1f} us/request")
+    print(f"{'googletrans Translator() setup':<36} {translator_us:>10.1f} us/request")
+    print(f"{'overhead removed (live mode)':<36} {per_request_us - shared_us + translator_us:>10.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
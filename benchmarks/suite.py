@@ -0,0 +1,414 @@
+"""
+Component microbenchmarks for the translation and logging hot paths.
+
+Runs offline (mock translation, local SQLite), writes machine-readable
+results and compares them with a stored baseline. Run from the repository
+root:
+
+    python -m benchmarks.suite                      # compare with benchmarks/baseline.json
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --only logs --rows 100000
+    python -m benchmarks.suite --update-baseline    # after an intended change
+
+The read benchmarks use a seeded database of ``--rows`` log rows (1M by
+default), cached in the temp directory between runs. Timings are
+machine-dependent: regenerate the baseline on the machine that runs the
+comparison, and refresh it in any commit that intentionally moves a
+benchmark. Comparisons against a baseline recorded with a different
+``--rows`` are refused, since the read timings depend on it. Exits with
+status 1 when any benchmark's fastest round is slower than its baseline
+by more than ``--tolerance``; the 50% default absorbs run-to-run noise on
+shared machines, so tighten it on quiet ones.
+
+Benchmarks noisier than that carry their own tolerance: calls of a
+microsecond or two swing with timer and scheduler jitter, so they fail
+only at MICRO_TOLERANCE, and committed log writes are bound by the disk's
+fsync latency rather than this code, so they are reported but never fail
+the comparison.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.mock_translation import MockGoogleTranslate
+from app.services.logging_service import LoggingService
+from app.services.metrics import PROVIDER_REQUEST_DURATION, TRANSLATED_CHARACTERS
+from app.services.providers import MockProvider
+from app.services.translation_service import TranslationService
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+LANGUAGES = ["hi", "ta", "kn", "bn"]
+LONG_SENTENCE = " ".join(["good morning my friend how are you today thank you"] * 10)
+BULK_TEXTS = ["hello", "good morning", "thank you", "how are you", "goodbye",
+              "hello friend", "good morning sir", "thank you very much", "how are you today", "see you"]
+
+BENCHMARKS = {}
+TOLERANCES = {}
+
+# Per-benchmark tolerances, replacing --tolerance
+MICRO_TOLERANCE = 1.5
+NOT_GATED = math.inf
+
+
+def benchmark(name, tolerance=None):
+    """
+    Register ``fn(context) -> callable`` as a benchmark; the callable is
+    timed. ``tolerance`` overrides --tolerance for this benchmark.
+    """
+    def register(fn):
+        BENCHMARKS[name] = fn
+        if tolerance is not None:
+            TOLERANCES[name] = tolerance
+        return fn
+    return register
+
+
+# Mock translation
+
+@benchmark("mock.translate.word", tolerance=MICRO_TOLERANCE)
+def mock_word(context):
+    translator = MockGoogleTranslate()
+    return lambda: translator.translate("hello", "hi")
+
+
+@benchmark("mock.translate.phrase", tolerance=MICRO_TOLERANCE)
+def mock_phrase(context):
+    translator = MockGoogleTranslate()
+    return lambda: translator.translate("good morning", "ta")
+
+
+@benchmark("mock.translate.long_sentence")
+def mock_long_sentence(context):
+    translator = MockGoogleTranslate()
+    return lambda: translator.translate(LONG_SENTENCE, "kn")
+
+
+# Translation service
+
+@benchmark("service.translate_text.cache_hit")
+def service_cache_hit(context):
+    service = TranslationService(provider=MockProvider())
+
+    async def run():
+        await service.translate_text("good morning", "hi")
+    return run
+
+
+@benchmark("service.translate_text.cache_miss")
+def service_cache_miss(context):
+    service = TranslationService(provider=MockProvider())
+
+    async def run():
+        await service.translate_text("good morning", "hi", use_cache=False)
+    return run
+
+
+@benchmark("service.translate_bulk.10")
+def service_bulk(context):
+    service = TranslationService(provider=MockProvider())
+
+    async def run():
+        await service.translate_bulk(BULK_TEXTS, "bn", use_cache=False)
+    return run
+
+
+# Metrics recording
+
+@benchmark("metrics.histogram.observe", tolerance=MICRO_TOLERANCE)
+def metrics_histogram(context):
+    histogram = PROVIDER_REQUEST_DURATION.labels("bench", "hi")
+    return lambda: histogram.observe(0.0042)
+
+
+@benchmark("metrics.histogram.labels_observe", tolerance=MICRO_TOLERANCE)
+def metrics_labels_observe(context):
+    return lambda: PROVIDER_REQUEST_DURATION.labels("bench", "hi").observe(0.0042)
+
+
+@benchmark("metrics.counter.labels_inc", tolerance=MICRO_TOLERANCE)
+def metrics_counter(context):
+    return lambda: TRANSLATED_CHARACTERS.labels("hi").inc(12)
+
+
+# Log writes, each committed
+
+def _translation(i):
+    return {
+        "translation_id": str(uuid.uuid4()),
+        "original_text": f"hello {i % 1000}",
+        "translated_text": f"नमस्ते {i % 1000}",
+        "source_language": "en",
+        "target_language": LANGUAGES[i % len(LANGUAGES)],
+    }
+
+
+@benchmark("logs.log_translation", tolerance=NOT_GATED)
+def logs_single(context):
+    service = LoggingService(context.write_session())
+    counter = iter(range(sys.maxsize))
+    return lambda: service.log_translation(_translation(next(counter)), "bench", "127.0.0.1")
+
+
+@benchmark("logs.log_bulk_translations.10", tolerance=NOT_GATED)
+def logs_bulk(context):
+    service = LoggingService(context.write_session())
+    counter = iter(range(sys.maxsize))
+    return lambda: service.log_bulk_translations(
+        [_translation(next(counter)) for _ in range(10)], "bench", "127.0.0.1"
+    )
+
+
+# Log reads against the seeded database
+
+@benchmark("logs.get_translation_logs.first_page")
+def logs_first_page(context):
+    service = LoggingService(context.read_session())
+    return lambda: service.get_translation_logs(limit=50)
+
+
+@benchmark("logs.get_translation_logs.language_filter")
+def logs_language_filter(context):
+    service = LoggingService(context.read_session())
+    return lambda: service.get_translation_logs(limit=50, target_language="ta")
+
+
+@benchmark("logs.get_translation_logs.time_range")
+def logs_time_range(context):
+    service = LoggingService(context.read_session())
+    start = context.seed_start + timedelta(milliseconds=context.rows * 5)
+    return lambda: service.get_translation_logs(limit=50, start_time=start, end_time=start + timedelta(minutes=1))
+
+
+@benchmark("logs.get_translation_logs.offset_10000")
+def logs_deep_offset(context):
+    service = LoggingService(context.read_session())
+    return lambda: service.get_translation_logs(limit=50, offset=10_000)
+
+
+@benchmark("logs.get_translation_logs.cursor_10000")
+def logs_deep_cursor(context):
+    service = LoggingService(context.read_session())
+    anchor = service.get_translation_logs(limit=1, offset=9_999)[0]
+    cursor = LoggingService.encode_cursor(anchor)
+    return lambda: service.get_translation_logs(limit=50, cursor=cursor)
+
+
+class Context:
+    """Lazily created databases shared by the benchmarks"""
+    def __init__(self, rows: int, reseed: bool, tmp: str):
+        self.rows = rows
+        self.reseed = reseed
+        self.tmp = tmp
+        self.seed_start = datetime(2024, 1, 1)
+        self._read_session = None
+        self._engines = []
+
+    def _session(self, path: str):
+        engine = create_engine(f"sqlite:///{path}")
+        self._engines.append(engine)
+        Base.metadata.create_all(bind=engine)
+        return sessionmaker(bind=engine)()
+
+    def write_session(self):
+        """Session on a fresh empty database"""
+        return self._session(os.path.join(self.tmp, f"write_{len(self._engines)}.db"))
+
+    def read_session(self):
+        """Session on the database seeded with ``rows`` logs"""
+        if self._read_session is None:
+            path = os.path.join(tempfile.gettempdir(), f"translation_bench_{self.rows}.db")
+            if self.reseed and os.path.exists(path):
+                os.remove(path)
+            seeded = os.path.exists(path)
+            self._read_session = self._session(path)
+            if not seeded:
+                self._seed(path)
+        return self._read_session
+
+    def _seed(self, path: str):
+        print(f"seeding {self.rows} rows into {path} ...", file=sys.stderr)
+        service = LoggingService(self._read_session)
+        batch = []
+        try:
+            for i in range(self.rows):
+                batch.append({
+                    **_translation(i),
+                    "created_at": self.seed_start + timedelta(milliseconds=i * 10),
+                    "user_agent": "bench",
+                    "ip_address": "127.0.0.1",
+                })
+                if len(batch) == 10_000:
+                    service.insert_log_records(batch)
+                    batch = []
+            service.insert_log_records(batch)
+        except BaseException:
+            self._read_session.close()
+            os.remove(path)
+            raise
+
+    def close(self):
+        if self._read_session is not None:
+            self._read_session.close()
+        for engine in self._engines:
+            engine.dispose()
+
+
+def measure(fn, min_time: float, repeats: int) -> dict:
+    """
+    Time ``fn`` (sync or async) in ``repeats`` rounds of at least ``min_time``
+    seconds each; report the median and fastest time per call
+    """
+    is_async = asyncio.iscoroutinefunction(fn)
+
+    async def run_async(iterations):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await fn()
+        return time.perf_counter() - start
+
+    def run(iterations):
+        if is_async:
+            return loop.run_until_complete(run_async(iterations))
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return time.perf_counter() - start
+
+    loop = asyncio.new_event_loop()
+    try:
+        # Calibrate: grow the iteration count until one round takes min_time
+        iterations = 1
+        while run(iterations) < min_time / 10:
+            iterations *= 10
+        elapsed = run(iterations)
+        iterations = max(1, int(iterations * min_time / elapsed))
+
+        samples = [run(iterations) / iterations * 1e6 for _ in range(repeats)]
+    finally:
+        loop.close()
+
+    median = statistics.median(samples)
+    return {
+        "us_per_op": median,
+        "ops_per_sec": 1e6 / median,
+        "min_us": min(samples),
+        "max_us": max(samples),
+        "iterations": iterations,
+        "repeats": repeats,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Print current vs baseline timings; return the names that regressed
+
+    Compares the fastest round, which is far less sensitive to scheduler and
+    disk noise than the median.
+    """
+    regressions = []
+    print(f"{'benchmark':<44} {'min us/op':>10} {'baseline':>10} {'change':>8}")
+    for name, result in results.items():
+        current = result["min_us"]
+        previous = baseline.get(name, {}).get("min_us")
+        if previous is None:
+            print(f"{name:<44} {current:>10.2f} {'-':>10} {'new':>8}")
+            continue
+
+        change = current / previous - 1
+        allowed = TOLERANCES.get(name, tolerance)
+        flag = ""
+        if change > allowed:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        elif change > tolerance:
+            flag = "  (not gated)" if allowed == NOT_GATED else f"  (within {allowed:.0%})"
+        print(f"{name:<44} {current:>10.2f} {previous:>10.2f} {change:>+7.0%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", help="Run benchmarks whose name contains this text")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in the seeded read database")
+    parser.add_argument("--reseed", action="store_true", help="Rebuild the seeded read database")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per timing round")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing rounds per benchmark")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed slowdown before failing (0.5 = 50%%) for benchmarks without their own")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        baseline_rows = baseline["meta"].get("rows")
+        # A partial update would mix results seeded with different row counts
+        if baseline_rows != args.rows and (not args.update_baseline or args.only):
+            print(f"baseline was recorded with --rows {baseline_rows}, not {args.rows}; "
+                  f"rerun with --rows {baseline_rows} or rebuild the whole baseline")
+            return 2
+
+    names = [name for name in BENCHMARKS if not args.only or args.only in name]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        context = Context(args.rows, args.reseed, tmp)
+        try:
+            for name in names:
+                results[name] = measure(BENCHMARKS[name](context), args.min_time, args.repeats)
+                print(f"{name:<44} {results[name]['us_per_op']:>10.2f} us/op", file=sys.stderr)
+        finally:
+            context.close()
+
+    report = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rows": args.rows,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        if baseline is None or baseline["meta"].get("rows") != args.rows:
+            baseline = {"meta": report["meta"], "results": {}}
+        baseline["meta"] = report["meta"]
+        baseline["results"].update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline updated: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    regressions = compare(results, baseline["results"], args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed beyond their tolerance")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+Replay a JSONL request log against the service and report latency per endpoint.
+
+Each input line is one request, in any of these shapes:
+
+    {"method": "POST", "path": "/api/v1/translate", "body": {...}, "timestamp": ...}
+    {"text": "hello", "target_language": "hi", "timestamp": ...}
+    {"texts": ["hello", "goodbye"], "target_language": "ta"}
+    {"title": "...", "body": "..."}        # any record with a text field
+
+Records without an explicit path become translate requests: bulk when they
+carry ``texts``, single otherwise, with the text taken from ``--text-field``
+(default: the first of text/title/body present), truncated to the API limit,
+and a target language cycling through hi/ta/kn/bn when none is given.
+``timestamp`` may be ISO 8601 or epoch seconds and is only needed for
+``--mode original``.
+
+Targets:
+    --target fastapi        FastAPI app in-process over ASGI (default)
+    --target flask          Flask app in-process over WSGI (single translate only)
+    --url URL               either API on a running server, e.g. http://127.0.0.1:8000
+
+Modes:
+    --mode max              closed loop, --concurrency requests in flight (default)
+    --mode rate             open loop at --rate requests per second
+    --mode original         open loop, reproducing the log's inter-arrival gaps / --speed
+
+In the open-loop modes, latency is measured from each request's scheduled
+send time, so queueing behind a saturated service is counted rather than
+hidden. Run from the repository root, e.g.:
+
+    python -m benchmarks.traffic_replay requests.jsonl --mode rate --rate 200 --limit 5000
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+import httpx
+
+TEXT_FIELDS = ("text", "title", "body")
+DEFAULT_LANGUAGES = ["hi", "ta", "kn", "bn"]
+MAX_TEXT_LENGTH = 1000
+PERCENTILES = (50, 95, 99, 99.9)
+
+
+class ReplayRequest:
+    __slots__ = ("method", "path", "body", "timestamp")
+
+    def __init__(self, method: str, path: str, body: Optional[dict], timestamp: Optional[float]):
+        self.method = method
+        self.path = path
+        self.body = body
+        self.timestamp = timestamp
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def _timestamp(value) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def _text(record: dict, text_field: Optional[str]) -> Optional[str]:
+    fields = (text_field,) if text_field else TEXT_FIELDS
+    for field in fields:
+        value = record.get(field)
+        if isinstance(value, str) and value.strip():
+            return value.strip()[:MAX_TEXT_LENGTH]
+    return None
+
+
+def to_request(record: dict, index: int, api: str, text_field: Optional[str]) -> Optional[ReplayRequest]:
+    """Map a log record to a request for ``api``; None when it has no equivalent"""
+    timestamp = _timestamp(record.get("timestamp", record.get("ts")))
+    if "path" in record:
+        return ReplayRequest(record.get("method", "POST").upper(), record["path"],
+                             record.get("body", record.get("json")), timestamp)
+
+    language = record.get("target_language") or DEFAULT_LANGUAGES[index % len(DEFAULT_LANGUAGES)]
+    if "texts" in record:
+        if api == "flask":
+            return None
+        texts = [text.strip()[:MAX_TEXT_LENGTH] for text in record["texts"] if isinstance(text, str) and text.strip()]
+        return ReplayRequest("POST", "/api/v1/translate/bulk",
+                             {"texts": texts[:10], "target_language": language}, timestamp)
+
+    text = _text(record, text_field)
+    if text is None:
+        return None
+    path = "/translate" if api == "flask" else "/api/v1/translate"
+    return ReplayRequest("POST", path, {"text": text, "target_language": language}, timestamp)
+
+
+def load_requests(path: str, api: str, text_field: Optional[str]) -> List[ReplayRequest]:
+    requests = []
+    skipped = 0
+    with open(path, encoding="utf-8") as f:
+        for index, line in enumerate(f):
+            if not line.strip():
+                continue
+            request = to_request(json.loads(line), index, api, text_field)
+            if request is None:
+                skipped += 1
+            else:
+                requests.append(request)
+    if skipped:
+        print(f"skipped {skipped} records with no {api} equivalent", file=sys.stderr)
+    return requests
+
+
+def schedule(requests: List[ReplayRequest], mode: str, rate: float, speed: float,
+             limit: int) -> Iterator[tuple]:
+    """Yield ``(offset_seconds, request)``; offsets are None in closed-loop mode"""
+    source = itertools.islice(itertools.cycle(requests), limit)
+    if mode == "max":
+        for request in source:
+            yield None, request
+    elif mode == "rate":
+        for i, request in enumerate(source):
+            yield i / rate, request
+    else:
+        if any(request.timestamp is None for request in requests):
+            raise SystemExit("--mode original needs a timestamp on every record")
+        first = requests[0].timestamp
+        span = requests[-1].timestamp - first
+        gap = span / (len(requests) - 1) if len(requests) > 1 else 0.0
+        # Each pass through the log continues one average gap after the previous one
+        for i, request in enumerate(source):
+            cycle = i // len(requests)
+            yield (request.timestamp - first + cycle * (span + gap)) / speed, request
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = {}
+        self.statuses = {}
+        self.errors = {}
+
+    def record(self, endpoint: str, latency_ms: float, status):
+        self.latencies.setdefault(endpoint, []).append(latency_ms)
+        counts = self.statuses.setdefault(endpoint, {})
+        counts[status] = counts.get(status, 0) + 1
+        if not (isinstance(status, int) and 200 <= status < 300):
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def report(self, elapsed: float) -> dict:
+        endpoints = {}
+        for endpoint, values in self.latencies.items():
+            endpoints[endpoint] = _summary(values, self.errors.get(endpoint, 0), elapsed)
+            endpoints[endpoint]["statuses"] = {str(key): count for key, count in self.statuses[endpoint].items()}
+        everything = [value for values in self.latencies.values() for value in values]
+        return {
+            "elapsed_s": elapsed,
+            "overall": _summary(everything, sum(self.errors.values()), elapsed),
+            "endpoints": endpoints,
+        }
+
+
+def _summary(values: List[float], errors: int, elapsed: float) -> dict:
+    values = sorted(values)
+    count = len(values)
+
+    def percentile(pct):
+        # Nearest-rank percentile
+        return values[max(0, min(count - 1, int(-(-count * pct // 100)) - 1))] if values else 0.0
+
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": errors / count if count else 0.0,
+        "throughput_rps": count / elapsed if elapsed else 0.0,
+        "mean_ms": sum(values) / count if count else 0.0,
+        **{f"p{pct:g}_ms".replace(".", "_"): percentile(pct) for pct in PERCENTILES},
+        "max_ms": values[-1] if values else 0.0,
+    }
+
+
+async def _send(client, request: ReplayRequest, sync: bool):
+    if sync:
+        return await asyncio.to_thread(client.request, request.method, request.path, json=request.body)
+    return await client.request(request.method, request.path, json=request.body)
+
+
+async def replay(client, sync: bool, plan: Iterator[tuple], mode: str, concurrency: int,
+                 max_in_flight: int) -> dict:
+    recorder = Recorder()
+    loop = asyncio.get_running_loop()
+
+    async def issue(request: ReplayRequest, started: float):
+        try:
+            response = await _send(client, request, sync)
+            status = response.status_code
+        except Exception as e:
+            status = type(e).__name__
+        recorder.record(request.endpoint, (loop.time() - started) * 1000, status)
+
+    start = loop.time()
+    if mode == "max":
+        shared_plan = iter(plan)
+
+        async def worker():
+            for _, request in shared_plan:
+                await issue(request, loop.time())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    else:
+        in_flight = asyncio.Semaphore(max_in_flight)
+        tasks = set()
+
+        async def timed(request, scheduled):
+            try:
+                await issue(request, scheduled)
+            finally:
+                in_flight.release()
+
+        for offset, request in plan:
+            scheduled = start + offset
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await in_flight.acquire()
+            task = asyncio.create_task(timed(request, scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    return recorder.report(loop.time() - start)
+
+
+async def run(args) -> dict:
+    requests = load_requests(args.file, args.target, args.text_field)
+    if not requests:
+        raise SystemExit("no replayable requests in input")
+    plan = schedule(requests, args.mode, args.rate, args.speed, args.limit or len(requests))
+    run_replay = lambda client, sync: replay(client, sync, plan, args.mode, args.concurrency, args.max_in_flight)
+
+    if args.url:
+        limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+            return await run_replay(client, False)
+
+    if args.target == "flask":
+        from app import app as flask_app
+        with httpx.Client(transport=httpx.WSGITransport(app=flask_app), base_url="http://replay",
+                          timeout=args.timeout) as client:
+            return await run_replay(client, True)
+
+    from app.main import app
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=args.timeout) as client:
+            return await run_replay(client, False)
+
+
+def print_report(report: dict):
+    columns = ["requests", "errors", "throughput_rps", "p50_ms", "p95_ms", "p99_ms", "p99_9_ms", "max_ms"]
+    headers = ["reqs", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms", "p99.9 ms", "max ms"]
+    rows = [("overall", report["overall"])] + sorted(report["endpoints"].items())
+    width = max(len(name) for name, _ in rows)
+    print(f"{'endpoint':<{width}} " + " ".join(f"{header:>9}" for header in headers))
+    for name, summary in rows:
+        cells = [f"{summary[column]:>9.1f}" if isinstance(summary[column], float) else f"{summary[column]:>9}"
+                 for column in columns]
+        print(f"{name:<{width}} " + " ".join(cells))
+    for name, summary in sorted(report["endpoints"].items()):
+        if summary["errors"]:
+            print(f"{name}: error rate {summary['error_rate']:.2%}, statuses {summary['statuses']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("file", help="JSONL request log")
+    parser.add_argument("--target", choices=["fastapi", "flask"], default="fastapi", help="API to drive")
+    parser.add_argument("--url", help="Send to a running server instead of in-process")
+    parser.add_argument("--mode", choices=["max", "rate", "original"], default="max")
+    parser.add_argument("--concurrency", type=int, default=32, help="Workers in --mode max")
+    parser.add_argument("--rate", type=float, default=100.0, help="Requests per second in --mode rate")
+    parser.add_argument("--speed", type=float, default=1.0, help="Time compression in --mode original")
+    parser.add_argument("--limit", type=int, help="Requests to send, cycling the log (default: one pass)")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="Cap on outstanding open-loop requests")
+    parser.add_argument("--text-field", help="Record field holding the text")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
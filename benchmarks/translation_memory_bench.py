@@ -0,0 +1,113 @@
+"""
+Benchmark the fuzzy translation memory: index build rate, lookup latency and match rate.
+
+The memory is filled with synthetic past translations built from sentence
+templates with varying names and numbers, then queried with:
+
+    seen        texts stored verbatim
+    numbers     stored sentences with different numbers (served by rewriting them)
+    names       stored sentences with a different name (never served)
+    novel       sentences from templates never stored
+
+A served translation is counted as wrong unless it is exactly the
+translation of the query: a match from the same template but for another
+name is as wrong as one from another template.
+
+Run from the repository root:
+
+    python -m benchmarks.translation_memory_bench [--entries 100000]
+"""
+import argparse
+import random
+import re
+import time
+
+from app.services.translation_memory import TranslationMemory
+
+NAMES = ["Asha", "Ravi", "Meena", "Arjun", "Priya", "Kiran", "Deepa", "Vikram", "Lakshmi", "Rahul",
+         "Anita", "Suresh", "Kavya", "Manoj", "Divya", "Naveen"]
+CITIES = ["Bangalore", "Chennai", "Mumbai", "Delhi", "Kolkata", "Hyderabad", "Pune", "Mysore"]
+QUERIES_PER_KIND = 2_000
+
+
+def template(seed: int) -> str:
+    """A sentence pattern with {name}, {city} and {n} slots, distinct for each seed"""
+    words = random.Random(seed).sample([
+        "order", "ticket", "invoice", "parcel", "booking", "refund", "account", "request", "payment",
+        "delivery", "appointment", "subscription", "shipment", "claim", "complaint", "reservation",
+    ], 3)
+    reference = "".join(chr(ord("a") + int(digit)) for digit in str(seed))
+    return f"Dear {{name}}, your {words[0]} {{n}} for the {words[1]} in {{city}} is ready; see {words[2]} {reference}."
+
+
+def translate(text: str) -> str:
+    """Stand-in translation that carries the text's names and numbers"""
+    return f"(hi) {text}"
+
+
+def fill(pattern: str, rng: random.Random) -> str:
+    return pattern.format(name=rng.choice(NAMES), city=rng.choice(CITIES), n=rng.randint(100, 99999))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=100_000, help="Past translations to index")
+    parser.add_argument("--threshold", type=float, default=0.85)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    templates = [template(seed) for seed in range(args.entries // 4)]
+    stored = []
+    for i in range(args.entries):
+        pattern = templates[i % len(templates)]
+        text = fill(pattern, rng)
+        stored.append((pattern, text))
+
+    memory = TranslationMemory(threshold=args.threshold, max_entries=args.entries)
+    start = time.perf_counter()
+    memory.add_many([(text, "hi", translate(text), "en") for _, text in stored])
+    build = time.perf_counter() - start
+    print(f"indexed {len(memory)} texts in {build:.1f}s ({len(memory) / build:,.0f} texts/s)")
+
+    def renamed(text: str) -> str:
+        for name in NAMES:
+            if name in text:
+                return text.replace(name, rng.choice([other for other in NAMES if other != name]), 1)
+        return text
+
+    def renumbered(text: str) -> str:
+        return re.sub(r"\d+", lambda match: str(int(match.group()) + 1), text, count=1)
+
+    novel_templates = [template(seed) for seed in range(10**6, 10**6 + QUERIES_PER_KIND)]
+    samples = rng.sample(stored, QUERIES_PER_KIND)
+    kinds = {
+        "seen": [(pattern, text) for pattern, text in samples],
+        "numbers": [(pattern, renumbered(text)) for pattern, text in samples],
+        "names": [(pattern, renamed(text)) for pattern, text in samples],
+        "novel": [(None, fill(pattern, rng)) for pattern in novel_templates],
+    }
+
+    print(f"{'queries':<8} {'matched':>8} {'wrong':>6} {'p50 us':>8} {'p99 us':>8}")
+    for kind, queries in kinds.items():
+        latencies = []
+        matched = wrong = 0
+        for _, text in queries:
+            start = time.perf_counter()
+            match = memory.lookup(text, "hi")
+            latencies.append(time.perf_counter() - start)
+            if match is not None:
+                matched += 1
+                if match.translated_text != translate(text):
+                    wrong += 1
+        latencies.sort()
+        print(f"{kind:<8} {matched / len(queries):>8.1%} {wrong:>6} "
+              f"{latencies[len(latencies) // 2] * 1e6:>8.0f} {latencies[int(len(latencies) * 0.99)] * 1e6:>8.0f}")
+
+    stats = memory.stats()
+    print(f"overall match rate {stats['match_rate']:.1%}, avg lookup {stats['avg_lookup_us']:.0f} us, "
+          f"{stats['number_rewrites']} number rewrites, {stats['number_mismatches']} number mismatches, "
+          f"{stats['word_mismatches']} word mismatches")
+
+
+if __name__ == "__main__":
+    main()
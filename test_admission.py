@@ -0,0 +1,176 @@
+import asyncio
+import json
+
+import pytest
+
+from app.services.admission import (
+    REJECT_CLIENT_LIMIT, REJECT_QUEUE_FULL, REJECT_QUEUE_TIMEOUT, AdmissionController, AdmissionMiddleware,
+    AdmissionRejected
+)
+
+async def settle():
+    """Let every runnable task take its next step"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+def test_waiters_queue_in_order_and_take_over_released_slots():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, queue_size=2, queue_timeout=5)
+        await controller.acquire()
+        admitted = []
+
+        async def request(name):
+            await controller.acquire()
+            admitted.append(name)
+
+        waiters = [asyncio.create_task(request(name)) for name in ("first", "second")]
+        await settle()
+        assert controller.queued == 2 and admitted == []
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        assert rejected.value.reason == REJECT_QUEUE_FULL
+
+        controller.release()
+        await settle()
+        assert admitted == ["first"] and controller.active == 1
+        controller.release()
+        await asyncio.gather(*waiters)
+        assert admitted == ["first", "second"] and controller.active == 1
+        controller.release()
+        assert controller.active == 0 and controller.queued == 0
+
+    asyncio.run(scenario())
+
+def test_timed_out_waiter_leaves_the_queue():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, queue_size=4, queue_timeout=0.05)
+        await controller.acquire()
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        assert rejected.value.reason == REJECT_QUEUE_TIMEOUT
+        assert controller.queued == 0 and controller.rejected[REJECT_QUEUE_TIMEOUT] == 1
+
+        controller.release()
+        assert controller.active == 0
+
+    asyncio.run(scenario())
+
+def test_cancelled_waiters_never_lose_a_slot():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, queue_size=4, queue_timeout=5)
+        await controller.acquire()
+        gone = asyncio.create_task(controller.acquire())
+        abandoned = asyncio.create_task(controller.acquire())
+        patient = asyncio.create_task(controller.acquire())
+        await settle()
+
+        # A waiter cancelled before any hand-off just leaves the queue
+        gone.cancel()
+        await settle()
+        assert gone.cancelled() and controller.queued == 2
+
+        # One cancelled as the slot reaches it either keeps the slot (the
+        # cancellation is swallowed on older Pythons) or passes it on
+        controller.release()
+        abandoned.cancel()
+        await settle()
+        assert controller.active == 1
+        if not abandoned.cancelled():
+            controller.release()
+        await patient
+        assert controller.active == 1 and controller.queued == 0
+        controller.release()
+        assert controller.active == 0
+
+    asyncio.run(scenario())
+
+def test_per_client_limit_counts_running_and_queued_requests():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, queue_size=4, queue_timeout=5, per_client_limit=2)
+        await controller.acquire("10.0.0.1")
+        queued = asyncio.create_task(controller.acquire("10.0.0.1"))
+        await settle()
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("10.0.0.1")
+        assert rejected.value.reason == REJECT_CLIENT_LIMIT
+        other = asyncio.create_task(controller.acquire("10.0.0.2"))
+        await settle()
+        assert controller.queued == 2
+
+        controller.release("10.0.0.1")
+        await queued
+        controller.release("10.0.0.1")
+        await other
+        controller.release("10.0.0.2")
+        assert controller.active == 0
+        await controller.acquire("10.0.0.1")
+
+    asyncio.run(scenario())
+
+def test_zero_queue_size_and_timeout_disable_those_limits():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, queue_size=0, queue_timeout=0)
+        await controller.acquire()
+        waiters = [asyncio.create_task(controller.acquire()) for _ in range(50)]
+        await asyncio.sleep(0.05)
+        assert controller.queued == 50
+
+        for _ in waiters:
+            controller.release()
+        await asyncio.gather(*waiters)
+        assert controller.rejected == {REJECT_CLIENT_LIMIT: 0, REJECT_QUEUE_FULL: 0, REJECT_QUEUE_TIMEOUT: 0}
+
+    asyncio.run(scenario())
+
+async def call(middleware, path, client="10.0.0.1"):
+    """Run one HTTP request through the middleware; returns (status, headers, body)"""
+    scope = {"type": "http", "path": path, "headers": [], "client": (client, 50000)}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"]), messages[1]["body"]
+
+def test_middleware_sheds_translation_routes_only():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def app(scope, receive, send):
+            if scope["path"] == "/api/v1/translate":
+                await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"{}"})
+
+        controller = AdmissionController(max_concurrency=1, queue_size=1, queue_timeout=5, per_client_limit=2)
+        middleware = AdmissionMiddleware(app, controller, retry_after=2.5)
+        running = asyncio.create_task(call(middleware, "/api/v1/translate"))
+        queued = asyncio.create_task(call(middleware, "/api/v1/translate/bulk", client="10.0.0.2"))
+        await settle()
+
+        status, headers, body = await call(middleware, "/api/v1/translate/document", client="10.0.0.3")
+        assert status == 503 and headers[b"retry-after"] == b"3"
+        assert json.loads(body)["error_code"] == "OVERLOADED_QUEUE_FULL"
+
+        # The second request of a client at its limit is its own fault
+        controller.per_client_limit = 1
+        status, headers, body = await call(middleware, "/api/v1/translate/stream")
+        assert status == 429 and headers[b"retry-after"] == b"3"
+        assert json.loads(body)["error_code"] == "OVERLOADED_CLIENT_LIMIT"
+
+        # Read-only routes are not admitted at all
+        for path in ("/api/v1/translate/logs", "/api/v1/translate/logs/export", "/api/v1/translate/cache"):
+            assert (await call(middleware, path))[0] == 200
+
+        release.set()
+        assert (await running)[0] == 200 and (await queued)[0] == 200
+        assert controller.active == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,84 @@
+import asyncio
+
+from app.services.logging_service import LoggingService
+from app.services.providers import TranslationProvider
+from app.services.translation_service import TranslationService
+
+class CountingProvider(TranslationProvider):
+    """Simulates a slow upstream and counts how often it is called"""
+    name = "counting"
+    
+    def __init__(self, delay: float = 0.05, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+    
+    async def translate(self, text, target_language, source_language=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream unavailable")
+        return f"[{target_language.upper()}] {text}", 'en'
+
+def test_concurrent_identical_requests_call_provider_once():
+    requests = 50
+    provider = CountingProvider()
+    service = TranslationService(provider=provider, coalesce=True)
+    
+    async def scenario():
+        return await asyncio.gather(*(service.translate_text("hello world", 'hi') for _ in range(requests)))
+    
+    results = asyncio.run(scenario())
+    
+    assert provider.calls == 1
+    assert service.coalesced == requests - 1
+    assert {result['translated_text'] for result in results} == {"[HI] hello world"}
+    # Every caller still gets its own translation id, and so its own log row
+    assert len({result['translation_id'] for result in results}) == requests
+    records = [LoggingService.build_log_record(result) for result in results]
+    assert len({record['translation_id'] for record in records}) == requests
+
+def test_failures_are_shared_but_not_remembered():
+    provider = CountingProvider(fail=True)
+    service = TranslationService(provider=provider, coalesce=True)
+    
+    async def scenario():
+        return await asyncio.gather(
+            *(service.translate_text("hello", 'ta') for _ in range(10)), return_exceptions=True
+        )
+    
+    outcomes = asyncio.run(scenario())
+    assert provider.calls == 1
+    assert all(isinstance(outcome, Exception) for outcome in outcomes)
+    
+    # The next request after the failed flight retries upstream
+    provider.fail = False
+    result = asyncio.run(service.translate_text("hello", 'ta'))
+    assert result['translated_text'] == "[TA] hello"
+    assert provider.calls == 2
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    provider = CountingProvider(delay=0.1)
+    service = TranslationService(provider=provider, coalesce=True)
+    
+    async def scenario():
+        first = asyncio.create_task(service.translate_text("good morning", 'kn'))
+        await asyncio.sleep(0)
+        others = [asyncio.create_task(service.translate_text("good morning", 'kn')) for _ in range(5)]
+        await asyncio.sleep(0.02)
+        first.cancel()
+        return await asyncio.gather(*others)
+    
+    results = asyncio.run(scenario())
+    assert provider.calls == 1
+    assert all(result['translated_text'] == "[KN] good morning" for result in results)
+
+def test_bypass_cache_is_not_coalesced():
+    provider = CountingProvider()
+    service = TranslationService(provider=provider, coalesce=True)
+    
+    async def scenario():
+        await asyncio.gather(*(service.translate_text("hello", 'bn', use_cache=False) for _ in range(5)))
+    
+    asyncio.run(scenario())
+    assert provider.calls == 5
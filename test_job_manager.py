@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, TranslationLog
+from app.services.job_manager import JOB_CANCELLED, JOB_COMPLETED, JOB_RUNNING, JobManager
+from app.services.providers import MockProvider, TranslationProvider
+from app.services.translation_service import TranslationService
+
+class GatedProvider(TranslationProvider):
+    """Answers ``free_calls`` calls at once, then holds every call until ``gate`` is set"""
+    name = "gated"
+
+    def __init__(self, free_calls: int = 0):
+        self.free_calls = free_calls
+        self.gate = asyncio.Event()
+        self.calls = 0
+
+    async def translate(self, text, target_language, source_language=None):
+        self.calls += 1
+        if self.calls > self.free_calls:
+            await self.gate.wait()
+        return f"<{target_language}> {text}", 'en'
+
+def make_sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+async def wait_for_job(manager: JobManager, job_id: str, condition, timeout: float = 20.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = manager.get_job(job_id)
+        if condition(job):
+            return job
+        assert time.monotonic() < deadline, f"job stuck at {job}"
+        await asyncio.sleep(0.01)
+
+def test_unfinished_job_resumes_from_its_checkpoint_after_a_restart(tmp_path):
+    sessions = make_sessions(tmp_path)
+    texts = [f"text {i}" for i in range(6)]
+
+    async def scenario():
+        # First run: the first chunk is checkpointed, the second hangs until shutdown
+        provider = GatedProvider(free_calls=2)
+        service = TranslationService(provider=provider, coalesce=False)
+        manager = JobManager(service, session_factory=sessions, workers=1, chunk_size=2, process_workers=0)
+        job_id = (await manager.submit(texts, "hi"))['job_id']
+        job = await wait_for_job(manager, job_id, lambda job: job['completed_items'] == 2)
+        while provider.calls < 4:
+            await asyncio.sleep(0.01)
+        await manager.stop()
+        await service.close()
+        assert job['status'] == JOB_RUNNING
+
+        # Second run over the same database picks the job up where it stopped
+        provider = GatedProvider(free_calls=len(texts))
+        service = TranslationService(provider=provider, coalesce=False)
+        manager = JobManager(service, session_factory=sessions, workers=1, chunk_size=2, process_workers=0)
+        manager.start()
+        try:
+            job = await wait_for_job(manager, job_id, lambda job: job['status'] == JOB_COMPLETED)
+            return job, provider.calls, manager.get_results(job_id)
+        finally:
+            await manager.stop()
+            await service.close()
+
+    job, calls, results = asyncio.run(scenario())
+
+    assert job['completed_items'] == 6 and job['failed_items'] == 0
+    # Only the four unfinished items were translated again
+    assert calls == 4
+    assert [result['translated_text'] for result in results] == [f"<hi> {text}" for text in texts]
+    with sessions() as db:
+        assert db.execute(select(func.count()).select_from(TranslationLog)).scalar_one() == 6
+
+def test_cancelled_job_stops_at_the_chunk_boundary(tmp_path):
+    sessions = make_sessions(tmp_path)
+
+    async def scenario():
+        provider = GatedProvider()
+        service = TranslationService(provider=provider, coalesce=False)
+        manager = JobManager(service, session_factory=sessions, workers=1, chunk_size=2, process_workers=0)
+        try:
+            job_id = (await manager.submit(["one", "two", "three"], "hi"))['job_id']
+            while not provider.calls:
+                await asyncio.sleep(0.01)
+
+            assert manager.cancel(job_id)['status'] == JOB_CANCELLED
+            provider.gate.set()
+            # The worker drops the chunk in flight and moves on to the next job
+            other_id = (await manager.submit(["four"], "hi"))['job_id']
+            other = await wait_for_job(manager, other_id, lambda job: job['status'] == JOB_COMPLETED)
+            return manager.get_job(job_id), manager.get_results(job_id), other
+        finally:
+            await manager.stop()
+            await service.close()
+
+    job, results, other = asyncio.run(scenario())
+
+    assert job['status'] == JOB_CANCELLED and job['completed_items'] == 0
+    assert all(result['translated_text'] is None for result in results)
+    assert other['completed_items'] == 1
+
+def test_mock_jobs_run_in_freshly_started_worker_processes(tmp_path):
+    sessions = make_sessions(tmp_path)
+
+    async def scenario():
+        service = TranslationService(provider=MockProvider(), coalesce=False)
+        manager = JobManager(service, session_factory=sessions, workers=1, chunk_size=2, process_workers=1)
+        try:
+            job_id = (await manager.submit(["hello", "thank you", "goodbye"], "hi"))['job_id']
+            start_method = manager._process_pool._mp_context.get_start_method()
+            await wait_for_job(manager, job_id, lambda job: job['status'] == JOB_COMPLETED, timeout=60.0)
+            return start_method, manager.get_results(job_id)
+        finally:
+            await manager.stop()
+            await service.close()
+
+    start_method, results = asyncio.run(scenario())
+
+    assert start_method in ("forkserver", "spawn")
+    assert [result['translated_text'] for result in results] == ["नमस्ते", "धन्यवाद", "अलविदा"]
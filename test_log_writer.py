@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+import uuid
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, TranslationLog
+from app.services.log_writer import LogWriter
+from app.services.logging_service import LoggingService
+
+class FailingSessions:
+    """Session factory over a private in-memory database that fails its first ``failures`` calls"""
+    def __init__(self, failures: int = 0):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        self.sessions = sessionmaker(bind=engine)
+        self.failures = failures
+        self.calls = 0
+        self.blocked = threading.Event()
+        self.blocked.set()
+
+    def __call__(self):
+        self.calls += 1
+        self.blocked.wait()
+        if self.calls <= self.failures:
+            raise OperationalError("connect", {}, Exception("database is locked"))
+        return self.sessions()
+
+    def translation_ids(self) -> list:
+        with self.sessions() as db:
+            return list(db.execute(select(TranslationLog.translation_id).order_by(TranslationLog.id)).scalars())
+
+def record(translation_id: str = None, source_language: str = "en") -> dict:
+    return LoggingService.build_log_record({
+        'translation_id': translation_id or str(uuid.uuid4()),
+        'original_text': "hello",
+        'translated_text': "नमस्ते",
+        'source_language': source_language,
+        'target_language': "hi",
+    })
+
+def test_failed_flushes_are_retried_with_backoff():
+    sessions = FailingSessions(failures=2)
+    writer = LogWriter(session_factory=sessions, flush_interval=0.01, retry_delay=0.02)
+
+    async def scenario():
+        start = time.perf_counter()
+        await writer.submit_many([record() for _ in range(3)])
+        await writer.stop()
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(scenario())
+
+    # Waited 0.02s, then 0.04s, before the third attempt went through
+    assert elapsed >= 0.06
+    assert writer.retries == 2 and writer.written == 3 and writer.failed == 0
+    assert len(sessions.translation_ids()) == 3
+
+def test_unreachable_database_drops_the_batch_without_splitting_it():
+    sessions = FailingSessions(failures=1000)
+    writer = LogWriter(session_factory=sessions, flush_interval=0.01, max_retries=1, retry_delay=0.0)
+
+    async def scenario():
+        await writer.submit_many([record() for _ in range(8)])
+        await writer.stop()
+
+    asyncio.run(scenario())
+
+    assert sessions.calls == 2
+    assert writer.failed == 8 and writer.written == 0 and "database is locked" in writer.last_error
+
+def test_rows_the_database_rejects_are_dropped_alone():
+    sessions = FailingSessions()
+    writer = LogWriter(session_factory=sessions, flush_interval=0.01, max_retries=1, retry_delay=0.0)
+    records = [record(source_language=None if i in (2, 5) else "en") for i in range(8)]
+
+    async def scenario():
+        await writer.submit_many(records)
+        await writer.stop()
+
+    asyncio.run(scenario())
+
+    assert writer.written == 6 and writer.failed == 2
+    assert sessions.translation_ids() == [
+        row['translation_id'] for row in records if row['source_language'] is not None
+    ]
+
+def run_full_queue(policy: str) -> tuple:
+    """Hold the flusher inside its first write, overfill a queue of two, then drain"""
+    sessions = FailingSessions()
+    writer = LogWriter(session_factory=sessions, max_queue_size=2, flush_interval=0.0, full_policy=policy)
+    records = [record(f"row-{i}") for i in range(4)]
+
+    async def scenario():
+        sessions.blocked.clear()
+        await writer.submit(records[0])
+        while not sessions.calls:
+            await asyncio.sleep(0.001)
+        accepted = [await writer.submit(row) for row in records[1:]]
+        sessions.blocked.set()
+        await writer.stop()
+        return accepted
+
+    accepted = asyncio.run(scenario())
+    return accepted, writer, sessions.translation_ids()
+
+def test_drop_new_discards_incoming_rows():
+    accepted, writer, written = run_full_queue("drop_new")
+
+    assert accepted == [True, True, False]
+    assert writer.dropped == 1 and written == ["row-0", "row-1", "row-2"]
+
+def test_drop_oldest_discards_queued_rows():
+    accepted, writer, written = run_full_queue("drop_oldest")
+
+    assert accepted == [True, True, True]
+    assert writer.dropped == 1 and written == ["row-0", "row-2", "row-3"]
+
+def test_stop_drains_the_queue_without_waiting_for_the_interval():
+    sessions = FailingSessions()
+    writer = LogWriter(session_factory=sessions, batch_size=4, flush_interval=30.0)
+
+    async def scenario():
+        await writer.submit_many([record() for _ in range(10)])
+        start = time.perf_counter()
+        await writer.stop()
+        return time.perf_counter() - start, await writer.submit(record())
+
+    elapsed, accepted_after_stop = asyncio.run(scenario())
+
+    assert elapsed < 5
+    assert writer.written == 10 and len(sessions.translation_ids()) == 10
+    assert not accepted_after_stop and writer.dropped == 1
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+from app.mock_translation import MOCK_LANGUAGES, mock_translator
+from app.services.providers import MockProvider, ThreadPoolProvider, TranslationProvider
+from app.services.translation_service import TranslationService
+
+class SlowBlockingProvider(ThreadPoolProvider):
+    """Simulates an upstream client that blocks for a fixed time per call"""
+    name = "slow"
+    
+    def __init__(self, delay: float, max_workers: int):
+        super().__init__(max_workers=max_workers)
+        self.delay = delay
+    
+    def translate_sync(self, text, target_language, source_language=None):
+        time.sleep(self.delay)
+        return f"[{target_language.upper()}] {text}", 'en'
+
+async def run_load(service: TranslationService, requests: int) -> tuple:
+    """Fire concurrent translations while a heartbeat measures event loop lag"""
+    lags = []
+    done = asyncio.Event()
+    
+    async def heartbeat():
+        interval = 0.01
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+    
+    monitor = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        service.translate_text(f"text {i}", 'hi', use_cache=False) for i in range(requests)
+    ))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await monitor
+    return elapsed, max(lags)
+
+def test_slow_provider_does_not_block_event_loop():
+    delay, requests, workers = 0.2, 16, 8
+    service = TranslationService(provider=SlowBlockingProvider(delay=delay, max_workers=workers))
+    
+    async def scenario():
+        try:
+            return await run_load(service, requests)
+        finally:
+            await service.close()
+    
+    elapsed, max_lag = asyncio.run(scenario())
+    
+    # Serially this would take requests * delay (3.2s); the pool overlaps calls
+    assert elapsed < requests * delay / 2
+    # The heartbeat keeps ticking while upstream calls are in flight
+    assert max_lag < 0.1
+
+def test_mock_provider_matches_flask_mock():
+    provider = MockProvider()
+    texts = ["hello", "Good Morning", "how are you my friend", "I am happy today and you are fine thank you",
+             "  thank   you  ", "goodbye and good night"]
+    for target_language in MOCK_LANGUAGES:
+        for text in texts:
+            translated, source_language = provider.lookup(text, target_language)
+            assert translated == mock_translator.translate(text, target_language)
+            assert source_language == 'en'
+    
+    # Without any known phrase the provider echoes the text instead
+    assert provider.lookup("zebra crossing", "hi") == ("[HI] zebra crossing", 'en')
+
+class RecordingProvider(TranslationProvider):
+    """Echoes its input and records the source language it was given"""
+    name = "recording"
+    
+    def __init__(self, source_hints: bool):
+        self.source_hints = source_hints
+        self.sources = []
+    
+    async def translate(self, text, target_language, source_language=None):
+        self.sources.append(source_language)
+        return f"[{target_language.upper()}] {text}", 'en'
+
+def test_detected_source_is_reported_and_only_hinted_when_supported():
+    texts = {"नमस्ते आप कैसे हैं": 'hi', "今日はお元気ですか？": 'ja', "வணக்கம்": 'ta'}
+    
+    async def scenario(provider):
+        service = TranslationService(provider=provider, coalesce=False)
+        try:
+            return [await service.translate_text(text, 'kn', use_cache=False) for text in texts]
+        finally:
+            await service.close()
+    
+    for source_hints in (True, False):
+        provider = RecordingProvider(source_hints)
+        results = asyncio.run(scenario(provider))
+        assert [result['source_language'] for result in results] == list(texts.values())
+        assert provider.sources == (list(texts.values()) if source_hints else [None] * len(texts))
+    
+    results = asyncio.run(scenario(MockProvider()))
+    assert [result['source_language'] for result in results] == list(texts.values())
+    # Routed to the Hindi and Tamil phrases of the mock dictionaries
+    assert results[0]['translated_text'] == "ನಮಸ್ಕಾರ ನೀವು ಹೇಗಿದ್ದೀರಿ"
+    assert results[2]['translated_text'] == "ನಮಸ್ಕಾರ"
@@ -0,0 +1,155 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.core.exceptions import TranslationAPIException
+from app.services.metrics import PROVIDER_FALLBACK_RESPONSES, PROVIDER_REQUEST_DURATION
+from app.services.providers import FakeProvider, HTTPTranslationProvider, MicroBatchingProvider, MockProvider
+from app.services.resilience import (
+    CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, CircuitBreaker, ResilientProvider, RetryBudget
+)
+from app.services.translation_service import TranslationService
+
+def make_provider(fake, **options) -> ResilientProvider:
+    """ResilientProvider over ``fake`` with a small breaker and no backoff"""
+    options.setdefault("breaker", CircuitBreaker(failure_ratio=0.5, window=4, min_calls=4, open_duration=0.05,
+                                                 half_open_calls=2, name="fake"))
+    options.setdefault("retry_base_delay", 0.0)
+    options.setdefault("hedging", False)
+    return ResilientProvider(fake, **options)
+
+def test_breaker_opens_probes_and_closes():
+    async def scenario():
+        fake = FakeProvider(latency=0.0, failure_rate=1.0, seed=1)
+        provider = make_provider(fake, max_retries=0)
+        breaker = provider.breaker
+
+        for _ in range(4):
+            with pytest.raises(TranslationAPIException):
+                await provider.translate("hello", "hi")
+        assert breaker.state == CIRCUIT_OPEN
+
+        # Open: rejected without calling upstream
+        with pytest.raises(TranslationAPIException) as rejected:
+            await provider.translate("hello", "hi")
+        assert rejected.value.error_code == "PROVIDER_UNAVAILABLE" and fake.calls == 4
+
+        # Half open: a failed probe reopens the circuit
+        await asyncio.sleep(0.06)
+        with pytest.raises(TranslationAPIException):
+            await provider.translate("hello", "hi")
+        assert breaker.state == CIRCUIT_OPEN and fake.calls == 5
+
+        # Half open again: enough successful probes close it
+        await asyncio.sleep(0.06)
+        fake.failure_rate = 0.0
+        assert await provider.translate("hello", "hi") == ("नमस्ते", 'en')
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        await provider.translate("hello", "hi")
+        assert breaker.state == CIRCUIT_CLOSED and breaker.opened == 2
+
+    asyncio.run(scenario())
+
+def test_losing_hedge_is_cancelled():
+    async def scenario():
+        fake = FakeProvider(latency=0.005, slow_latency=1.0, seed=1)
+        provider = make_provider(fake, hedging=True, hedge_min_delay=0.01)
+        for _ in range(32):
+            await provider.translate("hello", "hi")
+
+        # Only the primary is slow; the hedge sent after ~10ms answers first
+        fake.slow_rate = 1.0
+        call = asyncio.create_task(provider.translate("hello", "hi"))
+        await asyncio.sleep(0.005)
+        fake.slow_rate = 0.0
+        start = time.perf_counter()
+        assert await call == ("नमस्ते", 'en')
+
+        assert time.perf_counter() - start < 0.5
+        assert provider.hedges == 1 and provider.hedge_wins == 1
+        # The slow primary was cancelled, not left running upstream
+        await asyncio.sleep(0.01)
+        assert [task for task in asyncio.all_tasks() if task is not asyncio.current_task()] == []
+
+    asyncio.run(scenario())
+
+def test_retries_stop_when_the_budget_is_exhausted():
+    async def scenario():
+        fake = FakeProvider(latency=0.0, failure_rate=1.0, seed=1)
+        provider = make_provider(fake, max_retries=3, budget=RetryBudget(ratio=0.0, reserve=1),
+                                 breaker=CircuitBreaker(min_calls=100, name="fake"))
+
+        with pytest.raises(TranslationAPIException) as failed:
+            await provider.translate("hello", "hi")
+        assert failed.value.error_code == "FAKE_API_ERROR"
+        # One retry paid from the reserve, then the budget runs dry
+        assert fake.calls == 2 and provider.retries == 1 and provider.budget.exhausted == 1
+
+    asyncio.run(scenario())
+
+def test_only_transient_http_errors_are_retried():
+    async def scenario(status):
+        requests = []
+
+        def respond(request):
+            requests.append(request)
+            return httpx.Response(status, json={"error": "nope"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        provider = make_provider(HTTPTranslationProvider("http://upstream/translate", client=client),
+                                 max_retries=2)
+        try:
+            with pytest.raises(TranslationAPIException):
+                await provider.translate("hello", "hi")
+        finally:
+            await provider.close()
+        return len(requests), provider.breaker.stats()['recent_failures']
+
+    # A bad request fails the same way every time, and the upstream is healthy
+    assert asyncio.run(scenario(400)) == (1, 0)
+    assert asyncio.run(scenario(503)) == (3, 3)
+    assert asyncio.run(scenario(429)) == (3, 3)
+
+def test_open_circuit_serves_uncached_fallback():
+    async def scenario():
+        fake = FakeProvider(latency=0.0, seed=1)
+        provider = make_provider(fake, fallback=MockProvider())
+        provider.breaker._transition(CIRCUIT_OPEN)
+
+        result = await provider.translate("hello", "hi")
+        assert result == ("नमस्ते", 'en') and result.degraded
+        batch = await provider.translate_batch(["hello", "goodbye"], "hi")
+        assert all(outcome.degraded for outcome in batch)
+        assert fake.calls == 0 and provider.fallbacks == 3
+
+        service = TranslationService(provider=provider, coalesce=False)
+        try:
+            translated = await service.translate_text("thank you", "hi")
+            assert translated['translated_text'] == "धन्यवाद"
+            assert service.cache is None or len(service.cache) == 0
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
+
+def test_provider_metrics_name_the_backend_and_count_fallbacks_apart():
+    async def scenario():
+        fake = FakeProvider(latency=0.0, seed=1)
+        provider = make_provider(fake, fallback=MockProvider())
+        service = TranslationService(provider=MicroBatchingProvider(provider), coalesce=False)
+        durations = PROVIDER_REQUEST_DURATION.labels("fake", "ta")
+        fallbacks = PROVIDER_FALLBACK_RESPONSES.labels("fake", "ta")
+        calls, served = sum(durations.counts), fallbacks.value
+        try:
+            await service.translate_text("hello", "ta", use_cache=False)
+            assert sum(durations.counts) == calls + 1 and fallbacks.value == served
+
+            provider.breaker._transition(CIRCUIT_OPEN)
+            await service.translate_text("hello", "ta", use_cache=False)
+            assert sum(durations.counts) == calls + 1 and fallbacks.value == served + 1
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
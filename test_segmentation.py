@@ -0,0 +1,14 @@
+from app.utils.segmentation import segment_document
+
+def test_small_limit_never_yields_blank_segments():
+    text = "Hello world, this is   a sentence with     many spaces and ... !!! words.\n\nShort one."
+
+    for limit in range(1, 12):
+        document = segment_document(text, max_segment_length=limit)
+        segments = document.texts()
+
+        assert "".join(document.parts) == text
+        assert all(segment.strip() == segment for segment in segments)
+        assert all(any(char.isalpha() for char in segment) for segment in segments)
+        assert all(len(segment) <= limit for segment in segments)
+        assert document.join(segments) == text
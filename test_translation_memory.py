@@ -0,0 +1,31 @@
+from app.services.translation_memory import TranslationMemory
+
+STORED = "Dear Ravi, your order 123 for the refund in Chennai is ready"
+TRANSLATED = "प्रिय रवि, चेन्नई में रिफंड के लिए आपका ऑर्डर 123 तैयार है"
+
+def make_memory() -> TranslationMemory:
+    memory = TranslationMemory()
+    memory.add(STORED, "hi", TRANSLATED, "en")
+    return memory
+
+def test_only_number_differences_are_served():
+    memory = make_memory()
+
+    match = memory.lookup("dear ravi, your order 456 for the refund in chennai is ready!", "hi")
+
+    assert match is not None
+    assert match.translated_text == TRANSLATED.replace("123", "456")
+
+def test_other_word_differences_are_misses():
+    memory = make_memory()
+
+    assert memory.lookup("Dear Rahul, your order 123 for the refund in Chennai is ready", "hi") is None
+    assert memory.lookup("Dear Ravi, your order 123 for the refund in Chennai is not ready", "hi") is None
+    assert memory.stats()['word_mismatches'] == 2
+
+def test_placeholders_are_not_stored():
+    memory = TranslationMemory()
+    memory.add("Good evening everyone", "hi", "[HI] Good evening everyone", "en")
+
+    assert len(memory) == 0
+    assert memory.lookup("Good evening everyone", "hi") is None